@@ -0,0 +1,525 @@
+"""
+Export benchmark suite with regression budgets.
+Run: python docs/exports/benchmarks/bench_exports.py [--repeat N] [--update] [case ...]
+
+Times every generator end to end plus micro-benchmarks of the hot helpers
+(add_table_from_data, add_table_from_rows, add_bullet_list, the pptx
+add_text_box, chart rendering), recording
+wall time (best of --repeat), peak RSS and the size of the saved artifact.
+Each case runs in a fresh interpreter so imports, caches and peak memory
+do not leak between cases; import time is excluded from the timings.
+
+Start-up is tracked separately: "startup-*" cases time whole CLI
+invocations (--help, --list, --dry-run) and "import-*" cases take a
+module's cumulative import time from `python -X importtime`.
+
+Results are compared against budgets.json. A metric above its budget by
+more than the file's relative tolerance plus its absolute slack is a
+regression and the exit status is 1.
+--update rewrites the budgets for the cases that ran (do this on the
+reference machine after an intentional change; time budgets are only
+meaningful on comparable hardware).
+"""
+
+import argparse
+import contextlib
+import gc
+import importlib.util
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+EXPORTS_DIR = os.path.abspath(os.path.join(BENCH_DIR, ".."))
+PROJECT_ROOT = os.path.abspath(os.path.join(EXPORTS_DIR, "..", ".."))
+BRAND_PPTX_SCRIPT = os.path.join(PROJECT_ROOT, "scripts", "generate-brand-pptx.py")
+BUDGETS = os.path.join(BENCH_DIR, "budgets.json")
+METRICS = ("seconds", "peak_mb", "bytes")
+DEFAULT_TOLERANCE = {"seconds": 0.5, "peak_mb": 0.2, "bytes": 0.05}
+# Absolute headroom on top of the relative tolerance, so timer noise on
+# millisecond cases and allocator noise do not fail the suite
+DEFAULT_SLACK = {"seconds": 0.1, "peak_mb": 5.0, "bytes": 0}
+# Start-up cases are tens of milliseconds; a case entry in budgets.json may
+# carry its own "slack" (and "tolerance") overriding the file-wide ones
+STARTUP_SLACK = {"seconds": 0.02}
+
+sys.path.insert(0, EXPORTS_DIR)
+
+try:
+    import resource
+except ImportError:  # Windows: peak memory is not recorded
+    resource = None
+
+
+# ============================================================
+# CASES
+# ============================================================
+# Each case takes a scratch directory, builds one artifact there and
+# returns its path. Module imports happen inside the case's setup
+# function so only the child process that runs it pays for them.
+
+def _pptx_module():
+    spec = importlib.util.spec_from_file_location("generate_brand_pptx", BRAND_PPTX_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _use_scratch_caches():
+    """Point the content and fragment caches at a fresh scratch directory.
+
+    Benchmarks render with force=True and record builds; against the repo's
+    caches that would overwrite the developer's fragments and make
+    doc_content --changed report the real documents as up to date.
+    """
+    import doc_content
+    import fragment_cache
+    cache_dir = tempfile.mkdtemp()
+    doc_content.CONTENT_CACHE_DIR = os.path.join(cache_dir, "content")
+    fragment_cache.FRAGMENT_DIR = os.path.join(cache_dir, "fragments")
+
+
+def setup_content(name, warm=False):
+    """A content-driven document; every section is re-rendered unless warm."""
+    import doc_content
+    _use_scratch_caches()
+    doc_content.load(name)  # compile outside the timed runs
+    if warm:
+        with tempfile.TemporaryDirectory() as tmp:
+            doc_content.build_document(name, os.path.join(tmp, "warm.docx"))
+
+    def run(out_dir):
+        path = os.path.join(out_dir, f"{name}.docx")
+        return doc_content.build_document(name, path, force=not warm)[0]
+    return run
+
+
+def setup_generator(name):
+    if name in ("docs-book", "resort-catalog"):
+        _use_scratch_caches()
+    if name == "docs-book":
+        import export_docs_book
+
+        def run(out_dir):
+            path = os.path.join(out_dir, "docs-book.docx")
+            return export_docs_book.export_docs_book(output_path=path, force=True)[0]
+    elif name == "resort-catalog":
+        import generate_resort_catalog
+
+        def run(out_dir):
+            path = os.path.join(out_dir, "resort-catalog.docx")
+            return generate_resort_catalog.generate_resort_catalog(output_path=path, force=True)[0]
+    elif name == "resort-decks":
+        import generate_resort_decks
+
+        def run(out_dir):
+            paths = generate_resort_decks.generate_resort_decks(out_dir=out_dir)
+            return paths[-1]
+    elif name == "brand-pptx":
+        pptx = _pptx_module()
+
+        def run(out_dir):
+            path = os.path.join(out_dir, "brand.pptx")
+            pptx.build_template().save(path)
+            return path
+    return run
+
+
+def setup_table(n_rows):
+    from brand_docx import new_branded_doc, add_table_from_data
+    headers = ["Capability", "Description", "Status"]
+    rows = [[f"Row {i}", f"Description for row {i}", "BUILT"] for i in range(n_rows)]
+
+    def run(out_dir):
+        doc = new_branded_doc(doc_title="Benchmark")
+        add_table_from_data(doc, headers, rows)
+        path = os.path.join(out_dir, f"table-{n_rows}.docx")
+        doc.save(path)
+        return path
+    return run
+
+
+def setup_table_rows(n_rows, backend):
+    """add_table_from_rows fed by a generator, as from a DB cursor."""
+    from brand_docx import new_branded_doc, add_table_from_rows
+    headers = ["Listing", "Resort", "Check-in", "Nights", "Nightly rate", "Status"]
+
+    def rows():
+        for i in range(n_rows):
+            yield (f"L-{i:06d}", f"Resort {i % 117}", f"2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+                   i % 14 + 1, f"${150 + i % 300}", "BOOKED" if i % 3 else "OPEN")
+
+    def run(out_dir):
+        doc = new_branded_doc(doc_title="Benchmark", backend=backend)
+        add_table_from_rows(doc, headers, rows())
+        path = os.path.join(out_dir, f"table-rows-{n_rows}-{backend}.docx")
+        doc.save(path)
+        return path
+    return run
+
+
+def setup_bullet_list(n_items):
+    from brand_docx import new_branded_doc, add_bullet_list
+    items = [f"Feature {i}: description of feature {i}" if i % 2 else f"Plain bullet {i}"
+             for i in range(n_items)]
+
+    def run(out_dir):
+        doc = new_branded_doc(doc_title="Benchmark")
+        add_bullet_list(doc, items)
+        path = os.path.join(out_dir, f"bullets-{n_items}.docx")
+        doc.save(path)
+        return path
+    return run
+
+
+def setup_mail_merge(n_records):
+    """One payout statement per synthetic owner record, in-process."""
+    import mail_merge
+    template = mail_merge.prepare_template("owner-payout-statement")
+
+    def records():
+        for i in range(n_records):
+            record = dict.fromkeys(template.fields, "—")
+            record.update(owner_id=f"OWN-{i:06d}", owner_name=f"Owner {i}", period_id="2026-09")
+            yield record
+
+    def run(out_dir):
+        mail_merge.merge(template, records(), out_dir, jobs=1)
+        return os.path.join(out_dir, f"OWN-{n_records - 1:06d}-Payout-Statement-2026-09.docx")
+    return run
+
+
+def setup_deck(n_slides, clone=False):
+    """A long deck cycling through the content slide factories.
+
+    With clone the slides are copied from the brand template's prototypes
+    (loaded here, once) instead of drawn.
+    """
+    import brand_pptx
+    template = brand_pptx.load_template() if clone else None
+    kinds = [
+        {"type": "section", "title": "Section", "text": "Overview of the section."},
+        {"type": "bullets", "title": "Bullets", "items": ["First point", "Second point", "Third point"]},
+        {"type": "stats", "title": "Stats", "stats": [["117", "Resorts"], ["351", "Unit Types"]]},
+        {"type": "feature", "title": "Feature", "text": "Feature copy.", "cta": "Learn More"},
+    ]
+    spec = {"slides": [dict(kinds[i % len(kinds)]) for i in range(n_slides)]}
+
+    def run(out_dir):
+        path = os.path.join(out_dir, f"deck-{n_slides}{'-clone' if clone else ''}.pptx")
+        return brand_pptx.save_deck(spec, path, template)
+    return run
+
+
+def _bench_charts(n_charts):
+    kinds = ("column", "bar", "line", "pie")
+    return [{"kind": kinds[i % len(kinds)], "title": f"Chart {i}",
+             "categories": ["North", "South", "East", "West"],
+             "series": [["Bookings", [i + 10, i * 2 + 5, 30 - i % 30, i % 7 + 1]]]}
+            for i in range(n_charts)]
+
+
+def setup_chart_images(n_charts):
+    """Render distinct chart PNGs into an empty chart cache as one batch."""
+    import charts
+    chart_list = _bench_charts(n_charts)
+
+    def run(out_dir):
+        charts.CHART_CACHE_DIR = tempfile.mkdtemp(dir=out_dir)
+        return charts.render_images(chart_list, jobs=os.cpu_count() or 1)[-1]
+    return run
+
+
+def setup_chart_deck(n_slides, cached=False):
+    """A deck of native chart slides; with cached the chart parts come from a warm cache."""
+    import brand_pptx
+    import charts
+    cache_dir = tempfile.mkdtemp()
+    spec = {"slides": [{"type": "chart", "title": c["title"], "kind": c["kind"],
+                        "categories": c["categories"], "series": c["series"]}
+                       for c in _bench_charts(n_slides)]}
+    if cached:
+        charts.CHART_CACHE_DIR = cache_dir
+        brand_pptx.build_deck(spec)
+
+    def run(out_dir):
+        charts.CHART_CACHE_DIR = cache_dir if cached else tempfile.mkdtemp(dir=out_dir)
+        path = os.path.join(out_dir, f"chart-deck-{n_slides}.pptx")
+        return brand_pptx.save_deck(spec, path)
+    return run
+
+
+def setup_text_boxes(n_shapes, fit=False):
+    import brand_pptx as pptx
+    from pptx.util import Inches
+
+    def run(out_dir):
+        prs = pptx.new_presentation()
+        slide = pptx.add_blank_slide(prs)
+        for i in range(n_shapes):
+            pptx.add_text_box(slide, Inches(0.5 + (i % 10)), Inches(0.5 + (i // 10) % 6),
+                              Inches(1), Inches(0.5), f"Box {i}", font_size=12, fit=fit)
+        path = os.path.join(out_dir, f"text-boxes-{n_shapes}{'-fit' if fit else ''}.pptx")
+        prs.save(path)
+        return path
+    return run
+
+
+def setup_text_fit(n_texts):
+    """Fit n distinct long titles into a title box, with the memo cleared each run."""
+    import text_fit
+    from pptx.util import Inches
+    words = "Quarterly Owner Revenue Occupancy Review Resort Portfolio Summary Forecast".split()
+    texts = [" ".join(words[(i + k) % len(words)] for k in range(4 + i % 9)) + f" {i}" for i in range(n_texts)]
+
+    def run(out_dir):
+        text_fit.fit_font_size.cache_clear()
+        sizes = [text_fit.fit_font_size(t, Inches(10), Inches(0.8), bold=True, max_size=32) for t in texts]
+        path = os.path.join(out_dir, f"text-fit-{n_texts}.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(map(str, sizes)))
+        return path
+    return run
+
+
+# name -> zero-argument setup returning run(out_dir)
+CASES = {
+    "roadmap": lambda: setup_content("roadmap"),
+    "status-report": lambda: setup_content("status-report"),
+    "status-report-incremental": lambda: setup_content("status-report", warm=True),
+    "platform-overview": lambda: setup_content("platform-overview"),
+    "tech-inventory": lambda: setup_content("tech-inventory"),
+    "docs-book": lambda: setup_generator("docs-book"),
+    "resort-catalog": lambda: setup_generator("resort-catalog"),
+    "brand-pptx": lambda: setup_generator("brand-pptx"),
+    "resort-decks": lambda: setup_generator("resort-decks"),
+    "table-10": lambda: setup_table(10),
+    "table-1k": lambda: setup_table(1_000),
+    "table-50k": lambda: setup_table(50_000),
+    "table-rows-100k": lambda: setup_table_rows(100_000, "docx"),
+    "table-rows-100k-stream": lambda: setup_table_rows(100_000, "stream"),
+    "bullet-list-10k": lambda: setup_bullet_list(10_000),
+    "mail-merge-1k": lambda: setup_mail_merge(1_000),
+    "deck-200": lambda: setup_deck(200),
+    "deck-500-redraw": lambda: setup_deck(500),
+    "deck-500-clone": lambda: setup_deck(500, clone=True),
+    "text-box-1k": lambda: setup_text_boxes(1_000),
+    "text-box-1k-fit": lambda: setup_text_boxes(1_000, fit=True),
+    "text-fit-10k": lambda: setup_text_fit(10_000),
+    "chart-images-40": lambda: setup_chart_images(40),
+    "chart-deck-100": lambda: setup_chart_deck(100),
+    "chart-deck-100-cached": lambda: setup_chart_deck(100, cached=True),
+}
+
+
+# name -> CLI arguments, run from docs/exports
+STARTUP_CASES = {
+    "startup-export-all-help": ["export_all.py", "--help"],
+    "startup-export-all-list": ["export_all.py", "--list"],
+    "startup-export-all-dry-run": ["export_all.py", "--dry-run"],
+    "startup-md-to-docx-help": ["md_to_docx.py", "--help"],
+    "startup-docs-book-help": ["export_docs_book.py", "--help"],
+    "startup-resort-catalog-help": ["generate_resort_catalog.py", "--help"],
+    "startup-mail-merge-help": ["mail_merge.py", "--help"],
+    "startup-charts-help": ["charts.py", "--help"],
+}
+
+# name -> module whose cumulative import time is measured
+IMPORT_CASES = {
+    "import-brand-docx": "brand_docx",
+    "import-generate-docx": "generate_docx",
+    "import-export-all": "export_all",
+    "import-md-to-docx": "md_to_docx",
+}
+
+ALL_CASES = [*CASES, *STARTUP_CASES, *IMPORT_CASES]
+
+
+# ============================================================
+# MEASUREMENT
+# ============================================================
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(name, repeat):
+    """Measure one case in this process; returns its metrics dict."""
+    run = CASES[name]()
+    best = None
+    size = None
+    with tempfile.TemporaryDirectory() as out_dir:
+        for _ in range(repeat):
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                path = run(out_dir)
+                elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+            size = os.path.getsize(path)
+            # python-docx proxies form reference cycles; collect the previous
+            # run's documents so the peak reflects one build, not GC timing
+            gc.collect()
+    return {"seconds": round(best, 3), "peak_mb": peak_rss_mb(), "bytes": size}
+
+
+def time_startup(argv, repeat):
+    """Best wall time of running a CLI in a fresh interpreter."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = subprocess.run([sys.executable, *argv], cwd=EXPORTS_DIR, capture_output=True, text=True)
+        elapsed = time.perf_counter() - start
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip() or f"exit status {proc.returncode}")
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def import_time(module, repeat):
+    """Best cumulative import time of module as reported by -X importtime."""
+    best = None
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                              cwd=EXPORTS_DIR, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+        # "import time: self [us] | cumulative | imported package"
+        for line in proc.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == module and fields[2].startswith(" " + module):
+                micros = int(fields[1])
+                best = micros if best is None else min(best, micros)
+                break
+    if best is None:
+        raise RuntimeError(f"{module} not found in -X importtime output")
+    return best / 1e6
+
+
+def measure(name, repeat):
+    """Run one case in a fresh interpreter; returns (metrics, error)."""
+    if name in STARTUP_CASES or name in IMPORT_CASES:
+        try:
+            if name in STARTUP_CASES:
+                seconds = time_startup(STARTUP_CASES[name], repeat)
+            else:
+                seconds = import_time(IMPORT_CASES[name], repeat)
+        except RuntimeError as exc:
+            return None, str(exc)
+        return {"seconds": round(seconds, 4), "peak_mb": None, "bytes": None}, None
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", name, "--repeat", str(repeat)],
+        capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        return None, proc.stderr.strip() or f"exit status {proc.returncode}"
+    return json.loads(proc.stdout.strip().splitlines()[-1]), None
+
+
+# ============================================================
+# BUDGETS
+# ============================================================
+
+def load_budgets():
+    try:
+        with open(BUDGETS) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"tolerance": dict(DEFAULT_TOLERANCE), "slack": dict(DEFAULT_SLACK), "cases": {}}
+
+
+def save_budgets(budgets):
+    with open(BUDGETS, "w") as f:
+        json.dump(budgets, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def regressions(metrics, budget, tolerance, slack):
+    """Metric names that exceed budget * (1 + tolerance) + slack."""
+    tolerance = {**tolerance, **(budget or {}).get("tolerance", {})}
+    slack = {**slack, **(budget or {}).get("slack", {})}
+    over = []
+    for metric in METRICS:
+        value, limit = metrics.get(metric), (budget or {}).get(metric)
+        if value is None or limit is None:
+            continue
+        allowed = (limit * (1 + tolerance.get(metric, DEFAULT_TOLERANCE[metric]))
+                   + slack.get(metric, DEFAULT_SLACK[metric]))
+        if value > allowed:
+            over.append(metric)
+    return over
+
+
+def fmt(value, budget, spec):
+    if value is None:
+        return "-".rjust(22)
+    text = format(value, spec)
+    if budget is not None:
+        text += f" ({format(budget, spec)})"
+    return text.rjust(22)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("cases", nargs="*", help=f"cases to run (default: all): {', '.join(ALL_CASES)}")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case (best time is kept)")
+    parser.add_argument("--update", action="store_true", help="write this run's results to budgets.json")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_case(args.child, args.repeat)))
+        return 0
+
+    unknown = [c for c in args.cases if c not in ALL_CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+    budgets = load_budgets()
+    tolerance = budgets.setdefault("tolerance", dict(DEFAULT_TOLERANCE))
+    slack = budgets.setdefault("slack", dict(DEFAULT_SLACK))
+    cases = budgets.setdefault("cases", {})
+
+    print(f"{'case':<28} {'seconds (budget)':>22} {'peak MB (budget)':>22} {'bytes (budget)':>22}  status")
+    failed = []
+    for name in args.cases or ALL_CASES:
+        metrics, error = measure(name, args.repeat)
+        if error:
+            print(f"{name:<28} ERROR\n{error}")
+            failed.append(name)
+            continue
+        budget = cases.get(name)
+        over = regressions(metrics, budget, tolerance, slack)
+        status = "new" if budget is None else ("REGRESSED: " + ", ".join(over) if over else "ok")
+        budget = budget or {}
+        print(f"{name:<28} {fmt(metrics['seconds'], budget.get('seconds'), '.3f')} "
+              f"{fmt(metrics['peak_mb'], budget.get('peak_mb'), '.1f')} "
+              f"{fmt(metrics['bytes'], budget.get('bytes'), ',')}  {status}")
+        if over:
+            failed.append(name)
+        if args.update:
+            entry = cases.setdefault(name, {})
+            if name not in CASES:
+                entry.setdefault("slack", dict(STARTUP_SLACK))
+            entry.update({k: (round(v, 1) if k == "peak_mb" and v is not None else v)
+                          for k, v in metrics.items()})
+
+    if args.update:
+        save_budgets(budgets)
+        print(f"Budgets updated: {os.path.relpath(BUDGETS, PROJECT_ROOT)}")
+        return 0
+    if failed:
+        tol = ", ".join(f"{k} +{v:.0%}" for k, v in sorted(tolerance.items()))
+        print(f"Over budget ({tol}): {', '.join(failed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Benchmark: per-cell parse_xml table styling vs prototype-cloned fragments
+vs the branded table style.
+Run: python docs/exports/benchmarks/bench_style_table.py [--rows 10000]
+
+Both paths style an identical add_table_from_data-shaped table (header +
+N data rows, 3 columns). Cell text is filled by walking the XML directly so
+the timing isolates the formatting pass.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+EXPORTS_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, EXPORTS_DIR)
+
+from docx.shared import Pt
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.oxml.ns import qn, nsdecls
+from docx.oxml import parse_xml
+
+import xml_fragments
+from brand_docx import (
+    create_branded_doc, style_table,
+    BRAND_FONT, WHITE, TABLE_HEADER_BG, TABLE_ALT_ROW,
+)
+
+HEADERS = ["Capability", "Description", "Status"]
+
+
+# ------------------------------------------------------------
+# Reference: the original per-cell implementation
+# ------------------------------------------------------------
+
+def legacy_set_cell_shading(cell, color_hex):
+    shading = parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color_hex}" w:val="clear"/>')
+    cell._tc.get_or_add_tcPr().append(shading)
+
+
+def legacy_set_cell_borders(cell, color="CCCCCC", size="4"):
+    tcPr = cell._tc.get_or_add_tcPr()
+    tcBorders = parse_xml(
+        f'<w:tcBorders {nsdecls("w")}>'
+        f'  <w:top w:val="single" w:sz="{size}" w:space="0" w:color="{color}"/>'
+        f'  <w:left w:val="single" w:sz="{size}" w:space="0" w:color="{color}"/>'
+        f'  <w:bottom w:val="single" w:sz="{size}" w:space="0" w:color="{color}"/>'
+        f'  <w:right w:val="single" w:sz="{size}" w:space="0" w:color="{color}"/>'
+        f'</w:tcBorders>'
+    )
+    existing = tcPr.find(qn('w:tcBorders'))
+    if existing is not None:
+        tcPr.remove(existing)
+    tcPr.append(tcBorders)
+
+
+def legacy_style_table(table, has_header=True):
+    table.alignment = WD_TABLE_ALIGNMENT.LEFT
+    for i, row in enumerate(table.rows):
+        for cell in row.cells:
+            legacy_set_cell_borders(cell)
+            for para in cell.paragraphs:
+                para.paragraph_format.space_before = Pt(2)
+                para.paragraph_format.space_after = Pt(2)
+                for run in para.runs:
+                    run.font.name = BRAND_FONT
+                    run.font.size = Pt(9)
+            if i == 0 and has_header:
+                legacy_set_cell_shading(cell, TABLE_HEADER_BG)
+                for para in cell.paragraphs:
+                    for run in para.runs:
+                        run.font.color.rgb = WHITE
+                        run.font.bold = True
+            elif i % 2 == 0 and i > 0:
+                legacy_set_cell_shading(cell, TABLE_ALT_ROW)
+
+
+# ------------------------------------------------------------
+# Harness
+# ------------------------------------------------------------
+
+def build_unstyled_table(n_rows):
+    """Header + n_rows data rows with text, no formatting applied yet."""
+    doc = create_branded_doc("Benchmark")
+    table = doc.add_table(rows=1 + n_rows, cols=len(HEADERS))
+    rows = [HEADERS] + [[f"Row {i}", f"Description for row {i}", "BUILT"] for i in range(n_rows)]
+    for tr, values in zip(table._tbl.tr_lst, rows):
+        for tc, value in zip(tr.tc_lst, values):
+            tc.p_lst[0].add_r().text = value
+    return doc, table
+
+
+def time_styler(styler, n_rows, repeat):
+    best = None
+    for _ in range(repeat):
+        _, table = build_unstyled_table(n_rows)
+        start = time.perf_counter()
+        styler(table)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000, help="data rows in the table")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per path (best is reported)")
+    args = parser.parse_args()
+
+    xml_fragments.cache_clear()
+    legacy = time_styler(legacy_style_table, args.rows, args.repeat)
+    cloned = time_styler(lambda t: style_table(t, mode="cell"), args.rows, args.repeat)
+    by_style = time_styler(lambda t: style_table(t, mode="style"), args.rows, args.repeat)
+    cells = (args.rows + 1) * len(HEADERS)
+
+    print(f"style_table on {args.rows:,} rows ({cells:,} cells), best of {args.repeat}")
+    print(f"  per-cell parse_xml : {legacy:8.3f} s  ({legacy / cells * 1e6:6.1f} us/cell)")
+    print(f"  cloned fragments   : {cloned:8.3f} s  ({cloned / cells * 1e6:6.1f} us/cell)")
+    print(f"  table style        : {by_style:8.3f} s  ({by_style / cells * 1e6:6.1f} us/cell)")
+    print(f"  speedup (cloned)   : {legacy / cloned:8.1f}x")
+    print(f"  speedup (style)    : {legacy / by_style:8.1f}x")
+    print(f"  fragment cache     : {xml_fragments.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Before/after report: per-cell table formatting vs the branded table style.
+Run: python docs/exports/benchmarks/table_style_report.py [--rows 10 1000 10000]
+
+For each TABLE_STYLE_MODE ("cell", "style") this builds synthetic
+add_table_from_data documents and the real roadmap / status report, and
+reports build time, document.xml size and total .docx size.
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+import zipfile
+
+EXPORTS_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, EXPORTS_DIR)
+
+import brand_docx
+import generate_docx
+from brand_docx import create_branded_doc, add_table_from_data
+
+MODES = ("cell", "style")
+
+
+def sizes(docx_bytes):
+    """(document.xml bytes, total .docx bytes)."""
+    with zipfile.ZipFile(io.BytesIO(docx_bytes)) as zf:
+        return zf.getinfo("word/document.xml").file_size, len(docx_bytes)
+
+
+def build_synthetic(n_rows):
+    doc = create_branded_doc("Benchmark")
+    rows = [[f"Row {i}", f"Description for row {i}", "BUILT"] for i in range(n_rows)]
+    add_table_from_data(doc, ["Capability", "Description", "Status"], rows)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def build_generator(fn, out_dir):
+    # Generators write next to the script; point them at a scratch dir
+    generate_docx.SCRIPT_DIR = out_dir
+    path = fn()
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def measure(build):
+    start = time.perf_counter()
+    data = build()
+    return time.perf_counter() - start, sizes(data)
+
+
+def print_row(label, results):
+    (t_cell, (x_cell, z_cell)), (t_style, (x_style, z_style)) = results
+    print(f"{label:<22} {t_cell:8.3f}s {t_style:8.3f}s  "
+          f"{x_cell:>12,} {x_style:>12,}  {z_cell:>10,} {z_style:>10,}  "
+          f"{x_style / x_cell:6.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 1000, 5000],
+                        help="data row counts for the synthetic tables")
+    args = parser.parse_args()
+
+    print(f"{'':<22} {'time':>9} {'':>9}  {'document.xml':>12} {'':>12}  {'.docx':>10} {'':>10}")
+    print(f"{'build':<22} {'cell':>9} {'style':>9}  {'cell':>12} {'style':>12}  "
+          f"{'cell':>10} {'style':>10}  {'xml %':>6}")
+
+    original_dir = generate_docx.SCRIPT_DIR
+    try:
+        for n in args.rows:
+            results = []
+            for mode in MODES:
+                brand_docx.TABLE_STYLE_MODE = mode
+                results.append(measure(lambda: build_synthetic(n)))
+            print_row(f"table x {n:,} rows", results)
+
+        with tempfile.TemporaryDirectory() as out_dir:
+            for fn in (generate_docx.generate_roadmap, generate_docx.generate_status_report):
+                results = []
+                for mode in MODES:
+                    brand_docx.TABLE_STYLE_MODE = mode
+                    results.append(measure(lambda: build_generator(fn, out_dir)))
+                print_row(fn.__name__, results)
+    finally:
+        generate_docx.SCRIPT_DIR = original_dir
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,807 @@
+"""
+Brand helpers shared by the RAV .docx exports: colors, paragraph/character
+and table styles, the logo header and footer, and the cached branded base
+template that every generator opens its documents from.
+Uses brand colors from BRAND-STYLE-GUIDE.md:
+  - Deep Teal: #1C7268
+  - Warm Coral: #E8703A
+  - Background: #F8F6F3
+  - Dark Navy: #1D2E38
+  - Font: Roboto (falls back to Calibri on systems without Roboto)
+"""
+
+import contextlib
+import hashlib
+import io
+import os
+import re
+from functools import lru_cache
+import docx
+from docx import Document
+from docx.shared import Inches, Pt, Cm, RGBColor
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn, nsdecls
+from docx.oxml import parse_xml
+from docx.text.run import Run
+
+import profiling
+import xml_fragments
+
+# Brand colors
+DEEP_TEAL = RGBColor(0x1C, 0x72, 0x68)
+WARM_CORAL = RGBColor(0xE8, 0x70, 0x3A)
+DARK_NAVY = RGBColor(0x1D, 0x2E, 0x38)
+LIGHT_BG = RGBColor(0xF8, 0xF6, 0xF3)
+WHITE = RGBColor(0xFF, 0xFF, 0xFF)
+QUOTE_GRAY = RGBColor(0x55, 0x55, 0x55)
+MUTED_GRAY = RGBColor(0x99, 0x99, 0x99)
+TABLE_HEADER_BG = "1C7268"
+TABLE_ALT_ROW = "F0F7F6"
+TABLE_BORDER = "CCCCCC"
+BRAND_FONT = "Calibri"  # Roboto not always installed; Calibri is professional and universal
+CODE_FONT = "Consolas"
+# Footer every branded document starts with (see add_page_numbers)
+PAGE_FOOTER = "Page {PAGE} of {NUMPAGES}"
+
+# Document backend for new_branded_doc: "docx" builds the python-docx object
+# model in memory; "stream" writes word/document.xml into the zip as blocks
+# are added (see ooxml_stream.py)
+DOCX_BACKEND = "docx"
+
+# Table styling: "style" references the branded table style registered in
+# styles.xml (header row + banded rows via conditional formatting); "cell"
+# writes borders/shading/fonts onto every cell (the original behavior)
+TABLE_STYLE_MODE = "style"
+TABLE_STYLE = "RAV Table"
+TABLE_TEXT_STYLE = "RAV Table Text"
+TABLE_HEADER_STYLE = "RAV Table Header"
+TABLE_STYLE_ID = "RAVTable"
+TABLE_TEXT_STYLE_ID = "RAVTableText"
+TABLE_HEADER_STYLE_ID = "RAVTableHeader"
+
+# Brand style registry, built once per document by create_branded_doc.
+# Helpers reference these by style id instead of setting font name, size,
+# color, bold and italic on every run. Names contain no spaces, so the
+# style id equals the name.
+# (name, type, based on, font properties, paragraph format properties)
+BRAND_STYLES = [
+    ("BrandBody", WD_STYLE_TYPE.PARAGRAPH, "Normal",
+     dict(name=BRAND_FONT, size=Pt(10), color=DARK_NAVY), {}),
+    ("BrandMeta", WD_STYLE_TYPE.PARAGRAPH, "BrandBody",
+     {}, dict(space_before=Pt(1), space_after=Pt(1))),
+    ("BrandList", WD_STYLE_TYPE.PARAGRAPH, "BrandBody",
+     {}, dict(left_indent=Cm(1), space_before=Pt(1), space_after=Pt(1))),
+    ("BrandQuote", WD_STYLE_TYPE.PARAGRAPH, "BrandBody",
+     dict(size=Pt(9), italic=True, color=QUOTE_GRAY),
+     dict(left_indent=Cm(1), space_before=Pt(4), space_after=Pt(4))),
+    ("BrandFooter", WD_STYLE_TYPE.PARAGRAPH, "BrandBody",
+     dict(size=Pt(8), italic=True, color=MUTED_GRAY),
+     dict(alignment=WD_ALIGN_PARAGRAPH.CENTER)),
+    ("BrandCodeBlock", WD_STYLE_TYPE.PARAGRAPH, "BrandBody",
+     dict(name=CODE_FONT, size=Pt(8.5)),
+     dict(left_indent=Cm(0.5), space_before=Pt(0), space_after=Pt(0))),
+    ("BrandLabel", WD_STYLE_TYPE.CHARACTER, None, dict(bold=True, color=DARK_NAVY), {}),
+    ("BrandAccent", WD_STYLE_TYPE.CHARACTER, None, dict(bold=True, color=DEEP_TEAL), {}),
+    ("BrandBullet", WD_STYLE_TYPE.CHARACTER, None, dict(color=DEEP_TEAL), {}),
+    ("BrandMuted", WD_STYLE_TYPE.CHARACTER, None, dict(italic=True, color=MUTED_GRAY), {}),
+    ("BrandCode", WD_STYLE_TYPE.CHARACTER, None, dict(name=CODE_FONT, size=Pt(9)), {}),
+]
+
+# Paths
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", ".."))
+RAVIO_LOGO = os.path.join(PROJECT_ROOT, "public", "ravio-the-chat-genie-128px.png")
+BRAND_CACHE_DIR = os.path.join(SCRIPT_DIR, ".export-cache")
+
+
+def set_cell_shading(cell, color_hex):
+    """Apply background shading to a table cell."""
+    cell._tc.get_or_add_tcPr().append(xml_fragments.cell_shading(color_hex))
+
+
+def set_cell_borders(cell, color="CCCCCC", size="4"):
+    """Set thin borders on a cell."""
+    _set_tc_borders(cell._tc, color, size)
+
+
+def _set_tc_borders(tc, color=TABLE_BORDER, size="4"):
+    tcPr = tc.get_or_add_tcPr()
+    tcBorders_existing = tcPr.find(qn('w:tcBorders'))
+    if tcBorders_existing is not None:
+        tcPr.remove(tcBorders_existing)
+    tcPr.append(xml_fragments.cell_borders(color, size))
+
+
+def _format_table_paragraph(p, header):
+    """Apply table spacing and run fonts to a w:p inside a cell."""
+    if p.pPr is None:
+        p.insert(0, xml_fragments.paragraph_spacing(40, 40))  # 2pt before/after
+    else:
+        p.pPr.spacing_before = Pt(2)
+        p.pPr.spacing_after = Pt(2)
+    for r in p.r_lst:
+        if r.rPr is None:
+            if header:
+                rPr = xml_fragments.run_properties(BRAND_FONT, 18, str(WHITE), bold=True)
+            else:
+                rPr = xml_fragments.run_properties(BRAND_FONT, 18)
+            r.insert(0, rPr)
+        else:
+            # Pre-formatted run: go through the font API so existing
+            # formatting is merged rather than replaced
+            font = Run(r, None).font
+            font.name = BRAND_FONT
+            font.size = Pt(9)
+            if header:
+                font.color.rgb = WHITE
+                font.bold = True
+
+
+def _style_table_cells(table, has_header):
+    # Walk the XML directly: table.rows / row.cells rebuild proxy lists on
+    # every access, and the cached fragments make per-cell formatting cheap
+    for i, tr in enumerate(table._tbl.tr_lst):
+        header = i == 0 and has_header
+        for tc in tr.tc_lst:
+            _set_tc_borders(tc)
+            for p in tc.p_lst:
+                _format_table_paragraph(p, header)
+            if header:
+                tc.get_or_add_tcPr().append(xml_fragments.cell_shading(TABLE_HEADER_BG))
+            elif i % 2 == 0 and i > 0:
+                tc.get_or_add_tcPr().append(xml_fragments.cell_shading(TABLE_ALT_ROW))
+
+
+# w:tblLook flags: the attributes for current Word, the w:val bitmask for Word 2007
+_TABLE_LOOK_BITS = {"firstRow": 0x0020, "noHBand": 0x0200}
+
+
+def _set_table_look(tblLook, **flags):
+    look = int(tblLook.get(qn('w:val'), "0"), 16)
+    for name, on in flags.items():
+        tblLook.set(qn(f'w:{name}'), "1" if on else "0")
+        look = look | _TABLE_LOOK_BITS[name] if on else look & ~_TABLE_LOOK_BITS[name]
+    tblLook.set(qn('w:val'), f"{look:04X}")
+
+
+def _style_table_by_reference(table, has_header):
+    styles = table.part.styles
+    if styles.element.get_by_id(TABLE_STYLE_ID) is None:
+        register_table_styles(styles)
+    tblPr = table._tbl.tblPr
+    tblPr.style = TABLE_STYLE_ID
+    tblLook = tblPr.find(qn('w:tblLook'))
+    if tblLook is not None:
+        # Without a header row the style's banding would start at row 0 and
+        # shade rows 1, 3, ...; the brand shades rows 2, 4, ... (as the cell
+        # mode does), so headerless tables turn banding off and shade cells
+        _set_table_look(tblLook, firstRow=has_header, noHBand=not has_header)
+    # Borders, header fill and banding come from the table style; each
+    # paragraph only carries a pStyle so Normal's font can't override it
+    for i, tr in enumerate(table._tbl.tr_lst):
+        style_id = TABLE_HEADER_STYLE_ID if i == 0 and has_header else TABLE_TEXT_STYLE_ID
+        for tc in tr.tc_lst:
+            if not has_header and i % 2 == 0 and i > 0:
+                tc.get_or_add_tcPr().append(xml_fragments.cell_shading(TABLE_ALT_ROW))
+            for p in tc.p_lst:
+                if p.pPr is None:
+                    p.insert(0, xml_fragments.paragraph_style(style_id))
+                else:
+                    p.style = style_id
+
+
+def style_table(table, has_header=True, mode=None):
+    """Style a table with brand colors."""
+    table.alignment = WD_TABLE_ALIGNMENT.LEFT
+    if (mode or TABLE_STYLE_MODE) == "style":
+        _style_table_by_reference(table, has_header)
+    else:
+        _style_table_cells(table, has_header)
+
+
+def register_brand_styles(styles):
+    """Add the BRAND_STYLES paragraph and character styles to styles.xml."""
+    for name, style_type, base, font_props, para_props in BRAND_STYLES:
+        style = styles.add_style(name, style_type)
+        if base:
+            style.base_style = styles[base]
+        for attr, value in font_props.items():
+            if attr == "color":
+                style.font.color.rgb = value
+            else:
+                setattr(style.font, attr, value)
+        for attr, value in para_props.items():
+            setattr(style.paragraph_format, attr, value)
+    # Blockquote rule: a teal bar on the left edge (pBdr precedes spacing/ind)
+    styles["BrandQuote"].element.get_or_add_pPr().insert_element_before(
+        parse_xml(
+            f'<w:pBdr {nsdecls("w")}>'
+            f'  <w:left w:val="single" w:sz="12" w:space="4" w:color="1C7268"/>'
+            f'</w:pBdr>'
+        ),
+        'w:shd', 'w:tabs', 'w:spacing', 'w:ind', 'w:jc',
+    )
+
+
+def add_styled_paragraph(doc, style_id):
+    """Append a paragraph that references a registered paragraph style."""
+    p = doc.add_paragraph()
+    p._p.insert(0, xml_fragments.paragraph_style(style_id))
+    return p
+
+
+def add_styled_run(p, text, style_id=None):
+    """Append a run, optionally referencing a registered character style."""
+    run = p.add_run(text)
+    if style_id:
+        run._r.insert(0, xml_fragments.run_style(style_id))
+    return run
+
+
+def register_table_styles(styles):
+    """Add the branded table style and its cell paragraph styles to styles.xml."""
+    text = styles.add_style(TABLE_TEXT_STYLE, WD_STYLE_TYPE.PARAGRAPH)
+    text.base_style = styles['Normal']
+    text.font.name = BRAND_FONT
+    text.font.size = Pt(9)
+    text.paragraph_format.space_before = Pt(2)
+    text.paragraph_format.space_after = Pt(2)
+
+    header = styles.add_style(TABLE_HEADER_STYLE, WD_STYLE_TYPE.PARAGRAPH)
+    header.base_style = text
+    header.font.bold = True
+    header.font.color.rgb = WHITE
+
+    table_style = styles.add_style(TABLE_STYLE, WD_STYLE_TYPE.TABLE)
+    table_style.base_style = styles['Normal Table']
+    b = f'w:val="single" w:sz="4" w:space="0" w:color="{TABLE_BORDER}"'
+    for fragment in (
+        f'<w:tblPr {nsdecls("w")}>'
+        f'  <w:tblStyleRowBandSize w:val="1"/>'
+        f'  <w:tblBorders>'
+        f'    <w:top {b}/><w:left {b}/><w:bottom {b}/><w:right {b}/>'
+        f'    <w:insideH {b}/><w:insideV {b}/>'
+        f'  </w:tblBorders>'
+        f'</w:tblPr>',
+        f'<w:tblStylePr {nsdecls("w")} w:type="firstRow">'
+        f'  <w:rPr><w:b/><w:color w:val="{WHITE}"/></w:rPr>'
+        f'  <w:tcPr><w:shd w:val="clear" w:color="auto" w:fill="{TABLE_HEADER_BG}"/></w:tcPr>'
+        f'</w:tblStylePr>',
+        f'<w:tblStylePr {nsdecls("w")} w:type="band2Horz">'
+        f'  <w:tcPr><w:shd w:val="clear" w:color="auto" w:fill="{TABLE_ALT_ROW}"/></w:tcPr>'
+        f'</w:tblStylePr>',
+    ):
+        table_style.element.append(parse_xml(fragment))
+    return table_style
+
+
+# ============================================================
+# LIST NUMBERING
+# ============================================================
+# add_bullet_list / add_numbered_list use real Word numbering: one abstract
+# definition per kind in numbering.xml. Bullets share a single w:num;
+# every numbered list gets its own w:num (numId >= LIST_RESTART_BASE) that
+# restarts at 1, and append_fragment() renumbers those when a fragment
+# rendered in one document is spliced into another.
+
+BULLET_LIST_NAME = "RAV Bullet"
+NUMBERED_LIST_NAME = "RAV Number"
+LIST_RESTART_BASE = 1000
+_NUM_ID = re.compile(r'(<w:numId w:val=")(\d+)(")')
+
+
+def _list_level_xml(num_fmt, text, rpr):
+    # Glyph at 0.5cm, text at 1cm (BrandList's indent)
+    return (
+        f'<w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="{num_fmt}"/>'
+        f'<w:lvlText w:val="{text}"/><w:lvlJc w:val="left"/>'
+        f'<w:pPr><w:ind w:left="567" w:hanging="284"/></w:pPr>'
+        f'<w:rPr><w:rFonts w:ascii="{BRAND_FONT}" w:hAnsi="{BRAND_FONT}"/>{rpr}</w:rPr></w:lvl>'
+    )
+
+
+def register_list_numbering(doc):
+    """Add the brand bullet and numbered list definitions to numbering.xml."""
+    numbering = doc.part.numbering_part.element
+    next_id = max([-1] + [int(a.get(qn("w:abstractNumId"))) for a in numbering.findall(qn("w:abstractNum"))]) + 1
+    first_num = numbering.find(qn("w:num"))
+    levels = {
+        BULLET_LIST_NAME: _list_level_xml("bullet", "\u2022", f'<w:color w:val="{DEEP_TEAL}"/>'),
+        NUMBERED_LIST_NAME: _list_level_xml("decimal", "%1.", f'<w:b/><w:color w:val="{DEEP_TEAL}"/>'),
+    }
+    for offset, (name, level) in enumerate(levels.items()):
+        abstract = parse_xml(
+            f'<w:abstractNum {nsdecls("w")} w:abstractNumId="{next_id + offset}">'
+            f'<w:multiLevelType w:val="singleLevel"/><w:name w:val="{name}"/>{level}</w:abstractNum>'
+        )
+        if first_num is not None:
+            first_num.addprevious(abstract)
+        else:
+            numbering.append(abstract)
+    numbering.add_num(next_id)  # the shared bullet list
+
+
+def _abstract_num_id(numbering, name):
+    for abstract in numbering.findall(qn("w:abstractNum")):
+        name_el = abstract.find(qn("w:name"))
+        if name_el is not None and name_el.get(qn("w:val")) == name:
+            return abstract.get(qn("w:abstractNumId"))
+    raise ValueError(f"numbering.xml has no {name!r} list; documents need register_list_numbering")
+
+
+def _bullet_num_id(doc):
+    numbering = doc.part.numbering_part.element
+    abstract_id = _abstract_num_id(numbering, BULLET_LIST_NAME)
+    for num in numbering.num_lst:
+        if num.abstractNumId.val == int(abstract_id):
+            return num.numId
+    return numbering.add_num(int(abstract_id)).numId
+
+
+def _new_numbered_list(doc):
+    """numId of a fresh numbered list restarting at 1."""
+    numbering = doc.part.numbering_part.element
+    abstract_id = _abstract_num_id(numbering, NUMBERED_LIST_NAME)
+    num_id = max([LIST_RESTART_BASE - 1] + [num.numId for num in numbering.num_lst]) + 1
+    numbering.append(parse_xml(
+        f'<w:num {nsdecls("w")} w:numId="{num_id}"><w:abstractNumId w:val="{abstract_id}"/>'
+        f'<w:lvlOverride w:ilvl="0"><w:startOverride w:val="1"/></w:lvlOverride></w:num>'
+    ))
+    return num_id
+
+
+def append_fragment(doc, xml):
+    """Append a serialized <w:body> fragment's elements to doc's body.
+
+    Numbered lists in the fragment get fresh numIds in doc, so a fragment
+    rendered elsewhere neither collides with nor continues doc's lists.
+    """
+    if '<w:numId w:val="' in xml:
+        renumbered = {}
+
+        def renumber(m):
+            old = int(m.group(2))
+            if old < LIST_RESTART_BASE:
+                return m.group(0)
+            if old not in renumbered:
+                renumbered[old] = _new_numbered_list(doc)
+            return f"{m.group(1)}{renumbered[old]}{m.group(3)}"
+        xml = _NUM_ID.sub(renumber, xml)
+    _append_body_xml(doc, xml)
+
+
+def _append_body_xml(doc, xml):
+    if hasattr(doc, "write_fragment"):  # streaming backend
+        doc.write_fragment(xml)
+        return
+    body = doc.element.body
+    sectPr = body.find(qn("w:sectPr"))
+    for child in list(parse_xml(xml)):
+        if sectPr is not None:
+            sectPr.addprevious(child)
+        else:
+            body.append(child)
+
+
+def create_branded_doc(title):
+    """Create a new document with brand styling."""
+    doc = Document()
+
+    # Set default font
+    style = doc.styles['Normal']
+    font = style.font
+    font.name = BRAND_FONT
+    font.size = Pt(10)
+    font.color.rgb = DARK_NAVY
+
+    # Set margins
+    for section in doc.sections:
+        section.top_margin = Cm(2)
+        section.bottom_margin = Cm(2)
+        section.left_margin = Cm(2.5)
+        section.right_margin = Cm(2.5)
+
+    # Style headings
+    for level in range(1, 4):
+        heading_style = doc.styles[f'Heading {level}']
+        heading_style.font.name = BRAND_FONT
+        heading_style.font.color.rgb = DEEP_TEAL
+        if level == 1:
+            heading_style.font.size = Pt(20)
+            heading_style.font.bold = True
+        elif level == 2:
+            heading_style.font.size = Pt(15)
+            heading_style.font.bold = True
+        elif level == 3:
+            heading_style.font.size = Pt(12)
+            heading_style.font.bold = True
+
+    register_brand_styles(doc.styles)
+    register_table_styles(doc.styles)
+    register_list_numbering(doc)
+
+    return doc
+
+
+def add_page_numbers(doc, template=PAGE_FOOTER, values=None):
+    """Put the footer template in every section's footer.
+
+    Names in xml_fragments.FOOTER_FIELDS ({PAGE}, {NUMPAGES}, ...) become
+    Word fields; any other {name} is filled from values, e.g. the title
+    or add_metadata pairs (see footer_values). The paragraph is compiled
+    once per template and cloned into each footer.
+    """
+    for section in doc.sections:
+        footer = section.footer
+        footer.is_linked_to_previous = False
+        p = xml_fragments.footer_paragraph(template, BRAND_FONT, 16, str(MUTED_GRAY), values)
+        old = footer._element.find(qn("w:p"))
+        if old is not None:
+            footer._element.replace(old, p)
+        else:
+            footer._element.append(p)
+
+
+def footer_values(title=None, metadata=()):
+    """Footer template values: {title} plus one {key} per add_metadata pair
+    ("Prepared by" becomes {prepared_by})."""
+    values = {key.strip().lower().replace(" ", "_"): value for key, value in metadata}
+    if title is not None:
+        values["title"] = title
+    return values
+
+
+def add_logo_header(doc, doc_title=None):
+    """Add branded logo header with RAVIO."""
+    # RAV brand name as styled text
+    p = doc.add_paragraph()
+    p.alignment = WD_ALIGN_PARAGRAPH.LEFT
+    run = p.add_run("RENT-A-VACATION")
+    run.font.name = BRAND_FONT
+    run.font.size = Pt(28)
+    run.font.color.rgb = DEEP_TEAL
+    run.font.bold = True
+
+    # Document title
+    if doc_title:
+        pt = doc.add_paragraph()
+        pt.alignment = WD_ALIGN_PARAGRAPH.LEFT
+        pt.paragraph_format.space_before = Pt(2)
+        pt.paragraph_format.space_after = Pt(2)
+        run_t = pt.add_run(doc_title)
+        run_t.font.name = BRAND_FONT
+        run_t.font.size = Pt(16)
+        run_t.font.color.rgb = DARK_NAVY
+        run_t.font.bold = True
+
+    # Tagline
+    p2 = doc.add_paragraph()
+    p2.alignment = WD_ALIGN_PARAGRAPH.LEFT
+    p2.paragraph_format.space_before = Pt(0)
+    p2.paragraph_format.space_after = Pt(4)
+    run2 = p2.add_run("Name Your Price. Book Your Paradise.")
+    run2.font.name = BRAND_FONT
+    run2.font.size = Pt(11)
+    run2.font.color.rgb = WARM_CORAL
+    run2.font.italic = True
+
+    # RAVIO chatbot logo + text
+    if os.path.exists(RAVIO_LOGO):
+        p3 = doc.add_paragraph()
+        p3.alignment = WD_ALIGN_PARAGRAPH.LEFT
+        p3.paragraph_format.space_before = Pt(4)
+        p3.paragraph_format.space_after = Pt(8)
+        run3 = p3.add_run()
+        run3.add_picture(RAVIO_LOGO, width=Inches(0.4))
+        run4 = p3.add_run("  Ask RAVIO")
+        run4.font.name = BRAND_FONT
+        run4.font.size = Pt(11)
+        run4.font.color.rgb = DEEP_TEAL
+        run4.font.bold = True
+        run5 = p3.add_run("  \u2014  Just Say Where. RAVIO Does the Rest.")
+        run5.font.name = BRAND_FONT
+        run5.font.size = Pt(9)
+        run5.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
+        run5.font.italic = True
+
+    # Horizontal rule
+    add_horizontal_rule(doc)
+
+
+def add_horizontal_rule(doc):
+    """Add a teal horizontal rule."""
+    p = doc.add_paragraph()
+    p.paragraph_format.space_before = Pt(2)
+    p.paragraph_format.space_after = Pt(6)
+    pPr = p._p.get_or_add_pPr()
+    pBdr = parse_xml(
+        f'<w:pBdr {nsdecls("w")}>'
+        f'  <w:bottom w:val="single" w:sz="8" w:space="1" w:color="1C7268"/>'
+        f'</w:pBdr>'
+    )
+    pPr.append(pBdr)
+
+
+def add_metadata(doc, pairs):
+    """Add key-value metadata lines."""
+    for key, value in pairs:
+        p = add_styled_paragraph(doc, "BrandMeta")
+        add_styled_run(p, f"{key}: ", "BrandLabel")
+        add_styled_run(p, value)
+
+
+def add_body(doc, text, bold=False, italic=False, size=10, color=None):
+    """Add a body paragraph."""
+    p = add_styled_paragraph(doc, "BrandBody")
+    run = add_styled_run(p, text, "BrandLabel" if bold else None)
+    # Only deviations from BrandBody become direct formatting
+    if italic:
+        run.font.italic = True
+    if size != 10:
+        run.font.size = Pt(size)
+    if color is not None and color != DARK_NAVY:
+        run.font.color.rgb = color
+    return p
+
+
+def add_blockquote(doc, text):
+    """Add a styled blockquote."""
+    p = add_styled_paragraph(doc, "BrandQuote")
+    add_styled_run(p, text)
+
+
+def add_table_from_data(doc, headers, rows):
+    """Add a styled table from header list and row list."""
+    table = doc.add_table(rows=1 + len(rows), cols=len(headers))
+    # Walk the rows once: table.rows[i] rebuilds the row list on every
+    # access, which made filling large tables quadratic
+    for row, values in zip(table.rows, [headers] + [list(r) for r in rows]):
+        for cell, val in zip(row.cells, values):
+            cell.text = str(val)
+    style_table(table)
+    return table
+
+
+# Rows parsed (python-docx) or written (streaming) per batch in add_table_from_rows
+TABLE_ROW_BATCH = 500
+_CELL_MARK = "{{RAV:CELL}}"  # stands for the cell text in row templates
+
+
+def _table_templates(doc, headers, has_header):
+    """Styled table markup for headers: (head, [odd row, even row] templates).
+
+    A three-row prototype is built and styled by the normal python-docx
+    path (so both TABLE_STYLE_MODEs look exactly like add_table_from_data)
+    and serialized once; body row templates are split at each cell's text.
+    """
+    from docx.oxml.table import CT_Tbl
+    from docx.table import Table
+    from lxml import etree
+
+    width = getattr(doc, "_block_width", None) or doc._base._block_width
+    table = Table(CT_Tbl.new_tbl(3, len(headers), width), doc._body)
+    for row, values in zip(table.rows, [headers, [_CELL_MARK] * len(headers), [_CELL_MARK] * len(headers)]):
+        for cell, val in zip(row.cells, values):
+            cell.text = str(val)
+    style_table(table, has_header)
+    for t in table._tbl.iter(qn("w:t")):
+        if t.text == _CELL_MARK:
+            t.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+    xml = etree.tostring(table._tbl, encoding="unicode")
+    inner = xml[xml.index(">") + 1:-len("</w:tbl>")]
+    # Split before each <w:tr> or <w:tr ...>, not at <w:trPr>
+    head, header_row, row1, row2 = re.split(r"(?=<w:tr[ >])", inner)
+    return head + header_row, [row2.split(_CELL_MARK), row1.split(_CELL_MARK)]
+
+
+def _cell_markup(value):
+    text = xml_fragments.escape_text("" if value is None else str(value))
+    if "\n" in text or "\t" in text:
+        # What python-docx does for cell.text: line breaks and tabs are elements
+        text = (text.replace("\t", '</w:t><w:tab/><w:t xml:space="preserve">')
+                    .replace("\n", '</w:t><w:br/><w:t xml:space="preserve">'))
+    return text
+
+
+def add_table_from_rows(doc, headers, rows):
+    """Add a styled table from any row iterable (CSV reader, DB cursor, generator).
+
+    Rows are rendered from per-table markup templates and added in batches
+    of TABLE_ROW_BATCH, so per-row cost is constant and only one batch is
+    held at a time; with the streaming backend the rows go straight to
+    disk. None becomes an empty cell; missing trailing cells are empty and
+    extra values are ignored. Returns the number of data rows.
+    """
+    head, templates = _table_templates(doc, headers, has_header=True)
+    n_cols = len(headers)
+    streaming = hasattr(doc, "write_markup")
+    if streaming:
+        doc.write_markup("<w:tbl>" + head)
+    else:
+        tbl = parse_xml(f'<w:tbl {nsdecls("w")}>{head}</w:tbl>')
+        body = doc.element.body
+        sectPr = body.find(qn("w:sectPr"))
+        if sectPr is not None:
+            sectPr.addprevious(tbl)
+        else:
+            body.append(tbl)
+
+    def flush(batch):
+        if streaming:
+            doc.write_markup("".join(batch))
+        else:
+            tbl.extend(parse_xml(f'<w:tbl {nsdecls("w")}>{"".join(batch)}</w:tbl>'))
+
+    count = 0
+    batch = []
+    for values in rows:
+        count += 1
+        pieces = templates[count % 2]
+        cells = [_cell_markup(v) for v in values][:n_cols]
+        cells += [""] * (n_cols - len(cells))
+        batch.append("".join(p + c for p, c in zip(pieces, cells)) + pieces[-1])
+        if len(batch) >= TABLE_ROW_BATCH:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+    if streaming:
+        doc.write_markup("</w:tbl>")
+    return count
+
+
+def add_footer(doc, text):
+    """Add a footer paragraph."""
+    add_horizontal_rule(doc)
+    p = add_styled_paragraph(doc, "BrandFooter")
+    add_styled_run(p, text)
+
+
+def _list_item_xml(num_id, runs):
+    """One BrandList paragraph with numbering; runs are (text, style id or None)."""
+    parts = [
+        f'<w:p><w:pPr><w:pStyle w:val="BrandList"/>'
+        f'<w:numPr><w:ilvl w:val="0"/><w:numId w:val="{num_id}"/></w:numPr></w:pPr>'
+    ]
+    for text, style_id in runs:
+        rPr = f'<w:rPr><w:rStyle w:val="{style_id}"/></w:rPr>' if style_id else ""
+        parts.append(f'<w:r>{rPr}<w:t xml:space="preserve">{xml_fragments.escape_text(text)}</w:t></w:r>')
+    parts.append("</w:p>")
+    return "".join(parts)
+
+
+def _list_xml(num_id, items, split):
+    return "".join([f'<w:body {nsdecls("w")}>']
+                   + [_list_item_xml(num_id, split(str(item))) for item in items]
+                   + ["</w:body>"])
+
+
+def _arrow_runs(item):
+    # "bold \u2192 rest" pattern
+    if "\u2192" in item:
+        head, rest = item.split("\u2192", 1)
+        return [(head.strip(), "BrandLabel"), (f" \u2192 {rest.strip()}", None)]
+    return [(item, None)]
+
+
+def _label_runs(item):
+    # "Label: Description" pattern
+    if ": " in item:
+        label, desc = item.split(": ", 1)
+        return [(f"{label}: ", "BrandLabel"), (desc, None)]
+    return [(item, None)]
+
+
+def add_numbered_list(doc, items, bold_prefix=False):
+    """Add a numbered list (Word numbering, restarting at 1) from any iterable.
+
+    Items of the form "bold \u2192 rest" get a bold lead. The list is built
+    as one XML fragment in a single pass.
+    """
+    _append_body_xml(doc, _list_xml(_new_numbered_list(doc), items, _arrow_runs))
+
+
+def add_bullet_list(doc, items):
+    """Add a bullet list (Word numbering) from any iterable.
+
+    Items of the form "Label: Description" get a bold label. The list is
+    built as one XML fragment in a single pass.
+    """
+    _append_body_xml(doc, _list_xml(_bullet_num_id(doc), items, _label_runs))
+
+
+# ============================================================
+# CACHED BRANDED BASE TEMPLATE
+# ============================================================
+
+# Stand-in for the document title in the cached base; replaced per document
+TITLE_PLACEHOLDER = "{{DOC_TITLE}}"
+
+# Everything that shapes the base template; editing any of these (or the
+# constants below) changes the fingerprint and rebuilds the cache
+_BASE_BUILDERS = (
+    create_branded_doc, register_brand_styles, register_table_styles, register_list_numbering,
+    _list_level_xml,
+    add_logo_header, add_horizontal_rule, add_page_numbers,
+    xml_fragments._footer_paragraph_xml,
+)
+
+_base_cache = {}
+
+
+@lru_cache(maxsize=None)
+def brand_fingerprint():
+    """Hash of the brand constants, base-building helpers and logo (once per process)."""
+    import inspect  # deferred: only needed the first time a document is opened
+
+    digest = hashlib.sha256()
+    digest.update(repr((
+        DEEP_TEAL, WARM_CORAL, DARK_NAVY, LIGHT_BG, WHITE, QUOTE_GRAY, MUTED_GRAY,
+        TABLE_HEADER_BG, TABLE_ALT_ROW, TABLE_BORDER, BRAND_FONT, CODE_FONT, BRAND_STYLES,
+        TABLE_STYLE, TABLE_TEXT_STYLE, TABLE_HEADER_STYLE, TITLE_PLACEHOLDER, PAGE_FOOTER,
+        getattr(docx, "__version__", ""),
+    )).encode())
+    for fn in _BASE_BUILDERS:
+        digest.update(inspect.getsource(fn).encode())
+    if os.path.exists(RAVIO_LOGO):
+        with open(RAVIO_LOGO, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def build_brand_base():
+    """Build the branded base: styles, margins, logo header and page-number footer."""
+    doc = create_branded_doc("Base")
+    add_logo_header(doc, doc_title=TITLE_PLACEHOLDER)
+    add_page_numbers(doc)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def brand_base_bytes():
+    """The cached base .docx, rebuilt when the brand fingerprint changes."""
+    fingerprint = brand_fingerprint()
+    if fingerprint in _base_cache:
+        return _base_cache[fingerprint]
+    path = os.path.join(BRAND_CACHE_DIR, f"brand-base-{fingerprint}.docx")
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            data = f.read()
+    else:
+        data = build_brand_base()
+        os.makedirs(BRAND_CACHE_DIR, exist_ok=True)
+        # Parallel export workers may race here; the rename is atomic
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        for name in os.listdir(BRAND_CACHE_DIR):
+            if name.startswith("brand-base-") and name.endswith(".docx") and name != os.path.basename(path):
+                with contextlib.suppress(FileNotFoundError):  # another worker removed it first
+                    os.remove(os.path.join(BRAND_CACHE_DIR, name))
+    _base_cache[fingerprint] = data
+    return data
+
+
+def new_branded_doc(doc_title=None, backend=None):
+    """Open a new document from the cached branded base.
+
+    Equivalent to create_branded_doc + add_logo_header + add_page_numbers,
+    without restyling the default template or re-embedding the logo.
+    backend overrides DOCX_BACKEND ("docx" or "stream").
+    """
+    doc = Document(io.BytesIO(brand_base_bytes()))
+    for p in doc.paragraphs:
+        if p.text == TITLE_PLACEHOLDER:
+            if doc_title:
+                p.runs[0].text = doc_title
+            else:
+                p._p.getparent().remove(p._p)
+            break
+    if (backend or DOCX_BACKEND) == "stream":
+        from ooxml_stream import StreamingDocument
+        doc = StreamingDocument(doc)
+    return profiling.instrument(doc)
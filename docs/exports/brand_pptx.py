@@ -0,0 +1,821 @@
+"""
+Rent-A-Vacation PowerPoint Brand Helpers
+Shared slide helpers and a data-driven deck builder.
+
+A deck spec is plain data: {"slides": [{"type": ..., ...}, ...]}, where
+each slide's type names a factory in SLIDE_TYPES (title, section,
+bullets, stats, feature, closing, chart) and its other keys are that
+factory's arguments. build_deck(spec) returns a Presentation; build_decks() saves
+many decks from one process or across a worker pool.
+
+    python docs/exports/brand_pptx.py DECKS.{json,jsonl} [...] [--out-dir DIR] [--jobs N] [--clone [TEMPLATE]]
+
+A .json file holds one deck spec or a list of them, a .jsonl file one
+deck spec per line; each spec names its file with "output". With
+--clone the slides are copied from the designed template's slides
+(docs/brand-assets/RAV-Brand-Template.pptx) rather than drawn shape by
+shape; see TEMPLATE CLONING.
+"""
+
+import argparse
+import contextlib
+import copy
+import hashlib
+import inspect
+import io
+import json
+import os
+import sys
+import time
+from collections import namedtuple
+from functools import lru_cache
+from types import SimpleNamespace
+
+import pptx
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.text import PP_ALIGN
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.parts.slide import SlideLayoutPart, SlidePart
+from pptx.shapes.shapetree import SlideShapes
+from pptx.util import Inches, Pt
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DECK_DIR = os.path.join(SCRIPT_DIR, "content", "decks")
+# The designed template and the deck spec its slides were built from (see TEMPLATE CLONING)
+BRAND_TEMPLATE = os.path.join(os.path.dirname(SCRIPT_DIR), "brand-assets", "RAV-Brand-Template.pptx")
+TEMPLATE_SPEC = os.path.join(DECK_DIR, "brand-template.json")
+BRAND_CACHE_DIR = os.path.join(SCRIPT_DIR, ".export-cache")
+
+# Brand colors
+TEAL = RGBColor(0x1C, 0x72, 0x68)
+CORAL = RGBColor(0xE8, 0x70, 0x3A)
+CREAM = RGBColor(0xF8, 0xF6, 0xF3)
+NAVY = RGBColor(0x1D, 0x2E, 0x38)
+WHITE = RGBColor(0xFF, 0xFF, 0xFF)
+SAND = RGBColor(0xF0, 0xEB, 0xE3)
+MUTED = RGBColor(0x6B, 0x7B, 0x85)
+SUCCESS = RGBColor(0x1F, 0xA6, 0x6E)
+LIGHT_TEAL = RGBColor(0xB0, 0xD8, 0xD2)
+PALE_TEAL = RGBColor(0x8C, 0xC5, 0xBC)
+PLACEHOLDER_LINE = RGBColor(0xD0, 0xCB, 0xC3)
+
+SLIDE_WIDTH = Inches(13.333)
+SLIDE_HEIGHT = Inches(7.5)
+BLANK_LAYOUT = "Blank"  # the only default layout the base keeps
+
+TAGLINE = "Name Your Price. Book Your Paradise."
+FOOTER_TEXT = f"rent-a-vacation.com  |  {TAGLINE}"
+MAX_STATS = 4  # stat cards fit a 2x2 grid
+
+
+# ============================================================
+# SHAPE HELPERS
+# ============================================================
+
+def new_presentation():
+    """Empty 16:9 presentation opened from the cached branded base (see BRAND LAYOUTS)."""
+    return Presentation(io.BytesIO(brand_base_bytes()))
+
+
+def add_slide(prs, layout):
+    """prs.slides.add_slide(layout) without its scans over every existing slide.
+
+    python-pptx looks for an existing relationship to the brand-new slide
+    part and takes the next slide id with an XPath query, both per slide,
+    which makes long decks quadratic.
+    """
+    part = SlidePart.new(prs.part._next_slide_partname, prs.part.package, layout.part)
+    r_id = prs.part.rels._add_relationship(RT.SLIDE, part)
+    id_list = prs.slides._sldIdLst
+    id_list._add_sldId(id=max((int(s.get("id")) for s in id_list), default=255) + 1, rId=r_id)
+    slide = part.slide
+    slide.shapes.clone_layout_placeholders(layout)
+    return slide
+
+
+def add_blank_slide(prs):
+    return add_slide(prs, prs.slide_layouts.get_by_name(BLANK_LAYOUT))
+
+
+def add_branded_slide(prs, layout_name):
+    """Add a slide on one of the brand layouts (its chrome comes from the layout)."""
+    layout = prs.slide_layouts.get_by_name(layout_name)
+    if layout is None:
+        raise ValueError(f"presentation has no layout {layout_name!r} (open it with new_presentation())")
+    return add_slide(prs, layout)
+
+
+def add_bg_rect(slide, color, left=0, top=0, width=None, height=None):
+    """Add a background rectangle."""
+    w = width or SLIDE_WIDTH
+    h = height or SLIDE_HEIGHT
+    shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, w, h)
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = color
+    shape.line.fill.background()
+    return shape
+
+
+def add_text_box(slide, left, top, width, height, text, font_size=18,
+                 color=NAVY, bold=False, alignment=PP_ALIGN.LEFT, font_name="Roboto", fit=False):
+    """Add a text box with specified formatting.
+
+    With fit, font_size is the largest size: text too long for the box at
+    that size is set at the largest size it fits (see text_fit).
+    """
+    if fit:
+        import text_fit
+
+        font_size = text_fit.fit_font_size(text, width, height, font_name, bold, max_size=font_size)
+    txBox = slide.shapes.add_textbox(left, top, width, height)
+    tf = txBox.text_frame
+    tf.word_wrap = True
+    p = tf.paragraphs[0]
+    p.text = text
+    p.font.size = Pt(font_size)
+    p.font.color.rgb = color
+    p.font.bold = bold
+    p.font.name = font_name
+    p.alignment = alignment
+    return txBox
+
+
+def add_logo_text(slide, left, top, size=14):
+    """Add 'RENT-A-VACATION' text as logo placeholder."""
+    add_text_box(slide, left, top, Inches(3), Inches(0.5),
+                 "RENT-A-VACATION", font_size=size, color=WHITE, bold=True)
+
+
+def add_accent_bar(slide, top, width=Inches(2), color=CORAL, left=Inches(0.8)):
+    """Add a thin accent bar."""
+    shape = slide.shapes.add_shape(
+        MSO_SHAPE.RECTANGLE, left, top, width, Inches(0.06))
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = color
+    shape.line.fill.background()
+    return shape
+
+
+def add_footer(slide, dark_bg=False):
+    """Add footer with brand name and tagline."""
+    fg = WHITE if dark_bg else MUTED
+    add_text_box(slide, Inches(0.8), Inches(6.8), Inches(6), Inches(0.4),
+                 FOOTER_TEXT, font_size=10, color=fg)
+
+
+# ============================================================
+# BRAND LAYOUTS
+# ============================================================
+# The chrome every slide of a kind shares (background, strips, accent
+# bars, logo text, footer) is drawn once onto a slide layout of the
+# cached base presentation, so slides only carry their own content.
+# The chrome functions draw with the shape helpers above onto a layout.
+
+TITLE_LAYOUT = "RAV Title"
+SECTION_LAYOUT = "RAV Section"
+CONTENT_LAYOUT = "RAV Content"
+FEATURE_LAYOUT = "RAV Feature"
+CLOSING_LAYOUT = "RAV Closing"
+
+
+def _title_chrome(layout):
+    add_bg_rect(layout, CORAL, top=0, height=Inches(0.12))  # accent strip at top
+    add_logo_text(layout, Inches(0.8), Inches(1.2), size=16)
+    add_bg_rect(layout, CORAL, left=Inches(0.8), top=Inches(5.8), width=Inches(3), height=Inches(0.05))
+    add_footer(layout, dark_bg=True)
+
+
+def _section_chrome(layout):
+    add_bg_rect(layout, TEAL, height=Inches(2.8))
+    add_bg_rect(layout, CORAL, top=Inches(2.8), height=Inches(0.08))
+    add_logo_text(layout, Inches(0.8), Inches(0.5), size=12)
+    add_footer(layout)
+
+
+def _content_chrome(layout):
+    add_bg_rect(layout, TEAL, height=Inches(0.08))
+    add_accent_bar(layout, Inches(1.25))  # underlines the slide title
+    add_footer(layout)
+
+
+def _feature_chrome(layout):
+    add_bg_rect(layout, TEAL, height=Inches(0.08))
+    add_accent_bar(layout, Inches(1.95), left=Inches(7))  # underlines the feature title
+    add_footer(layout)
+
+
+def _closing_chrome(layout):
+    add_bg_rect(layout, CORAL, top=0, height=Inches(0.12))
+    add_logo_text(layout, Inches(0.8), Inches(1.0), size=16)
+    add_bg_rect(layout, CORAL, left=Inches(0.8), top=Inches(5.6), width=Inches(3), height=Inches(0.05))
+    add_footer(layout, dark_bg=True)
+
+
+# Layout name -> (background color, chrome function)
+BRAND_LAYOUTS = {
+    TITLE_LAYOUT: (TEAL, _title_chrome),
+    SECTION_LAYOUT: (CREAM, _section_chrome),
+    CONTENT_LAYOUT: (CREAM, _content_chrome),
+    FEATURE_LAYOUT: (WHITE, _feature_chrome),
+    CLOSING_LAYOUT: (TEAL, _closing_chrome),
+}
+
+
+def add_brand_layout(prs, name, background, chrome):
+    """Append a layout (a copy of the blank one) with a solid background and chrome shapes."""
+    master = prs.slide_master
+    blank = prs.slide_layouts.get_by_name(BLANK_LAYOUT)
+    package = master.part.package
+    partname = package.next_partname("/ppt/slideLayouts/slideLayout%d.xml")
+    part = SlideLayoutPart.load(partname, CT.PML_SLIDE_LAYOUT, package, blank.part.blob)
+    part.relate_to(master.part, RT.SLIDE_MASTER)
+    r_id = master.part.relate_to(part, RT.SLIDE_LAYOUT)
+    id_list = master._element.get_or_add_sldLayoutIdLst()
+    next_id = max(int(entry.get("id")) for entry in id_list) + 1
+    id_list.append(parse_xml(f'<p:sldLayoutId {nsdecls("p", "r")} id="{next_id}" r:id="{r_id}"/>'))
+
+    layout = part.slide_layout
+    layout._element.attrib.pop("type", None)  # no longer the "blank" layout
+    layout._element.cSld.set("name", name)
+    for placeholder in list(layout.placeholders):  # the blank layout's date/footer/number
+        placeholder._element.getparent().remove(placeholder._element)
+    layout.background.fill.solid()
+    layout.background.fill.fore_color.rgb = background
+    chrome(SimpleNamespace(shapes=SlideShapes(layout.shapes._spTree, layout)))
+    return layout
+
+
+def build_brand_base():
+    """The branded base: a 16:9 presentation with the blank layout and BRAND_LAYOUTS."""
+    prs = Presentation()
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
+    for layout in list(prs.slide_layouts):  # unused defaults would ship in every deck
+        if layout.name != BLANK_LAYOUT:
+            prs.slide_layouts.remove(layout)
+    for name, (background, chrome) in BRAND_LAYOUTS.items():
+        add_brand_layout(prs, name, background, chrome)
+    buf = io.BytesIO()
+    prs.save(buf)
+    return buf.getvalue()
+
+
+# Everything that shapes the base; editing any of these (or the constants
+# below) changes the fingerprint and rebuilds the cache
+_BASE_BUILDERS = (
+    build_brand_base, add_brand_layout, add_bg_rect, add_text_box, add_logo_text, add_accent_bar, add_footer,
+    _title_chrome, _section_chrome, _content_chrome, _feature_chrome, _closing_chrome,
+)
+
+_base_cache = {}
+
+
+@lru_cache(maxsize=None)
+def brand_fingerprint():
+    """Hash of the brand constants and base-building helpers (once per process)."""
+    digest = hashlib.sha256()
+    digest.update(repr((
+        TEAL, CORAL, CREAM, NAVY, WHITE, MUTED, SLIDE_WIDTH, SLIDE_HEIGHT, FOOTER_TEXT,
+        sorted((name, str(bg)) for name, (bg, _) in BRAND_LAYOUTS.items()), pptx.__version__,
+    )).encode())
+    for fn in _BASE_BUILDERS:
+        digest.update(inspect.getsource(fn).encode())
+    return digest.hexdigest()[:16]
+
+
+def brand_base_bytes():
+    """The cached base .pptx, rebuilt when the brand fingerprint changes."""
+    fingerprint = brand_fingerprint()
+    if fingerprint in _base_cache:
+        return _base_cache[fingerprint]
+    path = os.path.join(BRAND_CACHE_DIR, f"brand-deck-base-{fingerprint}.pptx")
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            data = f.read()
+    else:
+        data = build_brand_base()
+        os.makedirs(BRAND_CACHE_DIR, exist_ok=True)
+        # Parallel workers may race here; the rename is atomic
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        for name in os.listdir(BRAND_CACHE_DIR):
+            if name.startswith("brand-deck-base-") and name.endswith(".pptx") and name != os.path.basename(path):
+                with contextlib.suppress(FileNotFoundError):  # another worker removed it first
+                    os.remove(os.path.join(BRAND_CACHE_DIR, name))
+    _base_cache[fingerprint] = data
+    return data
+
+
+def _add_title(slide, title, left=Inches(0.8), top=Inches(0.5), width=Inches(10)):
+    add_text_box(slide, left, top, width, Inches(0.8), title, font_size=32, color=TEAL, bold=True, fit=True)
+
+
+# ============================================================
+# SLIDE FACTORIES
+# ============================================================
+# Each factory appends one slide on its brand layout to prs and returns
+# it; the slide itself holds only its content. Arguments are plain
+# strings and lists so a deck can be described entirely in data. Text
+# from the spec is fitted to its box (add_text_box(fit=True)), so a long
+# title shrinks instead of overflowing.
+
+def title_slide(prs, title, subtitle="", tagline=TAGLINE):
+    """Title slide on a teal background."""
+    slide = add_branded_slide(prs, TITLE_LAYOUT)
+    add_text_box(slide, Inches(0.8), Inches(2.5), Inches(10), Inches(1.5),
+                 title, font_size=44, color=WHITE, bold=True, fit=True)
+    if subtitle:
+        add_text_box(slide, Inches(0.8), Inches(4.2), Inches(8), Inches(0.8),
+                     subtitle, font_size=20, color=LIGHT_TEAL, fit=True)
+    if tagline:
+        add_text_box(slide, Inches(0.8), Inches(6.2), Inches(8), Inches(0.5),
+                     tagline, font_size=14, color=PALE_TEAL)
+    return slide
+
+
+def section_slide(prs, title, text=""):
+    """Section divider: teal header band over a cream body."""
+    slide = add_branded_slide(prs, SECTION_LAYOUT)
+    add_text_box(slide, Inches(0.8), Inches(1.2), Inches(10), Inches(1.2),
+                 title, font_size=40, color=WHITE, bold=True, fit=True)
+    if text:
+        add_text_box(slide, Inches(0.8), Inches(3.4), Inches(10), Inches(0.8),
+                     text, font_size=18, color=NAVY, fit=True)
+    return slide
+
+
+def bullets_slide(prs, title, items, highlight=()):
+    """Content slide with dot bullets; items at the highlight indexes get coral dots."""
+    slide = add_branded_slide(prs, CONTENT_LAYOUT)
+    _add_title(slide, title)
+    y_pos = Inches(1.7)
+    for i, bullet in enumerate(items):
+        dot = slide.shapes.add_shape(
+            MSO_SHAPE.OVAL, Inches(0.85), y_pos + Inches(0.12), Inches(0.15), Inches(0.15))
+        dot.fill.solid()
+        dot.fill.fore_color.rgb = CORAL if i in highlight else TEAL
+        dot.line.fill.background()
+        add_text_box(slide, Inches(1.2), y_pos, Inches(10), Inches(0.5),
+                     bullet, font_size=18, color=NAVY, fit=True)
+        y_pos += Inches(0.75)
+    return slide
+
+
+def stats_slide(prs, title, stats):
+    """Up to MAX_STATS [number, label] stat cards in a 2x2 grid."""
+    if len(stats) > MAX_STATS:
+        raise ValueError(f"stats slide {title!r}: {len(stats)} stats, at most {MAX_STATS} fit")
+    slide = add_branded_slide(prs, CONTENT_LAYOUT)
+    _add_title(slide, title)
+    for i, (number, label) in enumerate(stats):
+        col = i % 2
+        row = i // 2
+        x = Inches(0.8) + col * Inches(5.5)
+        y = Inches(1.8) + row * Inches(2.2)
+
+        card = slide.shapes.add_shape(
+            MSO_SHAPE.ROUNDED_RECTANGLE, x, y, Inches(4.8), Inches(1.8))
+        card.fill.solid()
+        card.fill.fore_color.rgb = WHITE
+        card.line.fill.background()
+        add_accent_bar(slide, y, width=Inches(4.8), left=x)  # coral top accent on card
+
+        add_text_box(slide, x + Inches(0.3), y + Inches(0.3), Inches(4), Inches(0.8),
+                     str(number), font_size=42, color=TEAL, bold=True, fit=True)
+        add_text_box(slide, x + Inches(0.3), y + Inches(1.1), Inches(4), Inches(0.5),
+                     label, font_size=16, color=MUTED, fit=True)
+    return slide
+
+
+def feature_slide(prs, title, text, cta="", image=None, image_text="[ Insert Image Here ]"):
+    """Image (or an image placeholder) on the left, feature copy and a CTA on the right."""
+    slide = add_branded_slide(prs, FEATURE_LAYOUT)
+
+    if image:
+        slide.shapes.add_picture(image, Inches(0.8), Inches(0.8), Inches(5.5), Inches(5.8))
+    else:
+        placeholder = slide.shapes.add_shape(
+            MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.8), Inches(0.8), Inches(5.5), Inches(5.8))
+        placeholder.fill.solid()
+        placeholder.fill.fore_color.rgb = SAND
+        placeholder.line.color.rgb = PLACEHOLDER_LINE
+        placeholder.line.width = Pt(1)
+        add_text_box(slide, Inches(1.5), Inches(3.2), Inches(4), Inches(1),
+                     image_text, font_size=18, color=MUTED, alignment=PP_ALIGN.CENTER)
+
+    _add_title(slide, title, left=Inches(7), top=Inches(1.2), width=Inches(5.5))
+    add_text_box(slide, Inches(7), Inches(2.3), Inches(5.5), Inches(2),
+                 text, font_size=18, color=NAVY, fit=True)
+
+    if cta:
+        button = slide.shapes.add_shape(
+            MSO_SHAPE.ROUNDED_RECTANGLE, Inches(7), Inches(4.8), Inches(3.5), Inches(0.7))
+        button.fill.solid()
+        button.fill.fore_color.rgb = CORAL
+        button.line.fill.background()
+        tf = button.text_frame
+        tf.paragraphs[0].text = cta
+        tf.paragraphs[0].font.size = Pt(18)
+        tf.paragraphs[0].font.color.rgb = WHITE
+        tf.paragraphs[0].font.bold = True
+        tf.paragraphs[0].font.name = "Roboto"
+        tf.paragraphs[0].alignment = PP_ALIGN.CENTER
+        tf.word_wrap = True
+    return slide
+
+
+def closing_slide(prs, title="Thank You", website="rent-a-vacation.com", contact="", tagline=TAGLINE):
+    """Closing slide on a teal background."""
+    slide = add_branded_slide(prs, CLOSING_LAYOUT)
+    add_text_box(slide, Inches(0.8), Inches(2.5), Inches(10), Inches(1.2),
+                 title, font_size=52, color=WHITE, bold=True, fit=True)
+    if website:
+        add_text_box(slide, Inches(0.8), Inches(4.0), Inches(8), Inches(0.5),
+                     website, font_size=22, color=LIGHT_TEAL)
+    if contact:
+        add_text_box(slide, Inches(0.8), Inches(4.6), Inches(8), Inches(0.5),
+                     contact, font_size=16, color=PALE_TEAL)
+    if tagline:
+        add_text_box(slide, Inches(0.8), Inches(5.8), Inches(8), Inches(0.5),
+                     tagline, font_size=16, color=PALE_TEAL)
+    return slide
+
+
+def chart_slide(prs, title, categories, series, kind="column", suffix="", decimals=None, caption=""):
+    """Native chart of [name, values] series over categories (see charts)."""
+    import charts
+
+    chart = {"kind": kind, "categories": categories, "series": series, "suffix": suffix}
+    if decimals is not None:
+        chart["decimals"] = decimals
+    charts.check_chart(chart, f"chart slide {title!r}")
+    slide = add_branded_slide(prs, CONTENT_LAYOUT)
+    _add_title(slide, title)
+    charts.add_native_chart(slide, chart, Inches(0.8), Inches(1.6), Inches(11.7), Inches(4.6 if caption else 5.0))
+    if caption:
+        add_text_box(slide, Inches(0.8), Inches(6.25), Inches(11.7), Inches(0.4),
+                     caption, font_size=12, color=MUTED, fit=True)
+    return slide
+
+
+# Slide type -> (factory, required keys)
+SLIDE_TYPES = {
+    "title": (title_slide, ("title",)),
+    "section": (section_slide, ("title",)),
+    "bullets": (bullets_slide, ("title", "items")),
+    "stats": (stats_slide, ("title", "stats")),
+    "feature": (feature_slide, ("title", "text")),
+    "closing": (closing_slide, ()),
+    "chart": (chart_slide, ("title", "categories", "series")),
+}
+# Slide types that are never cloned from a template prototype
+DRAWN_TYPES = ("chart",)
+
+
+# ============================================================
+# TEMPLATE CLONING
+# ============================================================
+# Instead of drawing every shape, a deck can be built from the designed
+# template: its slides are loaded once as prototypes and each new slide
+# is a copy of its type's prototype shapes with the sample text swapped
+# for the spec's. A prototype learns where each argument goes by finding
+# the template spec's sample text (or the factory default) on its slide,
+# so the template can be restyled freely as long as that text stays.
+# List arguments (bullets, stat cards) map to repeated rows of shapes;
+# rows past the template's count continue its spacing. Slide types the
+# template has no slide for (DRAWN_TYPES: charts) are drawn by their
+# factory on the brand layouts, which the cloning base carries as well.
+
+# shapes: the template slide's shape elements (copied, never modified)
+# slots:  {argument: shape index} for text arguments
+# rows:   {argument: (first shape index, shapes per row, text offsets within a row, row count)}
+# defaults: the factory's defaults for arguments a spec leaves out
+SlidePrototype = namedtuple("SlidePrototype", "shapes slots rows defaults")
+# base: the template package without its slides but with the brand
+#       layouts, opened for every deck
+DeckTemplate = namedtuple("DeckTemplate", "path base prototypes")
+
+
+def _shape_text(element):
+    return "".join(t.text or "" for t in element.iter(qn("a:t")))
+
+
+def _set_shape_text(element, text):
+    """Replace a shape's text, keeping the formatting of its first run.
+
+    Text too long for a wrapping box at the run's size gets the largest
+    size it fits, as add_text_box(fit=True) would draw it.
+    """
+    runs = list(element.iter(qn("a:r")))
+    if not runs:
+        raise ValueError(f"shape {element.find('.//' + qn('p:cNvPr')).get('name')!r} has no text run")
+    runs[0].find(qn("a:t")).text = str(text)
+    first_para = runs[0].getparent()
+    for run in runs[1:]:
+        run.getparent().remove(run)
+    for para in list(element.iter(qn("a:p"))):
+        if para is not first_para:
+            para.getparent().remove(para)
+    _fit_shape_text(element, runs[0], str(text))
+
+
+def _fit_shape_text(element, run, text):
+    import text_fit
+
+    # add_text_box formats the paragraph (a:pPr/a:defRPr), a hand-edited template may format the run
+    candidates = (run.find(qn("a:rPr")), run.getparent().find(qn("a:pPr") + "/" + qn("a:defRPr")))
+    r_pr = next((props for props in candidates if props is not None and props.get("sz")), None)
+    body, box = element.find(".//" + qn("a:bodyPr")), _box(element)
+    if body is None or body.get("wrap") != "square" or r_pr is None or box is None:
+        return
+    latin = r_pr.find(qn("a:latin"))
+    font = latin.get("typeface") if latin is not None else "Roboto"
+    bold = r_pr.get("b") in ("1", "true")
+    if text_fit.font_table(font, bold) is None:
+        return  # no glyph table to measure with: keep the template's size
+    left, top, right, bottom = box
+    size = int(r_pr.get("sz")) // 100
+    fitted = text_fit.fit_font_size(text, right - left, bottom - top, font, bold, max_size=size)
+    if fitted < size:
+        r_pr.set("sz", str(fitted * 100))
+
+
+def _box(element):
+    off = element.find(".//" + qn("a:off"))
+    ext = element.find(".//" + qn("a:ext"))
+    if off is None or ext is None:
+        return None
+    x, y = int(off.get("x")), int(off.get("y"))
+    return x, y, x + int(ext.get("cx")), y + int(ext.get("cy"))
+
+
+def _shift(element, dx, dy):
+    for off in element.iter(qn("a:off")):
+        off.set("x", str(int(off.get("x")) + dx))
+        off.set("y", str(int(off.get("y")) + dy))
+
+
+def _find_text(texts, value, start, where):
+    for i in range(start, len(texts)):
+        if texts[i] == value:
+            return i
+    raise ValueError(f"{where}: no shape with the sample text {value!r}")
+
+
+def _prototype(slide, kind, args, where):
+    """SlidePrototype for one template slide built from args (its template spec entry)."""
+    factory = SLIDE_TYPES[kind][0]
+    defaults = {name: p.default for name, p in inspect.signature(factory).parameters.items()
+                if p.default is not inspect.Parameter.empty}
+    shapes = tuple(slide.shapes._spTree.iter_shape_elms())
+    texts = [_shape_text(shape) for shape in shapes]
+    slots, rows = {}, {}
+    for key, value in {**defaults, **args}.items():
+        if isinstance(value, str) and value:
+            slots[key] = _find_text(texts, value, 0, where)
+        elif isinstance(value, list) and value and all(isinstance(v, (str, list)) for v in value):
+            positions, start = [], 0
+            for item in value:
+                found = []
+                for part in [item] if isinstance(item, str) else item:
+                    start = _find_text(texts, str(part), start, where) + 1
+                    found.append(start - 1)
+                positions.append(found)
+            if len(positions) < 2:
+                raise ValueError(f"{where}: {key!r} needs at least two sample rows")
+            stride = positions[1][-1] - positions[0][-1]
+            first = positions[0][-1] - stride + 1
+            rows[key] = (first, stride, [p - first for p in positions[0]], len(positions))
+    return SlidePrototype(shapes, slots, rows, defaults)
+
+
+@lru_cache(maxsize=None)
+def load_template(path=BRAND_TEMPLATE, spec_path=TEMPLATE_SPEC):
+    """Load a designed template deck once (per process) as slide prototypes.
+
+    spec_path is the deck spec the template's slides were built from; the
+    first slide of each type becomes that type's prototype.
+    """
+    spec = load_specs(spec_path)[0]
+    check_spec(spec, spec_path)
+    prs = Presentation(path)
+    # Chart slides are always drawn, so they are left out on both sides
+    # (a designed template need not have them, a generated one does)
+    specs = [args for args in spec["slides"] if args["type"] not in DRAWN_TYPES]
+    slides = [(n, slide) for n, slide in enumerate(prs.slides, 1)
+              if not any(shape.has_chart for shape in slide.shapes)]
+    if len(slides) != len(specs):
+        raise ValueError(f"{path}: {len(slides)} slides without charts, but its spec describes {len(specs)}")
+    prototypes = {}
+    for (n, slide), args in zip(slides, specs):
+        kind = args["type"]
+        if kind not in prototypes:
+            where = f"{os.path.basename(path)} slide {n} ({kind})"
+            prototypes[kind] = _prototype(slide, kind, {k: v for k, v in args.items() if k != "type"}, where)
+    slide_ids = prs.slides._sldIdLst
+    for slide_id in list(slide_ids):  # the sample slides are not saved with the base
+        prs.part.drop_rel(slide_id.rId)
+        slide_ids.remove(slide_id)
+    for name, (background, chrome) in BRAND_LAYOUTS.items():
+        add_brand_layout(prs, name, background, chrome)
+    buf = io.BytesIO()
+    prs.save(buf)
+    return DeckTemplate(path, buf.getvalue(), prototypes)
+
+
+def _clone_rows(proto, key, values, highlight):
+    first, stride, offsets, count = proto.rows[key]
+    rows = []
+    for k, value in enumerate(values):
+        src = min(k, count - 1)
+        row = [copy.deepcopy(s) for s in proto.shapes[first + src * stride:first + (src + 1) * stride]]
+        if k >= count:  # continue the spacing of the template's last two rows
+            x1, y1, _, _ = _box(proto.shapes[first + src * stride])
+            x0, y0, _, _ = _box(proto.shapes[first + (src - 1) * stride])
+            for shape in row:
+                _shift(shape, (x1 - x0) * (k - src), (y1 - y0) * (k - src))
+        for offset, part in zip(offsets, [value] if isinstance(value, str) else value):
+            _set_shape_text(row[offset], part)
+        if highlight is not None:  # the row's marker (the bullet dot) shows the highlight
+            fill = row[0].find(".//" + qn("a:srgbClr"))
+            if fill is not None:
+                fill.set("val", str(CORAL if k in highlight else TEAL))
+        rows.extend(row)
+    return rows
+
+
+def clone_slide(prs, template, slide_spec):
+    """Append one slide as a copy of its type's prototype with the spec's text and image.
+
+    Types without a prototype are drawn by their factory instead.
+    """
+    kind = slide_spec["type"]
+    proto = template.prototypes.get(kind)
+    args = {k: v for k, v in slide_spec.items() if k != "type"}
+    if proto is None:
+        return SLIDE_TYPES[kind][0](prs, **args)
+    args = {**proto.defaults, **args}
+    if kind == "stats" and len(args["stats"]) > MAX_STATS:
+        raise ValueError(f"stats slide {args['title']!r}: {len(args['stats'])} stats, at most {MAX_STATS} fit")
+    slot_of = {index: key for key, index in proto.slots.items()}
+    row_at = {first: key for key, (first, _, _, _) in proto.rows.items()}
+    skip = set()
+    for first, stride, _, count in proto.rows.values():
+        skip.update(range(first, first + stride * count))
+
+    # An image replaces its placeholder: the image_text box and the
+    # smallest shape framing it
+    image, frame = args.get("image"), None
+    if image and "image_text" in proto.slots:
+        text_index = proto.slots["image_text"]
+        x0, y0, x1, y1 = _box(proto.shapes[text_index])
+        boxes = {i: b for i, b in enumerate(map(_box, proto.shapes))
+                 if i != text_index and b and b[0] <= x0 and b[1] <= y0 and b[2] >= x1 and b[3] >= y1}
+        frame = min(boxes, key=lambda i: (boxes[i][2] - boxes[i][0]) * (boxes[i][3] - boxes[i][1]))
+        skip.update((text_index, frame))
+
+    slide = add_blank_slide(prs)
+    tree = slide.shapes._spTree
+    picture_at = None
+    for i, shape in enumerate(proto.shapes):
+        if i in row_at:
+            key = row_at[i]
+            highlight = set(args.get("highlight", ())) if key == "items" else None
+            for row_shape in _clone_rows(proto, key, args[key], highlight):
+                tree.append(row_shape)
+        if i == frame:
+            picture_at = len(tree)
+        if i in skip:
+            continue
+        key = slot_of.get(i)
+        if key is not None and not args.get(key):
+            continue  # optional argument left empty
+        shape = copy.deepcopy(shape)
+        if key is not None:
+            _set_shape_text(shape, args[key])
+        tree.append(shape)
+    if picture_at is not None:
+        left, top, right, bottom = _box(proto.shapes[frame])
+        picture = slide.shapes.add_picture(image, left, top, right - left, bottom - top)._element
+        tree.insert(picture_at, picture)
+    for shape_id, shape in enumerate(tree.iter_shape_elms(), 2):  # repeated rows carry duplicate ids
+        shape.find(".//" + qn("p:cNvPr")).set("id", str(shape_id))
+    return slide
+
+
+# ============================================================
+# DECK BUILDER
+# ============================================================
+
+def check_spec(spec, where="deck"):
+    """Raise ValueError for unknown slide types or missing/unknown arguments."""
+    if not isinstance(spec, dict) or not isinstance(spec.get("slides"), list):
+        raise ValueError(f"{where}: expected {{\"slides\": [...]}}")
+    for i, slide in enumerate(spec["slides"]):
+        kind = slide.get("type")
+        if kind not in SLIDE_TYPES:
+            raise ValueError(f"{where}: slide {i + 1} has unknown type {kind!r} "
+                             f"(expected one of {', '.join(SLIDE_TYPES)})")
+        factory, required = SLIDE_TYPES[kind]
+        missing = [k for k in required if k not in slide]
+        if missing:
+            raise ValueError(f"{where}: slide {i + 1} ({kind}) is missing {', '.join(missing)}")
+        allowed = set(inspect.signature(factory).parameters) - {"prs"}
+        unknown = sorted(set(slide) - allowed - {"type"})
+        if unknown:
+            raise ValueError(f"{where}: slide {i + 1} ({kind}) has unknown key(s) {', '.join(unknown)}")
+
+
+def build_deck(spec, prs=None, template=None):
+    """Append the spec's slides to prs (default: a new presentation) and return it.
+
+    By default every slide is drawn by its factory. With template (a
+    DeckTemplate or a template path, see load_template) the slides are
+    cloned from the template's prototypes instead, and a new presentation
+    starts from the template's masters and layouts.
+    """
+    check_spec(spec, spec.get("output", "deck") if isinstance(spec, dict) else "deck")
+    if template is None:
+        prs = prs or new_presentation()
+        for slide in spec["slides"]:
+            factory = SLIDE_TYPES[slide["type"]][0]
+            factory(prs, **{k: v for k, v in slide.items() if k != "type"})
+        return prs
+    if not isinstance(template, DeckTemplate):
+        template = load_template(template)
+    prs = prs or Presentation(io.BytesIO(template.base))
+    for slide in spec["slides"]:
+        clone_slide(prs, template, slide)
+    return prs
+
+
+def save_deck(spec, path, template=None):
+    """Build a deck from spec and save it to path; returns path."""
+    build_deck(spec, template=template).save(path)
+    return path
+
+
+def _save_job(job):
+    return save_deck(*job)
+
+
+def build_decks(specs, out_dir, jobs=1, template=None):
+    """Save every spec (each naming its file with "output") into out_dir.
+
+    specs may be any iterable; with jobs > 1 the decks are built across a
+    process pool. template clones the slides as in build_deck; workers
+    load it once each. Returns the saved paths in spec order.
+    """
+    if isinstance(template, DeckTemplate):
+        template = template.path  # workers get the path, not the parsed prototypes
+    os.makedirs(out_dir, exist_ok=True)
+    work = []
+    for n, spec in enumerate(specs, 1):
+        if not spec.get("output"):
+            raise ValueError(f"deck {n}: missing 'output'")
+        work.append((spec, os.path.join(out_dir, spec["output"]), template))
+    if jobs <= 1 or len(work) <= 1:
+        return [_save_job(w) for w in work]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(work))) as pool:
+        return list(pool.map(_save_job, work, chunksize=max(1, len(work) // (jobs * 4))))
+
+
+def load_specs(path):
+    """Deck specs from a .json file (one spec or a list) or a .jsonl file."""
+    with open(path, encoding="utf-8") as f:
+        if path.lower().endswith(".jsonl"):
+            return [json.loads(line) for line in f if line.strip()]
+        data = json.load(f)
+    return data if isinstance(data, list) else [data]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build branded decks from deck specs.")
+    parser.add_argument("specs", nargs="+", help="deck spec files (.json or .jsonl)")
+    parser.add_argument("--out-dir", default=SCRIPT_DIR, help="output directory (default: docs/exports)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count; 1 runs in-process)")
+    parser.add_argument("--clone", nargs="?", const=BRAND_TEMPLATE, metavar="TEMPLATE",
+                        help="clone slides from a designed template instead of drawing them "
+                             "(default: docs/brand-assets/RAV-Brand-Template.pptx)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    specs = [spec for path in args.specs for spec in load_specs(path)]
+    paths = build_decks(specs, args.out_dir, args.jobs, args.clone)
+    seconds = time.perf_counter() - start
+    print(f"Saved: {len(paths)} deck(s) into {args.out_dir} in {seconds:.2f}s "
+          f"({len(paths) / max(seconds, 1e-9):.1f} decks/s, jobs={args.jobs})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,582 @@
+"""
+Brand charts from tabular data: native PowerPoint charts for decks and
+chart images for .docx documents.
+Run: python docs/exports/charts.py CONTENT_NAME|CHARTS.json [...] [--out-dir DIR] [--jobs N]
+
+A chart is plain data:
+
+    {"kind": "column", "title": "...", "categories": ["A", "B"],
+     "series": [["Series name", [1, 2]], ...], "suffix": "%", "decimals": 0}
+
+kind is one of CHART_KINDS; title, suffix (appended to value labels) and
+decimals are optional. table_chart() builds a chart from a table's
+headers and rows, reading the leading number of each value cell
+("34% of all searches" -> 34).
+
+Rendered charts are cached in .export-cache/charts/ under a hash of the
+chart data, its size, the style (brand colors and this module's source),
+the fonts found on this machine and the Pillow, python-pptx and
+XlsxWriter versions: PNG images for documents (drawn with Pillow, which python-pptx
+already depends on), and for decks the chart part XML plus its embedded
+workbook, which python-pptx would otherwise regenerate with xlsxwriter
+for every chart. A re-export with unchanged data reuses the cached parts.
+
+render_images() renders many charts across a process pool. Run directly
+to pre-render the charts of content documents (see doc_content) or of
+.json files holding a list of charts, e.g. before a full export:
+
+    python docs/exports/charts.py status-report --jobs 4
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import math
+import os
+import re
+import sys
+import time
+from functools import lru_cache
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+
+# Pillow, python-pptx and python-docx are imported where charts are
+# drawn, so content validation and --help start without them
+
+CHART_CACHE_DIR = os.path.join(SCRIPT_DIR, ".export-cache", "charts")
+
+# kind -> python-pptx XL_CHART_TYPE member
+CHART_KINDS = {
+    "column": "COLUMN_CLUSTERED",
+    "bar": "BAR_CLUSTERED",
+    "line": "LINE_MARKERS",
+    "pie": "PIE",
+}
+CHART_KEYS = {"kind", "title", "categories", "series", "suffix", "decimals"}
+
+# Brand palette (see brand_docx / brand_pptx), in series order
+SERIES_COLORS = ("1C7268", "E8703A", "1D2E38", "8CC5BC", "6B7B85", "F0EBE3")
+TEXT_COLOR = "1D2E38"
+MUTED_COLOR = "6B7B85"
+GRID_COLOR = "E4E0DA"
+CHART_FONT = "Roboto"
+# Font files tried in order for images; Pillow's own font is the fallback
+FONT_FILES = {
+    False: ("Roboto-Regular.ttf", "DejaVuSans.ttf", "Arial.ttf"),
+    True: ("Roboto-Bold.ttf", "DejaVuSans-Bold.ttf", "Arial Bold.ttf"),
+}
+IMAGE_DPI = 200
+IMAGE_SIZE = (6.5, 3.2)  # inches: full text width of a branded document
+
+_NUMBER = re.compile(r"[-+−]?\d[\d,]*(?:\.\d+)?")
+
+
+# ============================================================
+# CHART DATA
+# ============================================================
+
+def check_chart(chart, where="chart"):
+    """Raise ValueError unless chart is a well-formed chart dict."""
+    if not isinstance(chart, dict):
+        raise ValueError(f"{where}: expected a chart object")
+    unknown = sorted(set(chart) - CHART_KEYS)
+    if unknown:
+        raise ValueError(f"{where}: unknown chart key(s) {', '.join(unknown)}")
+    kind = chart.get("kind", "column")
+    if kind not in CHART_KINDS:
+        raise ValueError(f"{where}: unknown chart kind {kind!r} (expected one of {', '.join(CHART_KINDS)})")
+    categories = chart.get("categories")
+    series = chart.get("series")
+    if not isinstance(categories, list) or not categories:
+        raise ValueError(f"{where}: chart needs a non-empty 'categories' list")
+    if not isinstance(series, list) or not series:
+        raise ValueError(f"{where}: chart needs a non-empty 'series' list of [name, values]")
+    if kind == "pie" and len(series) > 1:
+        raise ValueError(f"{where}: a pie chart shows one series, not {len(series)}")
+    for entry in series:
+        if not (isinstance(entry, list) and len(entry) == 2 and isinstance(entry[1], list)):
+            raise ValueError(f"{where}: series entries are [name, values], got {entry!r}")
+        name, values = entry
+        if len(values) != len(categories):
+            raise ValueError(f"{where}: series {name!r} has {len(values)} values for {len(categories)} categories")
+        if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+            raise ValueError(f"{where}: series {name!r} values must be numbers")
+
+
+def leading_number(text):
+    """The first number in a table cell ("21 (deployed)" -> 21, "+68" -> 68), or None."""
+    m = _NUMBER.search(str(text))
+    if m is None:
+        return None
+    value = float(m.group().replace(",", "").replace("−", "-"))
+    return int(value) if value.is_integer() else value
+
+
+def table_chart(headers, rows, kind="column", title=None, rows_used=None, label_column=0,
+                value_columns=(1,), suffix="", decimals=None):
+    """Chart of a table: one category per row, one series per value column.
+
+    rows_used picks rows by index (default: all); every picked value cell
+    must start with a number.
+    """
+    picked = [rows[i] for i in rows_used] if rows_used is not None else rows
+    chart = {
+        "kind": kind,
+        "categories": [str(row[label_column]) for row in picked],
+        "series": [],
+        "suffix": suffix,
+    }
+    for column in value_columns:
+        values = []
+        for row in picked:
+            value = leading_number(row[column])
+            if value is None:
+                raise ValueError(f"table row {row[label_column]!r}: {headers[column]} {row[column]!r} is not a number")
+            values.append(value)
+        chart["series"].append([headers[column], values])
+    if title:
+        chart["title"] = title
+    if decimals is not None:
+        chart["decimals"] = decimals
+    check_chart(chart)
+    return chart
+
+
+def format_value(chart, value):
+    decimals = chart.get("decimals")
+    if decimals is None:
+        decimals = 0 if all(float(v).is_integer() for _, vs in chart["series"] for v in vs) else 1
+    return f"{value:,.{decimals}f}{chart.get('suffix', '')}"
+
+
+def _number_format(chart):
+    decimals = chart.get("decimals")
+    digits = "0" if decimals is None else "0" + ("." + "0" * decimals if decimals else "")
+    suffix = chart.get("suffix", "")
+    return f'#,##{digits}"{suffix}"' if suffix else f"#,##{digits}"
+
+
+def _version(distribution):
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(distribution)
+    except PackageNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _style_fingerprint():
+    """Hash of everything besides the chart data that shows in a rendered chart."""
+    with open(os.path.abspath(__file__), "rb") as f:
+        digest = hashlib.sha256(f.read())
+    # Images are drawn with whichever font is installed (see _font)
+    fonts = [(_font_file(bold), _font(10, bold).getname()) for bold in (False, True)]
+    versions = [_version(name) for name in ("Pillow", "python-pptx", "XlsxWriter")]
+    digest.update(repr((fonts, versions)).encode())
+    return digest.hexdigest()
+
+
+def chart_key(chart, target, *size):
+    """Cache key for a chart rendered for target ("png" or "pptx") at size."""
+    data = json.dumps([chart, target, size], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(f"{_style_fingerprint()}\0{data}".encode()).hexdigest()
+
+
+def _cache_path(key, ext):
+    return os.path.join(CHART_CACHE_DIR, f"{key}.{ext}")
+
+
+def _store(path, data):
+    os.makedirs(CHART_CACHE_DIR, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"  # parallel renders of one chart may race
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+# ============================================================
+# IMAGES
+# ============================================================
+
+@lru_cache(maxsize=None)
+def _font_file(bold=False):
+    """The first of FONT_FILES[bold] installed here, or None for Pillow's default font."""
+    from PIL import ImageFont
+
+    for name in FONT_FILES[bold]:
+        try:
+            ImageFont.truetype(name, 10)
+        except OSError:
+            continue
+        return name
+    return None
+
+
+@lru_cache(maxsize=None)
+def _font(size, bold=False):
+    from PIL import ImageFont
+
+    name = _font_file(bold)
+    return ImageFont.truetype(name, size) if name else ImageFont.load_default(size)
+
+
+def _rgb(hex_color):
+    return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def _nice_step(span, ticks=5):
+    raw = span / ticks
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for m in (1, 2, 2.5, 5, 10):
+        if m * magnitude >= raw:
+            return m * magnitude
+
+
+def _fit(draw, text, font, width):
+    """text cut down with an ellipsis to fit width pixels."""
+    if draw.textlength(text, font=font) <= width:
+        return text
+    while text and draw.textlength(text + "…", font=font) > width:
+        text = text[:-1]
+    return text + "…"
+
+
+def _wrap(draw, text, font, width, lines=2):
+    out, line = [], ""
+    for word in text.split():
+        candidate = f"{line} {word}".strip()
+        if line and draw.textlength(candidate, font=font) > width:
+            out.append(line)
+            line = word
+        else:
+            line = candidate
+    out.append(line)
+    if len(out) > lines:
+        out = out[:lines - 1] + [" ".join(out[lines - 1:])]
+    return [_fit(draw, part, font, width) for part in out]
+
+
+def render_png(chart, width, height):
+    """PNG bytes of chart drawn at width x height pixels."""
+    from PIL import Image, ImageDraw
+
+    kind = chart.get("kind", "column")
+    unit = height / 100  # type sizes scale with the image
+    text, muted, grid = _rgb(TEXT_COLOR), _rgb(MUTED_COLOR), _rgb(GRID_COLOR)
+    label_font, value_font = _font(round(3.6 * unit)), _font(round(3.6 * unit), True)
+    image = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(image)
+    pad = round(3 * unit)
+    top, bottom = pad, height - pad
+    if chart.get("title"):
+        title_font = _font(round(5 * unit), True)
+        draw.text((width / 2, top), chart["title"], font=title_font, fill=text, anchor="mt")
+        top += round(8 * unit)
+    series = chart["series"]
+    categories = chart["categories"]
+
+    legend = [(name, SERIES_COLORS[i % len(SERIES_COLORS)]) for i, (name, _) in enumerate(series)]
+    if kind == "pie":
+        legend = [(f"{c}  {format_value(chart, v)}", SERIES_COLORS[i % len(SERIES_COLORS)])
+                  for i, (c, v) in enumerate(zip(categories, series[0][1]))]
+    if kind != "pie" and len(series) > 1:  # one row of swatches under the plot
+        x = pad
+        for name, color in legend:
+            draw.rectangle((x, bottom - 3 * unit, x + 3 * unit, bottom), fill=_rgb(color))
+            draw.text((x + 4.5 * unit, bottom), name, font=label_font, fill=text, anchor="ls")
+            x += 9 * unit + draw.textlength(name, font=label_font)
+        bottom -= round(7 * unit)
+
+    if kind == "pie":
+        values = series[0][1]
+        total = sum(values) or 1
+        size = min(bottom - top, width * 0.5)
+        box = (pad, top, pad + size, top + size)
+        angle = -90.0
+        for value, (_, color) in zip(values, legend):
+            sweep = 360 * value / total
+            draw.pieslice(box, angle, angle + sweep, fill=_rgb(color), outline="white", width=max(1, round(unit / 2)))
+            angle += sweep
+        x = pad * 2 + size
+        y = top + (size - len(legend) * 6 * unit) / 2
+        for name, color in legend:
+            draw.rectangle((x, y, x + 3 * unit, y + 3 * unit), fill=_rgb(color))
+            draw.text((x + 4.5 * unit, y + 3 * unit), _fit(draw, name, label_font, width - x - 6 * unit),
+                      font=label_font, fill=text, anchor="ls")
+            y += 6 * unit
+        return _png_bytes(image)
+
+    values = [v for _, vs in series for v in vs]
+    low = min(0, min(values))
+    step = _nice_step(max(max(values), 0) - low or 1)
+    low = math.floor(low / step) * step
+    high = max(math.ceil(max(values) / step) * step, low + step)
+    if kind == "bar":
+        label_width = min(width * 0.35, max(draw.textlength(str(c), font=label_font) for c in categories) + pad)
+        left, right = pad + label_width, width - pad - 10 * unit
+        scale = (right - left) / (high - low)
+        slot = (bottom - top) / len(categories)
+        bar = slot * 0.7 / len(series)
+        for i, category in enumerate(categories):
+            y0 = top + i * slot + slot * 0.15
+            draw.text((left - pad / 2, y0 + slot * 0.35), _fit(draw, str(category), label_font, label_width - pad),
+                      font=label_font, fill=text, anchor="rm")
+            for j, (_, vs) in enumerate(series):
+                x0, x1 = left + (0 - low) * scale, left + (vs[i] - low) * scale
+                y = y0 + j * bar
+                draw.rectangle((min(x0, x1), y, max(x0, x1), y + bar * 0.9), fill=_rgb(legend[j][1]))
+                draw.text((max(x0, x1) + unit, y + bar * 0.45), format_value(chart, vs[i]),
+                          font=value_font, fill=text, anchor="lm")
+        return _png_bytes(image)
+
+    # column and line: value axis on the left, categories along the bottom
+    tick_chart = {**chart, "decimals": 0 if float(step).is_integer() else 1}
+    tick_labels = []
+    tick = low
+    while tick <= high + step / 2:
+        tick_labels.append((tick, format_value(tick_chart, tick)))
+        tick += step
+    left = pad + max(draw.textlength(t, font=label_font) for _, t in tick_labels) + unit
+    right = width - pad
+    axis_bottom = bottom - round(9 * unit)  # two lines of category labels
+    scale = (axis_bottom - top - 4 * unit) / (high - low)
+
+    def y_of(v):
+        return axis_bottom - (v - low) * scale
+    for tick, label in tick_labels:
+        y = y_of(tick)
+        draw.line((left, y, right, y), fill=grid, width=max(1, round(unit / 4)))
+        draw.text((left - unit, y), label, font=label_font, fill=muted, anchor="rm")
+    slot = (right - left) / len(categories)
+    for i, category in enumerate(categories):
+        for n, line in enumerate(_wrap(draw, str(category), label_font, slot * 0.95)):
+            draw.text((left + slot * (i + 0.5), axis_bottom + unit + n * 4.2 * unit), line,
+                      font=label_font, fill=text, anchor="ma")
+    if kind == "column":
+        bar = slot * 0.7 / len(series)
+        for j, (_, vs) in enumerate(series):
+            for i, value in enumerate(vs):
+                x = left + slot * i + slot * 0.15 + j * bar
+                y0, y1 = y_of(0), y_of(value)
+                draw.rectangle((x, min(y0, y1), x + bar * 0.9, max(y0, y1)), fill=_rgb(legend[j][1]))
+                if value >= 0:
+                    draw.text((x + bar * 0.45, y1 - unit), format_value(chart, value),
+                              font=value_font, fill=text, anchor="mb")
+                else:  # under the bar
+                    draw.text((x + bar * 0.45, y1 + unit), format_value(chart, value),
+                              font=value_font, fill=text, anchor="mt")
+    else:
+        radius = 1.2 * unit
+        for j, (_, vs) in enumerate(series):
+            color = _rgb(legend[j][1])
+            points = [(left + slot * (i + 0.5), y_of(v)) for i, v in enumerate(vs)]
+            draw.line(points, fill=color, width=max(2, round(unit * 0.8)), joint="curve")
+            for (x, y), value in zip(points, vs):
+                draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=color)
+                draw.text((x, y - 2 * radius), format_value(chart, value), font=value_font, fill=text, anchor="mb")
+    draw.line((left, y_of(0), right, y_of(0)), fill=muted, width=max(1, round(unit / 3)))
+    return _png_bytes(image)
+
+
+def _png_bytes(image):
+    buf = io.BytesIO()
+    image.save(buf, "PNG")
+    return buf.getvalue()
+
+
+def _image_cache_path(chart, size):
+    width, height = round(size[0] * IMAGE_DPI), round(size[1] * IMAGE_DPI)
+    return _cache_path(chart_key(chart, "png", width, height), "png"), width, height
+
+
+def image_path(chart, size=IMAGE_SIZE):
+    """Path of the cached PNG for chart at size (inches), rendering it on a miss."""
+    path, width, height = _image_cache_path(chart, size)
+    if not os.path.exists(path):
+        _store(path, render_png(chart, width, height))
+    return path
+
+
+def add_chart_image(doc, chart, size=IMAGE_SIZE):
+    """Append chart as a centered picture paragraph (either docx backend)."""
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Inches
+
+    # Built from add_paragraph rather than doc.add_picture/doc.paragraphs,
+    # which the streaming backend (ooxml_stream) does not have
+    paragraph = doc.add_paragraph()
+    paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    paragraph.add_run().add_picture(image_path(chart, size), width=Inches(size[0]))
+    return paragraph
+
+
+def _render_image(job):
+    chart, size = job
+    return image_path(chart, size)
+
+
+def render_images(charts, jobs=1, size=IMAGE_SIZE):
+    """Cached PNG paths for many charts; misses render across a process pool with jobs > 1."""
+    work = [(chart, size) for chart in charts]
+    missing = [w for w in work if not os.path.exists(_image_cache_path(*w)[0])]
+    if jobs > 1 and len(missing) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(missing))) as pool:
+            list(pool.map(_render_image, missing, chunksize=max(1, len(missing) // (jobs * 4))))
+    return [_render_image(w) for w in work]
+
+
+# ============================================================
+# NATIVE PPTX CHARTS
+# ============================================================
+
+def _chart_data(chart):
+    from pptx.chart.data import CategoryChartData
+
+    data = CategoryChartData(number_format=_number_format(chart))
+    data.categories = [str(c) for c in chart["categories"]]
+    for name, values in chart["series"]:
+        data.add_series(name, values)
+    return data
+
+
+def _style_native(graph, chart):
+    from pptx.dml.color import RGBColor
+    from pptx.enum.chart import XL_LEGEND_POSITION
+    from pptx.util import Pt
+
+    kind = chart.get("kind", "column")
+    graph.font.name = CHART_FONT
+    graph.font.size = Pt(12)
+    graph.font.color.rgb = RGBColor.from_string(TEXT_COLOR)
+    graph.has_title = bool(chart.get("title"))
+    if graph.has_title:
+        graph.chart_title.text_frame.text = chart["title"]
+        title_font = graph.chart_title.text_frame.paragraphs[0].font
+        title_font.size = Pt(16)
+        title_font.bold = True
+    graph.has_legend = kind == "pie" or len(chart["series"]) > 1
+    if graph.has_legend:
+        graph.legend.position = XL_LEGEND_POSITION.RIGHT if kind == "pie" else XL_LEGEND_POSITION.BOTTOM
+        graph.legend.include_in_layout = False
+    plot = graph.plots[0]
+    plot.has_data_labels = True
+    plot.data_labels.number_format = _number_format(chart)
+    plot.data_labels.number_format_is_linked = False
+    plot.data_labels.font.bold = True
+    if kind == "pie":
+        for i, point in enumerate(plot.series[0].points):
+            point.format.fill.solid()
+            point.format.fill.fore_color.rgb = RGBColor.from_string(SERIES_COLORS[i % len(SERIES_COLORS)])
+        return
+    if kind in ("column", "bar"):
+        plot.gap_width = 60
+    axis = graph.value_axis
+    axis.has_major_gridlines = True
+    axis.major_gridlines.format.line.color.rgb = RGBColor.from_string(GRID_COLOR)
+    axis.format.line.fill.background()
+    axis.tick_labels.font.color.rgb = RGBColor.from_string(MUTED_COLOR)
+    for i, series in enumerate(plot.series):
+        color = RGBColor.from_string(SERIES_COLORS[i % len(SERIES_COLORS)])
+        if kind == "line":
+            series.format.line.color.rgb = color
+            series.format.line.width = Pt(2.5)
+            series.marker.format.fill.solid()
+            series.marker.format.fill.fore_color.rgb = color
+        else:
+            series.format.fill.solid()
+            series.format.fill.fore_color.rgb = color
+
+
+def chart_parts(chart):
+    """(chart part XML, embedded workbook) bytes for chart, cached by chart_key."""
+    check_chart(chart)
+    key = chart_key(chart, "pptx")
+    xml_path, xlsx_path = _cache_path(key, "chart.xml"), _cache_path(key, "xlsx")
+    if os.path.exists(xml_path) and os.path.exists(xlsx_path):
+        with open(xml_path, "rb") as f, open(xlsx_path, "rb") as g:
+            return f.read(), g.read()
+    from pptx import Presentation
+    from pptx.enum.chart import XL_CHART_TYPE
+    from pptx.parts.chart import ChartPart
+
+    package = Presentation().part.package  # scratch package the parts are drawn in
+    part = ChartPart.new(getattr(XL_CHART_TYPE, CHART_KINDS[chart.get("kind", "column")]),
+                         _chart_data(chart), package)
+    _style_native(part.chart, chart)
+    xml, xlsx = part.blob, part.chart_workbook.xlsx_part.blob
+    _store(xlsx_path, xlsx)
+    _store(xml_path, xml)
+    return xml, xlsx
+
+
+def add_native_chart(slide, chart, left, top, width, height):
+    """Add chart to a python-pptx slide as a native (editable) chart; returns its graphic frame."""
+    from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+    from pptx.parts.chart import ChartPart
+    from pptx.parts.embeddedpackage import EmbeddedXlsxPart
+
+    xml, xlsx = chart_parts(chart)
+    package = slide.part.package
+    part = ChartPart.load(package.next_partname(ChartPart.partname_template), CT.DML_CHART, package, xml)
+    part.chart_workbook.xlsx_part = EmbeddedXlsxPart.new(xlsx, package)
+    r_id = slide.part.relate_to(part, RT.CHART)
+    return slide.shapes._add_chart_graphicFrame(r_id, left, top, width, height)
+
+
+# ============================================================
+# BATCH
+# ============================================================
+
+def content_charts(name):
+    """Every chart in content/<name>.json (chart blocks and charted tables)."""
+    import doc_content
+
+    content = doc_content.load(name)
+    blocks = list(content["blocks"])
+    for section in content["sections"]:
+        blocks.extend(section.get("blocks", ()))
+    charts = (doc_content.block_chart(block) for block in blocks)
+    return [chart for chart in charts if chart is not None]
+
+
+def load_charts(source):
+    """Charts from a .json file (one chart or a list) or a content document name."""
+    if not source.lower().endswith(".json"):
+        return content_charts(source)
+    with open(source, encoding="utf-8") as f:
+        data = json.load(f)
+    charts = data if isinstance(data, list) else [data]
+    for i, chart in enumerate(charts, 1):
+        check_chart(chart, f"{source}: chart {i}")
+    return charts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-render brand chart images into the chart cache.")
+    parser.add_argument("sources", nargs="+", help="content document names (e.g. status-report) or chart .json files")
+    parser.add_argument("--out-dir", help="also copy the images here as chart-N.png")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count; 1 runs in-process)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    charts = [chart for source in args.sources for chart in load_charts(source)]
+    paths = render_images(charts, args.jobs)
+    if args.out_dir:
+        import shutil
+
+        os.makedirs(args.out_dir, exist_ok=True)
+        for n, path in enumerate(paths, 1):
+            shutil.copyfile(path, os.path.join(args.out_dir, f"chart-{n}.png"))
+    seconds = time.perf_counter() - start
+    print(f"Rendered: {len(paths)} chart(s) in {seconds:.2f}s (jobs={args.jobs}); cache: {CHART_CACHE_DIR}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
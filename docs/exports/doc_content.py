@@ -0,0 +1,618 @@
+"""
+Structured content for the branded .docx documents, and its renderer.
+
+Each document lives in content/<name>.json:
+
+    {"title": ..., "output": "<file name>", "blocks": [...],
+     "sections": [{"heading": ..., "blocks": [...]}, ...], "footer": ...,
+     "page_footer": "{classification} | Page {PAGE} of {NUMPAGES}"}
+
+"blocks" before the first section is the preamble (metadata line etc.);
+each section opens with a level-1 heading. Block types are listed in
+BLOCK_FIELDS. Any string may contain "{today:<strftime format>}", which
+is filled in with the render date. "page_footer" (optional) replaces the
+"Page X of Y" page footer; its {name}s are Word fields or the title and
+metadata values (see brand_docx.footer_values).
+
+content/shared.json holds what several documents repeat: "facts"
+(resort counts, the base commission, ...) substituted for "{fact:<name>}"
+at compile time, and named "blocks" (the deployment status table) that
+documents include with {"type": "shared", "name": ...}. A shared block is
+rendered once into a cached fragment and spliced into every document
+that uses it. Only content worded identically in every document belongs
+there; a block whose wording differs between documents stays inline.
+
+Parsing and validating the JSON is done once per content change: the
+compiled document is kept as marshal data in .export-cache/content/,
+keyed by the JSON file's mtime and size and, when those change, by its
+SHA-256 (so a touch or checkout does not force a recompile). The compiled
+form carries a digest per section, which changed_sections() compares
+against the digests recorded at the last render.
+
+Each section's rendered XML is cached by fragment_cache under a key made
+from its content, so a rebuild renders only the changed sections and
+splices the others in. Sections with a chart (a chart block or a table
+with a "chart" option, see charts.py) are rendered every time, as a
+fragment cannot carry the image part; the images come from the chart
+cache. Run directly to render with a report of rendered vs cached
+sections, or a subset of sections:
+
+    python docs/exports/doc_content.py status-report --sections 10 "Deployment"
+    python docs/exports/doc_content.py --changed
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import re
+import sys
+from datetime import datetime
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+
+import brand_docx
+import charts
+import fragment_cache
+import profiling
+from brand_docx import (
+    new_branded_doc,
+    add_metadata,
+    add_body,
+    add_blockquote,
+    add_table_from_data,
+    add_horizontal_rule,
+    add_footer,
+    add_bullet_list,
+    add_numbered_list,
+    add_page_numbers,
+    footer_values,
+    BRAND_FONT,
+    WARM_CORAL,
+    DARK_NAVY,
+)
+from docx.shared import Pt, RGBColor
+from xml_fragments import FOOTER_FIELDS, footer_slots
+
+CONTENT_DIR = os.path.join(SCRIPT_DIR, "content")
+CONTENT_CACHE_DIR = os.path.join(brand_docx.BRAND_CACHE_DIR, "content")
+# Bump when the compiled layout changes
+CACHE_VERSION = 2
+
+# Block type -> required fields
+BLOCK_FIELDS = {
+    "heading": ("text", "level"),            # level 2/3 heading
+    "body": ("text",),                       # + bold, italic, size, color
+    "spacer": (),                            # empty paragraph
+    "rule": (),
+    "metadata": ("items",),                  # [key, value] pairs
+    "table": ("headers", "rows"),            # + chart (see TABLE_CHART_OPTIONS)
+    "chart": ("categories", "series"),       # + kind, title, suffix, decimals (see charts)
+    "quote": ("text",),
+    "bullets": ("items",),                   # brand bullet list
+    "numbered": ("items",),                  # brand numbered list
+    "list_bullets": ("items",),              # Word "List Bullet"; item or [label, desc]
+    "labeled": ("items",),                   # [label, desc] paragraphs
+    "numbered_text": ("items",),             # "1. item" paragraphs
+    "phases": ("items",),                    # {name, date, text, impact?}
+    "shared": ("name",),                     # named block from content/shared.json
+}
+BODY_OPTIONS = ("bold", "italic", "size", "color")
+# A table's "chart" charts its rows: "rows" picks row indexes (default
+# all), the other options are charts.table_chart()'s
+TABLE_CHART_OPTIONS = ("kind", "title", "rows", "label_column", "value_columns", "suffix", "decimals")
+COLOR_NAMES = ("DEEP_TEAL", "WARM_CORAL", "DARK_NAVY", "LIGHT_BG", "WHITE", "QUOTE_GRAY", "MUTED_GRAY")
+PHASE_DATE_GRAY = RGBColor(0x66, 0x66, 0x66)
+
+SHARED = "shared"
+
+_TODAY = re.compile(r"\{today:([^}]*)\}")
+_FACT = re.compile(r"\{fact:([^}]*)\}")
+_HEX = re.compile(r"[0-9A-Fa-f]{6}")
+
+
+# ============================================================
+# LOADING
+# ============================================================
+
+def content_path(name):
+    return os.path.join(CONTENT_DIR, f"{name}.json")
+
+
+def _digest(value):
+    data = json.dumps(value, sort_keys=True, ensure_ascii=False).encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+def _check_block(block, where, shared_blocks):
+    kind = block.get("type")
+    if kind not in BLOCK_FIELDS:
+        raise ValueError(f"{where}: unknown block type {kind!r}")
+    for field in BLOCK_FIELDS[kind]:
+        if field not in block:
+            raise ValueError(f"{where}: {kind} block needs {field!r}")
+    if kind == "shared":
+        if block["name"] not in shared_blocks:
+            raise ValueError(f"{where}: no shared block {block['name']!r} in {content_path(SHARED)}")
+        # Inline the definition so section digests follow shared edits
+        block["block"] = shared_blocks[block["name"]]
+    if kind == "chart" or (kind == "table" and "chart" in block):
+        extra = set(block.get("chart", {})) - set(TABLE_CHART_OPTIONS) if kind == "table" else ()
+        if extra:
+            raise ValueError(f"{where}: unknown table chart options {sorted(extra)}")
+        try:
+            chart = block_chart(block)
+        except (IndexError, TypeError) as e:
+            raise ValueError(f"{where}: chart does not fit the table ({e})") from None
+        except ValueError as e:
+            raise ValueError(f"{where}: {e}") from None
+        charts.check_chart(chart, f"{where}: chart")
+    if kind == "body":
+        extra = set(block) - {"type", "text", *BODY_OPTIONS}
+        if extra:
+            raise ValueError(f"{where}: unknown body options {sorted(extra)}")
+        color = block.get("color")
+        if color is not None and color not in COLOR_NAMES and not _HEX.fullmatch(color):
+            raise ValueError(f"{where}: color {color!r} is neither a brand color nor RRGGBB")
+
+
+def _expand_facts(value, facts, where):
+    """Replace {fact:<name>} placeholders with values from shared.json."""
+    if isinstance(value, str):
+        if "{fact:" not in value:
+            return value
+
+        def fact(m):
+            if m.group(1) not in facts:
+                raise ValueError(f"{where}: unknown fact {m.group(1)!r}")
+            return facts[m.group(1)]
+        return _FACT.sub(fact, value)
+    if isinstance(value, list):
+        return [_expand_facts(v, facts, where) for v in value]
+    if isinstance(value, dict):
+        return {k: _expand_facts(v, facts, where) for k, v in value.items()}
+    return value
+
+
+def _parse(raw, path):
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"{path}: {e}") from None
+
+
+def compile_shared(raw):
+    """Facts and validated named blocks from shared.json's bytes."""
+    path = content_path(SHARED)
+    shared = _parse(raw, path) if raw is not None else {}
+    facts = shared.get("facts", {})
+    blocks = _expand_facts(shared.get("blocks", {}), facts, path)
+    for name, block in blocks.items():
+        if block.get("type") == "shared":
+            raise ValueError(f"{path}: shared block {name!r} cannot itself be shared")
+        if block.get("type") == "chart" or "chart" in block:
+            # Shared blocks are spliced as fragments, which cannot carry images
+            raise ValueError(f"{path}: shared block {name!r} cannot hold a chart")
+        _check_block(block, f"{path}: shared block {name!r}", blocks)
+    return facts, blocks
+
+
+def _metadata_pairs(content):
+    return [pair for block in content["blocks"] if block["type"] == "metadata" for pair in block["items"]]
+
+
+def _check_page_footer(content, path):
+    values = footer_values(content["title"], _metadata_pairs(content))
+    for name in footer_slots(content["page_footer"]):
+        if name not in FOOTER_FIELDS and name not in values:
+            raise ValueError(f"{path}: page_footer uses {{{name}}}, which is neither a field "
+                             f"nor one of {sorted(values)}")
+
+
+def compile_content(name, raw, shared_raw=None):
+    """Parse and validate a content file's bytes into the cached form."""
+    path = content_path(name)
+    facts, shared_blocks = compile_shared(shared_raw)
+    content = _expand_facts(_parse(raw, path), facts, path)
+    for key in ("title", "output", "sections"):
+        if key not in content:
+            raise ValueError(f"{path}: missing {key!r}")
+    content.setdefault("blocks", [])
+    content.setdefault("footer", None)
+    for j, block in enumerate(content["blocks"]):
+        _check_block(block, f"{path}: preamble block {j}", shared_blocks)
+    for i, section in enumerate(content["sections"]):
+        if "heading" not in section:
+            raise ValueError(f"{path}: section {i} has no heading")
+        for j, block in enumerate(section.get("blocks", [])):
+            _check_block(block, f"{path}: section {i} ({section['heading']}) block {j}", shared_blocks)
+    if content.get("page_footer"):
+        _check_page_footer(content, path)
+    content["digests"] = section_digests(content)
+    content["dated"] = bool(_TODAY.search(json.dumps(content, ensure_ascii=False)))
+    return content
+
+
+def section_digests(content):
+    """{section heading: digest}, plus "(preamble)" and "(footer)"."""
+    digests = {"(preamble)": _digest([content["title"], content["blocks"]])}
+    for section in content["sections"]:
+        digests[section["heading"]] = _digest(section)
+    digests["(footer)"] = _digest(content["footer"])
+    return digests
+
+
+def _cache_path(name):
+    return os.path.join(CONTENT_CACHE_DIR, f"{name}.marshal")
+
+
+def _read_cache(name):
+    try:
+        # marshal.load() on a file object reads it in small pieces; one
+        # read() and loads() is several times faster
+        with open(_cache_path(name), "rb") as f:
+            entry = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(entry, dict) or entry.get("version") != (CACHE_VERSION, marshal.version):
+        return None
+    return entry
+
+
+def _write_cache(name, entry):
+    path = _cache_path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)  # names may be "merge/<name>"
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(marshal.dumps(entry))
+    os.replace(tmp, path)
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def load(name):
+    """Compiled content for content/<name>.json, recompiling only on change.
+
+    The compiled form also depends on shared.json (facts and shared
+    blocks are inlined), so both files' stamps and hashes are checked.
+    """
+    path = content_path(name)
+    stamp = (_stat(path), _stat(content_path(SHARED)))
+    if stamp[0] is None:
+        raise FileNotFoundError(path)
+    entry = _read_cache(name)
+    if entry is not None and entry["stamp"] == stamp:
+        return entry["content"]
+    raw = _read(path)
+    shared_raw = _read(content_path(SHARED))
+    sha = hashlib.sha256(raw + b"\0" + (shared_raw or b"")).hexdigest()
+    if entry is None or entry["sha256"] != sha:
+        entry = {"version": (CACHE_VERSION, marshal.version), "sha256": sha,
+                 "content": compile_content(name, raw, shared_raw)}
+    entry["stamp"] = stamp
+    _write_cache(name, entry)
+    return entry["content"]
+
+
+# ============================================================
+# CHANGE DETECTION
+# ============================================================
+
+def _built_path(name):
+    return os.path.join(CONTENT_CACHE_DIR, f"{name}.built.json")
+
+
+def changed_sections(name):
+    """Sections whose content changed since the last render_document(name)."""
+    digests = load(name)["digests"]
+    try:
+        with open(_built_path(name), encoding="utf-8") as f:
+            built = json.load(f)
+    except (OSError, ValueError):
+        built = {}
+    return [heading for heading, digest in digests.items() if built.get(heading) != digest]
+
+
+def _record_built(name, digests):
+    path = _built_path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(digests, f, indent=2, ensure_ascii=False)
+
+
+# ============================================================
+# RENDERING
+# ============================================================
+
+def fill_dates(value, today):
+    """Expand {today:<format>} placeholders in every string of value."""
+    if isinstance(value, str):
+        return _TODAY.sub(lambda m: today.strftime(m.group(1)), value) if "{today:" in value else value
+    if isinstance(value, list):
+        return [fill_dates(v, today) for v in value]
+    if isinstance(value, dict):
+        return {k: fill_dates(v, today) for k, v in value.items()}
+    return value
+
+
+def _color(value):
+    if value in COLOR_NAMES:
+        return getattr(brand_docx, value)
+    return RGBColor.from_string(value.upper())
+
+
+def _font(run, size=10):
+    run.font.name = BRAND_FONT
+    run.font.size = Pt(size)
+    return run
+
+
+def _label_paragraph(p, label, desc):
+    _font(p.add_run(label)).font.bold = True
+    _font(p.add_run(desc))
+
+
+def render_heading(doc, block):
+    doc.add_heading(block["text"], level=block["level"])
+
+
+def render_body(doc, block):
+    color = block.get("color")
+    add_body(doc, block["text"], bold=block.get("bold", False), italic=block.get("italic", False),
+             size=block.get("size", 10), color=_color(color) if color else None)
+
+
+def render_list_bullets(doc, block):
+    for item in block["items"]:
+        if isinstance(item, list):
+            _label_paragraph(doc.add_paragraph(style="List Bullet"), *item)
+        else:
+            for run in doc.add_paragraph(item, style="List Bullet").runs:
+                _font(run)
+
+
+def render_labeled(doc, block):
+    for label, desc in block["items"]:
+        _label_paragraph(doc.add_paragraph(), label, desc)
+
+
+def render_numbered_text(doc, block):
+    for i, item in enumerate(block["items"], 1):
+        for run in doc.add_paragraph(f"{i}. {item}").runs:
+            _font(run)
+
+
+def render_phases(doc, block):
+    for phase in block["items"]:
+        doc.add_heading(phase["name"], level=3)
+        run = _font(doc.add_paragraph().add_run(f"Completed: {phase['date']}"), 9)
+        run.font.italic = True
+        run.font.color.rgb = PHASE_DATE_GRAY
+        add_body(doc, phase["text"])
+        if phase.get("impact"):
+            p = doc.add_paragraph()
+            label = _font(p.add_run("Impact (PROJECTED): "), 9)
+            label.font.bold = True
+            label.font.color.rgb = WARM_CORAL
+            _font(p.add_run(phase["impact"]), 9).font.color.rgb = DARK_NAVY
+
+
+def block_chart(block):
+    """The chart a block draws (a chart block or a charted table), or None."""
+    if block["type"] == "chart":
+        return {k: v for k, v in block.items() if k != "type"}
+    if block["type"] == "table" and "chart" in block:
+        options = dict(block["chart"])
+        return charts.table_chart(block["headers"], block["rows"], rows_used=options.pop("rows", None), **options)
+    return None
+
+
+def render_table(doc, block):
+    add_table_from_data(doc, block["headers"], block["rows"])
+    if "chart" in block:
+        charts.add_chart_image(doc, block_chart(block))
+
+
+def _has_chart(section):
+    return any(block_chart(block) is not None for block in section.get("blocks", ()))
+
+
+# Rendered shared blocks for this process, by fragment key
+_shared_xml = {}
+
+
+def render_shared(doc, block):
+    """Splice a shared block's fragment, rendering it once per process at most.
+
+    Keys cover the block's content and the renderer sources, so a cached
+    fragment can be reused across documents, processes and runs.
+    """
+    key = fragment_cache.fragment_key("shared-block", _digest(block["block"]), *_renderer_fingerprint())
+    xml = _shared_xml.get(key)
+    if xml is None:
+        entry = fragment_cache.load(key)
+        if entry is None:
+            xml = fragment_cache.render_into(doc, lambda d: render_blocks(d, [block["block"]]))
+            fragment_cache.store(key, {"xml": xml})
+            _shared_xml[key] = xml
+            return
+        xml = _shared_xml[key] = entry["xml"]
+    fragment_cache.splice(doc, xml)
+
+
+RENDERERS = {
+    "heading": render_heading,
+    "body": render_body,
+    "spacer": lambda doc, block: doc.add_paragraph(),
+    "rule": lambda doc, block: add_horizontal_rule(doc),
+    "metadata": lambda doc, block: add_metadata(doc, block["items"]),
+    "table": render_table,
+    "chart": lambda doc, block: charts.add_chart_image(doc, block_chart(block)),
+    "quote": lambda doc, block: add_blockquote(doc, block["text"]),
+    "bullets": lambda doc, block: add_bullet_list(doc, block["items"]),
+    "numbered": lambda doc, block: add_numbered_list(doc, block["items"]),
+    "list_bullets": render_list_bullets,
+    "labeled": render_labeled,
+    "numbered_text": render_numbered_text,
+    "phases": render_phases,
+    "shared": render_shared,
+}
+
+
+def render_blocks(doc, blocks):
+    for block in blocks:
+        RENDERERS[block["type"]](doc, block)
+
+
+def render_section(doc, section):
+    doc.add_heading(section["heading"], level=1)
+    render_blocks(doc, section.get("blocks", ()))
+
+
+# ============================================================
+# SECTION FRAGMENTS
+# ============================================================
+# Each level-1 section is rendered on its own into a scratch branded
+# document and cached as an XML fragment (see fragment_cache) keyed by the
+# section's content, the renderer's sources (this module and every helper
+# module it imports) and the rendering switches, so a rebuild re-renders
+# only the sections that changed and splices the rest from the cache.
+
+def _renderer_fingerprint():
+    # The switches are read per call: callers may change them at run time
+    return fragment_cache.source_fingerprint(__file__), brand_docx.TABLE_STYLE_MODE, brand_docx.DOCX_BACKEND
+
+
+def section_key(name, digest):
+    return fragment_cache.fragment_key("doc-section", name, digest, *_renderer_fingerprint())
+
+
+def select_sections(content, selectors):
+    """Sections matching any selector: a heading, its number ("10") or a substring.
+
+    A numeric selector matches only the section number. Otherwise an exact
+    heading wins; a substring match is tried only when no heading matches.
+    """
+    chosen = []
+    for selector in selectors:
+        wanted = selector.strip().rstrip(".").lower()
+        if wanted.isdigit():
+            matches = [s for s in content["sections"]
+                       if s["heading"].split(" ", 1)[0].rstrip(".").lower() == wanted]
+        else:
+            matches = [s for s in content["sections"] if s["heading"].lower() == wanted]
+            if not matches:
+                matches = [s for s in content["sections"] if wanted in s["heading"].lower()]
+        if not matches:
+            raise ValueError(f"no section matches {selector!r}")
+        chosen.extend(s for s in matches if s not in chosen)
+    return [s for s in content["sections"] if s in chosen]
+
+
+def build_document(name, output_path, sections=None, force=False, today=None):
+    """Render content/<name>.json to output_path; returns (path, rendered, cached).
+
+    sections limits the document to the selected sections (see
+    select_sections); force re-renders every section fragment (shared
+    blocks are still spliced from their cached fragments).
+    """
+    content = load(name)
+    if content["dated"]:
+        content = fill_dates(content, today or datetime.now())
+    chosen = content["sections"] if sections is None else select_sections(content, sections)
+
+    doc = new_branded_doc(doc_title=content["title"])
+    if content.get("page_footer"):
+        add_page_numbers(doc, content["page_footer"], footer_values(content["title"], _metadata_pairs(content)))
+    render_blocks(doc, content["blocks"])
+    rendered = 0
+    for section in chosen:
+        if _has_chart(section):
+            # Chart images are package parts, which a fragment cannot
+            # carry; the images themselves come from the chart cache
+            render_section(doc, section)
+            rendered += 1
+            continue
+        key = section_key(name, _digest(section))
+        entry = None if force else fragment_cache.load(key)
+        if entry is not None:
+            # Spliced headings bypass doc.add_heading; open the span by hand
+            profiling.heading(section["heading"])
+            fragment_cache.splice(doc, entry["xml"])
+            continue
+        if hasattr(doc, "write_fragment"):
+            # A streaming document's section is drawn into fragment_cache's
+            # scratch document, whose headings are not traced
+            profiling.heading(section["heading"])
+        xml = fragment_cache.render_into(doc, lambda d: render_section(d, section))
+        fragment_cache.store(key, {"xml": xml})
+        rendered += 1
+    if content["footer"] is not None:
+        add_footer(doc, content["footer"])
+    doc.save(output_path)
+    if sections is None:
+        _record_built(name, content["digests"])
+    return output_path, rendered, len(chosen) - rendered
+
+
+def render_document(name, out_dir, today=None):
+    """Render content/<name>.json into out_dir; returns the output path."""
+    content = load(name)
+    output = fill_dates(content["output"], today or datetime.now())
+    return build_document(name, os.path.join(out_dir, output), today=today)[0]
+
+
+def main(argv=None):
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Render the content-driven documents, re-rendering only changed sections.")
+    parser.add_argument("names", nargs="*", help="content names (default: all in content/)")
+    parser.add_argument("--sections", nargs="+", metavar="SECTION",
+                        help='render only these sections (heading, number such as "10", or substring); '
+                             "written next to the full document as <name>-sections.docx")
+    parser.add_argument("--force", action="store_true", help="re-render every section")
+    parser.add_argument("--changed", action="store_true",
+                        help="only list sections changed since the last full render")
+    parser.add_argument("--out-dir", default=SCRIPT_DIR, help="output directory (default: docs/exports)")
+    args = parser.parse_args(argv)
+
+    names = args.names or sorted(f[:-5] for f in os.listdir(CONTENT_DIR)
+                                 if f.endswith(".json") and f[:-5] != SHARED)
+    for name in names:
+        if args.changed:
+            changed = changed_sections(name)
+            print(f"{name}: {len(changed)} changed section(s)")
+            for heading in changed:
+                print(f"  {heading}")
+            continue
+        start = time.perf_counter()
+        output = fill_dates(load(name)["output"], datetime.now())
+        if args.sections:
+            stem, ext = os.path.splitext(output)
+            output = f"{stem}-sections{ext}"
+        path, rendered, cached = build_document(name, os.path.join(args.out_dir, output),
+                                                args.sections, args.force)
+        print(f"Generated: {path}")
+        print(f"Sections: {rendered + cached} ({rendered} rendered, {cached} cached) "
+              f"in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
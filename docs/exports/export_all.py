@@ -0,0 +1,330 @@
+"""
+Regenerate every branded export (docx + pptx) in one run.
+Run: python docs/exports/export_all.py [--jobs N] [--force] [--dry-run] [--list] [--spans] [--profile] [-v] [name ...]
+
+Each generator runs in its own worker process, so the wall time is roughly
+that of the slowest document rather than the sum of all of them. A failing
+generator is reported with its output and traceback but does not stop the
+others; the exit status is non-zero if any generator failed. -v prints
+every generator's output.
+
+Builds are incremental: each export is keyed by a hash of its generator
+source, the local helper modules it imports, its assets and data inputs
+(see .export-cache/manifest.json). Exports whose key is unchanged and whose
+outputs still exist are skipped; --force rebuilds everything and
+--dry-run only reports which exports are stale.
+
+--spans records a timing/allocation span per level-1 section of each
+document (see profiling.py) and --profile a cProfile dump per generator;
+both write to .export-cache/profile/ and imply --force for the selected
+exports.
+"""
+
+import argparse
+import contextlib
+import glob
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+from collections import namedtuple
+from datetime import datetime
+from importlib import import_module
+
+from source_deps import local_sources
+
+# The generators, the process pool and the profilers are imported only
+# when something is actually built, so --help, --list, --dry-run and
+# all-cached runs stay fast
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", ".."))
+CACHE_DIR = os.path.join(SCRIPT_DIR, ".export-cache")
+MANIFEST = os.path.join(CACHE_DIR, "manifest.json")
+PROFILE_DIR = os.path.join(CACHE_DIR, "profile")
+RAVIO_LOGO = os.path.join(PROJECT_ROOT, "public", "ravio-the-chat-genie-128px.png")
+
+# module:  importable module in docs/exports, or a script path (run as __main__)
+# func:    generator function in that module, None for scripts
+# outputs: artifacts, relative to PROJECT_ROOT; "{date}" is today's MMDDYYYY
+# assets:  files embedded in the output (hashed into the build key)
+# data:    data files the generator reads, relative to PROJECT_ROOT; glob
+#          patterns ("docs/**/*.md") are expanded (hashed into the build key)
+# sources: helper modules outside the generator's sibling imports, relative
+#          to PROJECT_ROOT; hashed with their own sibling imports
+# dated:   content depends on today's date, so the key changes daily
+Export = namedtuple("Export", "name module func outputs assets data sources dated",
+                    defaults=((), (), (), (), False))
+
+EXPORTS = [
+    Export("roadmap", "generate_docx", "generate_roadmap",
+           outputs=["docs/exports/RAV-roadmap-draft-02222026.docx"],
+           assets=[RAVIO_LOGO],
+           data=["docs/exports/content/roadmap.json", "docs/exports/content/shared.json"]),
+    Export("status-report", "generate_docx", "generate_status_report",
+           outputs=["docs/exports/RAV-Development-Status-Report-02222026.docx"],
+           assets=[RAVIO_LOGO],
+           data=["docs/exports/content/status-report.json", "docs/exports/content/shared.json"]),
+    Export("platform-overview", "generate_platform_overview", "generate_platform_overview",
+           outputs=["docs/exports/RAV-Platform-Overview-{date}.docx"],
+           assets=[RAVIO_LOGO],
+           data=["docs/exports/content/platform-overview.json", "docs/exports/content/shared.json"],
+           dated=True),
+    Export("tech-inventory", "generate_tech_inventory", "generate",
+           outputs=["docs/exports/RAV-Technology-Inventory-02262026.docx"],
+           assets=[RAVIO_LOGO],
+           data=["docs/exports/content/tech-inventory.json", "docs/exports/content/shared.json"],
+           dated=True),
+    Export("docs-book", "export_docs_book", "export_docs_book",
+           outputs=["docs/exports/RAV-Knowledge-Base.docx"],
+           assets=[RAVIO_LOGO], data=["docs/**/*.md"], dated=True),
+    Export("resort-catalog", "generate_resort_catalog", "generate_resort_catalog",
+           outputs=["docs/exports/RAV-Resort-Catalog.docx"],
+           assets=[RAVIO_LOGO],
+           data=["docs/features/resort-master-data/sample-data/complete-resort-data.json"],
+           dated=True),
+    # The script's helpers live in docs/exports, outside its sibling
+    # imports, so they are listed as sources
+    Export("brand-pptx", os.path.join(PROJECT_ROOT, "scripts", "generate-brand-pptx.py"), None,
+           outputs=["docs/RAV-Brand-Template.pptx"],
+           data=["docs/exports/content/decks/brand-template.json", "docs/exports/content/fonts/*.json"],
+           sources=["docs/exports/brand_pptx.py"]),
+]
+
+Result = namedtuple("Result", "name ok seconds output error cached", defaults=(False,))
+
+
+# ============================================================
+# BUILD CACHE
+# ============================================================
+
+def module_path(export):
+    if export.func is None:
+        return export.module
+    return os.path.join(SCRIPT_DIR, f"{export.module}.py")
+
+
+def output_paths(export, today):
+    stamp = today.strftime("%m%d%Y")
+    return [os.path.join(PROJECT_ROOT, o.format(date=stamp)) for o in export.outputs]
+
+
+def build_key(export, today):
+    """Content hash over everything that can change an export's output."""
+    digest = hashlib.sha256()
+    sources = local_sources(module_path(export))
+    for path in export.sources:
+        local_sources(os.path.join(PROJECT_ROOT, path), sources)
+    entries = [("source", p) for p in sorted(sources)]
+    entries += [("asset", p) for p in export.assets]
+    for pattern in export.data:
+        matches = sorted(glob.glob(os.path.join(PROJECT_ROOT, pattern), recursive=True))
+        entries += [("data", p) for p in matches or [os.path.join(PROJECT_ROOT, pattern)]]
+    for kind, path in entries:
+        digest.update(f"{kind}:{os.path.relpath(path, PROJECT_ROOT)}\0".encode())
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        else:
+            digest.update(b"<missing>")
+    digest.update(f"func:{export.func}\0".encode())
+    if export.dated:
+        digest.update(f"date:{today.date().isoformat()}".encode())
+    return digest.hexdigest()
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = MANIFEST + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, MANIFEST)
+
+
+def is_fresh(export, key, manifest, today):
+    entry = manifest.get(export.name)
+    return (entry is not None and entry.get("key") == key
+            and all(os.path.exists(p) for p in output_paths(export, today)))
+
+
+# ============================================================
+# RUNNER
+# ============================================================
+
+def _invoke(export):
+    if export.func is None:
+        import runpy
+
+        # Scripts write relative to the project root
+        cwd = os.getcwd()
+        os.chdir(PROJECT_ROOT)
+        try:
+            runpy.run_path(export.module, run_name="__main__")
+        finally:
+            os.chdir(cwd)
+    else:
+        getattr(import_module(export.module), export.func)()
+
+
+def run_export(export, spans=False, profile=False):
+    """Run one generator in the current process and capture its outcome."""
+    if SCRIPT_DIR not in sys.path:
+        sys.path.insert(0, SCRIPT_DIR)
+    import profiling
+
+    output = io.StringIO()
+    profiler = None
+    if profile:
+        import cProfile
+        profiler = cProfile.Profile()
+    recorder = profiling.record(export.name) if spans else contextlib.nullcontext()
+    start = time.perf_counter()
+    error = None
+    try:
+        with contextlib.redirect_stdout(output), recorder as rec:
+            if profiler:
+                profiler.enable()
+            try:
+                _invoke(export)
+            finally:
+                if profiler:
+                    profiler.disable()
+    except SystemExit as exc:
+        # A script ending with sys.exit(0) succeeded; Ctrl-C still propagates
+        if exc.code not in (0, None):
+            import traceback
+            error = traceback.format_exc()
+    except Exception:
+        import traceback
+        error = traceback.format_exc()
+    seconds = time.perf_counter() - start
+
+    if spans or profile:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        base = os.path.join(PROFILE_DIR, export.name)
+        if spans:
+            profiling.write(rec.root, f"{base}.spans.json", f"{base}.folded")
+        if profiler:
+            profiler.dump_stats(f"{base}.prof")
+    return Result(export.name, error is None, seconds, output.getvalue(), error)
+
+
+def select_exports(names):
+    if not names:
+        return list(EXPORTS)
+    known = {e.name: e for e in EXPORTS}
+    unknown = [n for n in names if n not in known]
+    if unknown:
+        raise SystemExit(f"Unknown export(s): {', '.join(unknown)} (see --list)")
+    return [known[n] for n in names]
+
+
+def run_all(exports, jobs, spans=False, profile=False):
+    """Run exports across a process pool; yields Results as they finish."""
+    if jobs <= 1:
+        for export in exports:
+            yield run_export(export, spans, profile)
+        return
+    import traceback
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(exports))) as pool:
+        futures = {pool.submit(run_export, e, spans, profile): e for e in exports}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception:
+                # Worker died (e.g. killed or unpicklable result)
+                yield Result(futures[future].name, False, 0.0, "", traceback.format_exc())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("names", nargs="*", help="exports to run (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count; 1 runs in-process)")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild even if inputs are unchanged")
+    parser.add_argument("-n", "--dry-run", action="store_true",
+                        help="report which exports are stale without building them")
+    parser.add_argument("--list", action="store_true", help="list available exports and exit")
+    parser.add_argument("--spans", action="store_true",
+                        help="write per-section timing spans (JSON + collapsed stacks)")
+    parser.add_argument("--profile", action="store_true", help="write a cProfile dump per generator")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print every generator's output")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for e in EXPORTS:
+            target = f"{e.module}.{e.func}" if e.func else os.path.relpath(e.module, PROJECT_ROOT)
+            print(f"{e.name:<20} {target}")
+        return 0
+
+    start = time.perf_counter()
+    today = datetime.now()
+    manifest = load_manifest()
+    keys = {}
+    results = []
+    pending = []
+    profiled = args.spans or args.profile
+    for export in select_exports(args.names):
+        keys[export.name] = build_key(export, today)
+        if not (args.force or profiled) and is_fresh(export, keys[export.name], manifest, today):
+            results.append(Result(export.name, True, 0.0, "", None, cached=True))
+            print(f"[cached] {export.name}")
+        else:
+            pending.append(export)
+            if args.dry_run:
+                print(f"[ stale] {export.name}")
+    if args.dry_run:
+        print(f"{len(pending)} of {len(pending) + len(results)} exports would be rebuilt "
+              f"({time.perf_counter() - start:.2f}s)")
+        return 0
+
+    if pending:
+        for result in run_all(pending, args.jobs, args.spans, args.profile):
+            results.append(result)
+            status = "ok" if result.ok else "FAILED"
+            print(f"[{status:>6}] {result.name:<20} {result.seconds:7.2f}s")
+            if result.output and args.verbose and result.ok:
+                print(result.output.rstrip())
+            if result.ok:
+                manifest[result.name] = {
+                    "key": keys[result.name],
+                    "built_at": datetime.now().isoformat(timespec="seconds"),
+                    "seconds": round(result.seconds, 3),
+                }
+            else:
+                manifest.pop(result.name, None)
+                if result.output:
+                    print(result.output.rstrip(), file=sys.stderr)
+                print(result.error.rstrip(), file=sys.stderr)
+        save_manifest(manifest)
+    wall = time.perf_counter() - start
+
+    failed = [r.name for r in results if not r.ok]
+    cached = sum(1 for r in results if r.cached)
+    total = sum(r.seconds for r in results)
+    print(f"{len(results) - len(failed)}/{len(results)} exports ok ({cached} cached) in {wall:.2f}s "
+          f"(sum of generator times {total:.2f}s, jobs={args.jobs})")
+    if failed:
+        print(f"Failed: {', '.join(failed)}", file=sys.stderr)
+    if pending and profiled:
+        print(f"Profiles: {os.path.relpath(PROFILE_DIR)}")
+    if failed:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
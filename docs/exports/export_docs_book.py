@@ -0,0 +1,187 @@
+"""
+Compile the whole docs/ knowledge base into one branded .docx binder.
+Run: python docs/exports/export_docs_book.py [--root docs] [-o OUT.docx] [--jobs N] [--force] [--backend stream]
+
+Every Markdown file becomes a chapter rendered by md_to_docx. Each chapter
+is cached as a body fragment keyed by a hash of the file's content, its
+path, the renderer sources and the brand fingerprint (see fragment_cache),
+so editing one guide re-renders only that chapter; the binder is then
+spliced together from cached fragments behind a generated table of
+contents.
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", ".."))
+sys.path.insert(0, SCRIPT_DIR)
+
+import md_to_docx
+import profiling
+
+# python-docx, the brand helpers and fragment_cache (which loads both) are
+# imported where they are used, so --help starts without them
+
+DOCS_ROOT = os.path.join(PROJECT_ROOT, "docs")
+OUTPUT = os.path.join(SCRIPT_DIR, "RAV-Knowledge-Base.docx")
+TOC_LEVELS = "1-2"
+
+
+def chapter_sources(root):
+    """Markdown files under root: top-level files first, then each subfolder."""
+    for dirpath, dirs, files in os.walk(root):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(".md"):
+                yield os.path.join(dirpath, name)
+
+
+def chapter_key(md_path, root):
+    import fragment_cache
+
+    with open(md_path, "rb") as f:
+        content = f.read()
+    rel = os.path.relpath(md_path, root)
+    return fragment_cache.fragment_key("docs-book-chapter", rel, content,
+                                       fragment_cache.source_fingerprint(__file__))
+
+
+def render_chapter(doc, md_path, root):
+    """Render one Markdown file as a chapter; returns {"title": ...}."""
+    from brand_docx import add_body, MUTED_GRAY
+
+    rel = os.path.relpath(md_path, root).replace(os.sep, "/")
+    with open(md_path, encoding="utf-8") as f:
+        blocks = md_to_docx.iter_blocks(f)
+        first = next(blocks, None)
+        if first is not None and first[0] == "heading" and first[1] == 1:
+            title = md_to_docx.strip_inline(first[2])
+            first = None
+        else:
+            title = os.path.splitext(os.path.basename(md_path))[0]
+        doc.add_heading(title, level=1)
+        add_body(doc, f"docs/{rel}", italic=True, size=8, color=MUTED_GRAY)
+        if first is not None:
+            md_to_docx.render_block(doc, first)
+        for block in blocks:
+            md_to_docx.render_block(doc, block)
+    return {"title": title}
+
+
+def _render_miss(args):
+    import fragment_cache
+
+    key, md_path, root = args
+    entry, _ = fragment_cache.render(key, lambda doc: render_chapter(doc, md_path, root), use_cache=False)
+    return key, entry
+
+
+def add_page_break(doc):
+    from docx.enum.text import WD_BREAK
+
+    doc.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
+
+
+def add_table_of_contents(doc, titles):
+    """TOC field whose cached result lists the chapters until Word updates it."""
+    from brand_docx import add_styled_paragraph
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls, qn
+
+    doc.add_heading("Contents", level=1)
+    begin = (
+        f'<w:r {nsdecls("w")}><w:fldChar w:fldCharType="begin"/></w:r>',
+        f'<w:r {nsdecls("w")}><w:instrText xml:space="preserve"> TOC \\o "{TOC_LEVELS}" \\h \\z \\u </w:instrText></w:r>',
+        f'<w:r {nsdecls("w")}><w:fldChar w:fldCharType="separate"/></w:r>',
+    )
+    end = f'<w:r {nsdecls("w")}><w:fldChar w:fldCharType="end"/></w:r>'
+    for i, title in enumerate(titles or [""]):
+        p = add_styled_paragraph(doc, "BrandMeta")
+        if i == 0:
+            for fragment in begin:
+                p._p.append(parse_xml(fragment))
+        p.add_run(title)
+        if i == len(titles) - 1 or not titles:
+            p._p.append(parse_xml(end))
+    # Ask Word to refresh fields (page numbers) when the binder is opened
+    settings = doc.settings.element
+    if settings.find(qn("w:updateFields")) is None:
+        settings.insert_element_before(
+            parse_xml(f'<w:updateFields {nsdecls("w")} w:val="true"/>'),
+            "w:hdrShapeDefaults", "w:footnotePr", "w:endnotePr", "w:compat", "w:docVars",
+            "w:rsids", "w:attachedSchema", "w:themeFontLang", "w:clrSchemeMapping",
+            "w:doNotIncludeSubdocsInStats", "w:doNotAutoCompressPictures", "w:forceUpgrade",
+            "w:captions", "w:readModeInkLockDown", "w:smartTagType", "w:shapeDefaults",
+            "w:doNotEmbedSmartTags", "w:decimalSymbol", "w:listSeparator",
+        )
+
+
+def export_docs_book(root=DOCS_ROOT, output_path=OUTPUT, jobs=1, force=False, backend=None):
+    """Build the binder; returns (output_path, rendered, cached)."""
+    import fragment_cache
+    from brand_docx import new_branded_doc, add_metadata, add_footer
+
+    sources = list(chapter_sources(root))
+    keys = [chapter_key(path, root) for path in sources]
+
+    entries = {}
+    misses = []
+    for key, path in zip(keys, sources):
+        entry = None if force else fragment_cache.load(key)
+        if entry is None:
+            misses.append((key, path, root))
+        else:
+            entries[key] = entry
+    with profiling.section(f"render {len(misses)} chapters"):
+        if misses and jobs > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=min(jobs, len(misses))) as pool:
+                entries.update(pool.map(_render_miss, misses))
+        else:
+            entries.update(_render_miss(m) for m in misses)
+
+    doc = new_branded_doc(doc_title="Knowledge Base — Documentation Binder", backend=backend)
+    add_metadata(doc, [
+        ("Date", datetime.now().strftime("%B %d, %Y")),
+        ("Chapters", str(len(sources))),
+        ("Source", "docs/ (Markdown)"),
+    ])
+    add_table_of_contents(doc, [entries[k]["title"] for k in keys])
+    for key in keys:
+        # Chapters arrive as cached fragments, so their headings bypass
+        # doc.add_heading; open the section spans by hand
+        profiling.heading(entries[key]["title"])
+        add_page_break(doc)
+        fragment_cache.splice(doc, entries[key]["xml"])
+    add_footer(doc, "Rent-A-Vacation • Knowledge Base • Confidential • Generated "
+               + datetime.now().strftime("%B %d, %Y"))
+    doc.save(output_path)
+    return output_path, len(misses), len(sources) - len(misses)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--root", default=DOCS_ROOT, help="docs tree to compile (default: docs/)")
+    parser.add_argument("-o", "--output", default=OUTPUT, help="output .docx")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="processes for re-rendering changed chapters")
+    parser.add_argument("--force", action="store_true", help="re-render every chapter")
+    parser.add_argument("--backend", choices=["docx", "stream"],
+                        help="document backend (default: brand_docx.DOCX_BACKEND)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    path, rendered, cached = export_docs_book(os.path.abspath(args.root), args.output, args.jobs, args.force,
+                                             args.backend)
+    print(f"Generated: {path}")
+    print(f"Chapters: {rendered + cached} ({rendered} rendered, {cached} cached) "
+          f"in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+Content-addressed cache of rendered document-body fragments.
+
+A fragment is the run of body elements (paragraphs, tables) that some
+helper calls produce, serialized as XML. Rendering happens into a blank
+document opened from the cached branded base so every style the fragment
+references exists; splicing appends the fragment's elements into another
+branded document. Fragments must not reference relationship parts (images,
+hyperlinks), which would not carry over between packages.
+"""
+
+import copy
+import hashlib
+import io
+import json
+import os
+from functools import lru_cache
+
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from lxml import etree
+
+from brand_docx import BRAND_CACHE_DIR, append_fragment, brand_base_bytes, brand_fingerprint
+from source_deps import local_sources
+
+FRAGMENT_DIR = os.path.join(BRAND_CACHE_DIR, "fragments")
+
+_scratch = None  # blank document reused by render_into()
+
+
+def fragment_key(*parts):
+    """Hash str/bytes parts (plus the brand fingerprint) into a cache key."""
+    digest = hashlib.sha256(brand_fingerprint().encode())
+    for part in parts:
+        data = part if isinstance(part, bytes) else str(part).encode()
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def source_fingerprint(path):
+    """Hash of the module at path and every sibling module it imports.
+
+    Part of a renderer's fragment keys, so editing any helper the
+    renderer reaches (brand_docx, xml_fragments, ...) re-renders its
+    fragments; see source_deps.local_sources.
+    """
+    digest = hashlib.sha256()
+    for source in sorted(local_sources(os.path.abspath(path))):
+        digest.update(f"{os.path.basename(source)}\0".encode())
+        with open(source, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+def blank_doc():
+    """A branded document with an empty body (styles, margins, footer kept)."""
+    doc = Document(io.BytesIO(brand_base_bytes()))
+    body = doc.element.body
+    for child in list(body):
+        if child.tag != qn("w:sectPr"):
+            body.remove(child)
+    return doc
+
+
+def body_xml(doc):
+    """Serialize a document's body content (without sectPr) as one fragment."""
+    container = parse_xml(f"<w:body {nsdecls('w')}/>")
+    for child in list(doc.element.body):
+        if child.tag != qn("w:sectPr"):
+            container.append(child)
+    return etree.tostring(container, encoding="unicode")
+
+
+def capture_xml(doc, render_fn):
+    """Call render_fn(doc) on a python-docx document and serialize the body
+    elements it appended as one fragment, leaving them in place."""
+    body = doc.element.body
+    tail = 1 if body.find(qn("w:sectPr")) is not None else 0
+    start = len(body) - tail
+    render_fn(doc)
+    container = parse_xml(f"<w:body {nsdecls('w')}/>")
+    for child in body[start:len(body) - tail]:
+        container.append(copy.deepcopy(child))
+    return etree.tostring(container, encoding="unicode")
+
+
+def render_into(doc, render_fn):
+    """Call render_fn on doc's behalf and return what it drew as a fragment.
+
+    python-docx documents are drawn into directly (see capture_xml); a
+    streaming document keeps nothing it has written, so render_fn draws
+    into a scratch document whose fragment is then spliced into doc.
+    """
+    global _scratch
+    if not hasattr(doc, "write_fragment"):
+        return capture_xml(doc, render_fn)
+    if _scratch is None:
+        _scratch = blank_doc()
+    render_fn(_scratch)
+    xml = body_xml(_scratch)  # also empties the scratch body again
+    splice(doc, xml)
+    return xml
+
+
+def splice(doc, xml):
+    """Append a serialized fragment's elements to the end of doc's body."""
+    append_fragment(doc, xml)
+
+
+def load(key):
+    """Cached entry for key ({"xml": ..., plus metadata}) or None."""
+    try:
+        with open(os.path.join(FRAGMENT_DIR, f"{key}.json"), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def store(key, entry):
+    os.makedirs(FRAGMENT_DIR, exist_ok=True)
+    path = os.path.join(FRAGMENT_DIR, f"{key}.json")
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(entry, f)
+    os.replace(tmp, path)
+
+
+def render(key, render_fn, use_cache=True):
+    """Return (entry, cached) for key, calling render_fn(doc) on a miss.
+
+    render_fn draws into a blank branded document and may return a dict of
+    metadata to keep alongside the XML (e.g. a chapter title).
+    """
+    if use_cache:
+        entry = load(key)
+        if entry is not None:
+            return entry, True
+    doc = blank_doc()
+    entry = dict(render_fn(doc) or {})
+    entry["xml"] = body_xml(doc)
+    store(key, entry)
+    return entry, False
@@ -0,0 +1,319 @@
+"""
+Generate the branded resort catalog from the resort master data.
+Run: python docs/exports/generate_resort_catalog.py [--source PATH] [-o OUT.docx] [--jobs N] [--force] [--backend stream]
+
+The catalog covers every resort and unit type in the seed data behind the
+resorts / resort_unit_types tables (supabase/migrations/
+20260211_resort_master_data.sql). The source is the JSON dump that
+scripts/import-resort-data.ts loads, or a directory holding resorts.csv
+and resort_unit_types.csv exported from those tables.
+
+Each vacation club brand is one chapter: a resort index, then a section
+per resort with its details, amenities and unit-type table. Chapters are
+rendered in parallel (--jobs) into cached body fragments keyed by the
+brand's records and the renderer source (see fragment_cache), and then
+spliced into the catalog behind a brand overview; tables go through
+add_table_from_rows, so --backend stream keeps the whole build in
+bounded memory.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", ".."))
+sys.path.insert(0, SCRIPT_DIR)
+
+import profiling
+
+# python-docx, the brand helpers and fragment_cache are imported where
+# they are used, so --help and the data loader start without them
+
+SEED_DATA = os.path.join(PROJECT_ROOT, "docs", "features", "resort-master-data", "sample-data",
+                         "complete-resort-data.json")
+OUTPUT = os.path.join(SCRIPT_DIR, "RAV-Resort-Catalog.docx")
+
+# vacation_club_brand enum values in catalog order, with the app's labels
+BRAND_NAMES = {
+    "hilton_grand_vacations": "Hilton Grand Vacations",
+    "marriott_vacation_club": "Marriott Vacation Club",
+    "disney_vacation_club": "Disney Vacation Club",
+    "wyndham_destinations": "Wyndham Destinations",
+    "hyatt_residence_club": "Hyatt Residence Club",
+    "bluegreen_vacations": "Bluegreen Vacations",
+    "holiday_inn_club": "Holiday Inn Club Vacations",
+    "worldmark": "WorldMark by Wyndham",
+    "other": "Other",
+}
+
+INDEX_HEADERS = ["Resort", "Location", "Unit Types", "Sleeps", "Rating"]
+UNIT_HEADERS = ["Unit Type", "Bedrooms", "Baths", "Sleeps", "Sq Ft", "Kitchen", "Bedding", "View & Features"]
+
+
+# ============================================================
+# SEED DATA
+# ============================================================
+
+def _pg_array(value):
+    """A text[] column from a CSV export: {a,"b c"} or a JSON list."""
+    value = (value or "").strip()
+    if not value:
+        return []
+    if value.startswith("["):
+        return json.loads(value)
+    inner = value[1:-1] if value.startswith("{") else value
+    return next(csv.reader([inner], escapechar="\\")) if inner else []
+
+
+def _json_column(value):
+    return json.loads(value) if value and value.strip() else {}
+
+
+def _read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def _load_csv_dir(path):
+    resorts = []
+    names = {}
+    for row in _read_csv(os.path.join(path, "resorts.csv")):
+        resort = dict(row)
+        for column in ("location", "contact", "policies"):
+            resort[column] = _json_column(row.get(column))
+        for column in ("resort_amenities", "nearby_airports"):
+            resort[column] = _pg_array(row.get(column))
+        resort["guest_rating"] = float(row["guest_rating"]) if row.get("guest_rating") else None
+        resorts.append(resort)
+        if row.get("id"):
+            names[row["id"]] = row["resort_name"]
+    unit_types = []
+    for row in _read_csv(os.path.join(path, "resort_unit_types.csv")):
+        unit = dict(row)
+        if not unit.get("resort_name"):
+            unit["resort_name"] = names.get(row.get("resort_id"))
+        unit["features"] = _json_column(row.get("features"))
+        unit["unit_amenities"] = _pg_array(row.get("unit_amenities"))
+        unit_types.append(unit)
+    return resorts, unit_types
+
+
+def load_seed(source=SEED_DATA):
+    """(resorts, unit_types) from a JSON dump or a directory of CSV exports."""
+    if os.path.isdir(source):
+        return _load_csv_dir(source)
+    with open(source, encoding="utf-8") as f:
+        data = json.load(f)
+    return data["resorts"], data["unit_types"]
+
+
+def catalog_by_brand(resorts, unit_types):
+    """{brand: [(resort, [unit types])]}, brands in enum order, resorts by name."""
+    units = {r["resort_name"]: [] for r in resorts}
+    for unit in unit_types:
+        if unit.get("resort_name") not in units:
+            raise ValueError(f"Unit type {unit.get('unit_type_name')!r} references unknown resort "
+                             f"{unit.get('resort_name')!r}")
+        units[unit["resort_name"]].append(unit)
+    brands = {}
+    for resort in sorted(resorts, key=lambda r: r["resort_name"].lower()):
+        brands.setdefault(resort["brand"], []).append((resort, units[resort["resort_name"]]))
+    order = list(BRAND_NAMES)
+    return {b: brands[b] for b in sorted(brands, key=lambda b: order.index(b) if b in order else len(order))}
+
+
+def _display_path(path):
+    rel = os.path.relpath(path, PROJECT_ROOT)
+    return path if rel.startswith("..") else rel.replace(os.sep, "/")
+
+
+def brand_name(brand):
+    return BRAND_NAMES.get(brand) or brand.replace("_", " ").title()
+
+
+# ============================================================
+# RENDERING
+# ============================================================
+
+def format_number(value, spec="g"):
+    return "—" if value in (None, "") else format(float(value), spec)
+
+
+def resort_location(resort):
+    loc = resort.get("location") or {}
+    return loc.get("full_address") or ", ".join(v for v in (loc.get("city"), loc.get("state"),
+                                                             loc.get("country")) if v)
+
+
+def _features(unit):
+    features = unit.get("features") or {}
+    parts = [features.get("view_type")]
+    parts += [label for key, label in (("balcony", "Balcony"), ("washer_dryer", "Washer/Dryer"),
+                                       ("accessible", "Accessible")) if features.get(key)]
+    return ", ".join(p for p in parts if p)
+
+
+def _index_rows(resorts):
+    for resort, units in resorts:
+        sleeps = [int(u["max_occupancy"]) for u in units if u.get("max_occupancy") not in (None, "")]
+        yield (resort["resort_name"], resort_location(resort), len(units),
+               f"{min(sleeps)}–{max(sleeps)}" if sleeps else "—", format_number(resort.get("guest_rating"), ".1f"))
+
+
+def _unit_rows(units):
+    for unit in units:
+        bedrooms = int(unit["bedrooms"])
+        yield (unit["unit_type_name"], "Studio" if bedrooms == 0 else bedrooms, format_number(unit["bathrooms"]),
+               unit["max_occupancy"], format_number(unit.get("square_footage"), ",.0f"),
+               unit.get("kitchen_type") or "—", unit.get("bedding_config") or "—", _features(unit))
+
+
+def render_resort(doc, resort, units):
+    """One resort section: details, amenities and unit types."""
+    from brand_docx import add_body, add_bullet_list, add_metadata, add_table_from_rows
+
+    doc.add_heading(resort["resort_name"], level=2)
+    if resort.get("description"):
+        add_body(doc, resort["description"])
+    policies = resort.get("policies") or {}
+    contact = resort.get("contact") or {}
+    pairs = [
+        ("Location", resort_location(resort)),
+        ("Guest Rating", format_number(resort.get("guest_rating"), ".1f")),
+        ("Check-in / Check-out", " / ".join(policies.get(k) or "—" for k in ("check_in", "check_out"))),
+        ("Parking", policies.get("parking")),
+        ("Pets", policies.get("pets")),
+        ("Nearby Airports", ", ".join(resort.get("nearby_airports") or [])),
+        ("Phone", contact.get("phone")),
+        ("Website", contact.get("website")),
+    ]
+    add_metadata(doc, [(k, v) for k, v in pairs if v])
+    if resort.get("resort_amenities"):
+        doc.add_heading("Amenities", level=3)
+        add_bullet_list(doc, resort["resort_amenities"])
+    doc.add_heading(f"Unit Types ({len(units)})", level=3)
+    if units:
+        add_table_from_rows(doc, UNIT_HEADERS, _unit_rows(units))
+    else:
+        add_body(doc, "No unit types on file.", italic=True)
+
+
+def render_brand(doc, brand, resorts):
+    """One brand chapter: summary, resort index, then every resort."""
+    from brand_docx import add_metadata, add_table_from_rows
+
+    doc.add_heading(brand_name(brand), level=1)
+    add_metadata(doc, [
+        ("Resorts", str(len(resorts))),
+        ("Unit Types", str(sum(len(units) for _, units in resorts))),
+        ("Countries", str(len({(r.get("location") or {}).get("country") for r, _ in resorts}))),
+    ])
+    doc.add_heading("Resort Index", level=2)
+    add_table_from_rows(doc, INDEX_HEADERS, _index_rows(resorts))
+    for resort, units in resorts:
+        render_resort(doc, resort, units)
+    return {"title": brand_name(brand)}
+
+
+def brand_key(brand, resorts):
+    import fragment_cache
+
+    records = json.dumps(resorts, sort_keys=True, ensure_ascii=False)
+    return fragment_cache.fragment_key("resort-catalog-brand", brand, records,
+                                       fragment_cache.source_fingerprint(__file__))
+
+
+def _render_miss(args):
+    import fragment_cache
+
+    key, brand, resorts = args
+    entry, _ = fragment_cache.render(key, lambda doc: render_brand(doc, brand, resorts), use_cache=False)
+    return key, entry
+
+
+# ============================================================
+# CATALOG
+# ============================================================
+
+def generate_resort_catalog(source=SEED_DATA, output_path=OUTPUT, jobs=1, force=False, backend=None):
+    """Build the catalog; returns (output_path, rendered, cached) brand chapters."""
+    import fragment_cache
+    from brand_docx import new_branded_doc, add_footer, add_metadata, add_table_from_rows
+    from export_docs_book import add_page_break, add_table_of_contents
+
+    with profiling.section("load seed data"):
+        resorts, unit_types = load_seed(source)
+        brands = catalog_by_brand(resorts, unit_types)
+    keys = {brand: brand_key(brand, items) for brand, items in brands.items()}
+
+    entries = {}
+    misses = []
+    for brand, items in brands.items():
+        entry = None if force else fragment_cache.load(keys[brand])
+        if entry is None:
+            misses.append((keys[brand], brand, items))
+        else:
+            entries[keys[brand]] = entry
+    with profiling.section(f"render {len(misses)} brands"):
+        if misses and jobs > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=min(jobs, len(misses))) as pool:
+                entries.update(pool.map(_render_miss, misses))
+        else:
+            entries.update(_render_miss(m) for m in misses)
+
+    today = datetime.now().strftime("%B %d, %Y")
+    doc = new_branded_doc(doc_title="Resort Catalog", backend=backend)
+    add_metadata(doc, [
+        ("Date", today),
+        ("Resorts", str(len(resorts))),
+        ("Unit Types", str(len(unit_types))),
+        ("Brands", str(len(brands))),
+        ("Source", _display_path(source)),
+    ])
+    add_table_from_rows(doc, ["Brand", "Resorts", "Unit Types", "Countries"], (
+        (brand_name(brand), len(items), sum(len(units) for _, units in items),
+         len({(r.get("location") or {}).get("country") for r, _ in items}))
+        for brand, items in brands.items()
+    ))
+    add_table_of_contents(doc, [entries[keys[b]]["title"] for b in brands])
+    for brand in brands:
+        # Chapters arrive as cached fragments, so their headings bypass
+        # doc.add_heading; open the section spans by hand
+        profiling.heading(entries[keys[brand]]["title"])
+        add_page_break(doc)
+        fragment_cache.splice(doc, entries[keys[brand]]["xml"])
+    add_footer(doc, f"Rent-A-Vacation • Resort Catalog • Confidential • Generated {today}")
+    doc.save(output_path)
+    return output_path, len(misses), len(brands) - len(misses)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", default=SEED_DATA,
+                        help="JSON dump or directory with resorts.csv + resort_unit_types.csv")
+    parser.add_argument("-o", "--output", default=OUTPUT, help="output .docx")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="processes for rendering brand chapters (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="re-render every brand chapter")
+    parser.add_argument("--backend", choices=["docx", "stream"],
+                        help="document backend (default: brand_docx.DOCX_BACKEND)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    path, rendered, cached = generate_resort_catalog(os.path.abspath(args.source), args.output, args.jobs,
+                                                     args.force, args.backend)
+    print(f"Generated: {path}")
+    print(f"Brands: {rendered + cached} ({rendered} rendered, {cached} cached) "
+          f"in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""
+Generate one branded pitch deck per resort from the resort master data.
+Run: python docs/exports/generate_resort_decks.py [--source PATH] [--brand BRAND] [--limit N] [--out-dir DIR] [--jobs N] [--clone [TEMPLATE]]
+
+Each resort's deck spec (title, key numbers, unit sizes chart,
+amenities, description, closing) is built from the same seed data as the resort catalog (see
+generate_resort_catalog.load_seed) and rendered by brand_pptx.build_decks,
+across a process pool with --jobs; --clone copies the slides from the
+designed brand template instead of drawing them.
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+
+from generate_resort_catalog import (
+    SEED_DATA,
+    brand_name,
+    catalog_by_brand,
+    format_number,
+    load_seed,
+    resort_location,
+)
+
+# python-pptx (through brand_pptx) is imported when decks are built, so
+# --help starts without it
+
+OUTPUT_DIR = os.path.join(SCRIPT_DIR, "resort-decks")
+MAX_AMENITIES = 6  # bullets that fit one slide
+CONTACT = "support@rent-a-vacation.com  |  1-800-RAV-BOOK"
+
+
+def _slug(text):
+    return re.sub(r"[^A-Za-z0-9]+", "-", text).strip("-")
+
+
+def _span(values, spec=","):
+    values = [v for v in values if v not in (None, "")]
+    if not values:
+        return "—"
+    low, high = min(values), max(values)
+    return format(low, spec) if low == high else f"{low:{spec}}–{high:{spec}}"
+
+
+def resort_deck_spec(brand, resort, units):
+    """Deck spec (see brand_pptx) for one resort."""
+    amenities = resort.get("resort_amenities") or []
+    slides = [
+        {"type": "title", "title": resort["resort_name"],
+         "subtitle": f"{brand_name(brand)}  |  {resort_location(resort)}"},
+        {"type": "stats", "title": "At a Glance", "stats": [
+            [str(len(units)), "Unit Types"],
+            [_span([int(u["max_occupancy"]) for u in units]), "Guests per Unit"],
+            [_span([int(u["square_footage"]) for u in units if u.get("square_footage") not in (None, "")]),
+             "Square Feet"],
+            [format_number(resort.get("guest_rating"), ".1f"), "Guest Rating"],
+        ]},
+    ]
+    sized = [u for u in units if u.get("square_footage") not in (None, "")]
+    if sized:
+        slides.append({"type": "chart", "title": "Unit Sizes", "kind": "bar",
+                       "categories": [u["unit_type_name"] for u in sized],
+                       "series": [["Square Feet", [int(u["square_footage"]) for u in sized]]],
+                       "caption": "Square footage per unit type"})
+    if amenities:
+        slides.append({"type": "bullets", "title": "Resort Amenities", "items": amenities[:MAX_AMENITIES]})
+    if resort.get("description"):
+        slides.append({"type": "feature", "title": "About the Resort", "text": resort["description"],
+                       "cta": "Book on Rent-A-Vacation"})
+    slides.append({"type": "closing", "contact": CONTACT})
+    return {"output": f"RAV-Resort-{_slug(resort['resort_name'])}.pptx", "slides": slides}
+
+
+def iter_deck_specs(source=SEED_DATA, brand=None):
+    """Deck specs for every resort (of one brand, if given), in catalog order."""
+    resorts, unit_types = load_seed(source)
+    for key, items in catalog_by_brand(resorts, unit_types).items():
+        if brand and brand not in (key, brand_name(key)):
+            continue
+        for resort, units in items:
+            yield resort_deck_spec(key, resort, units)
+
+
+def generate_resort_decks(source=SEED_DATA, out_dir=OUTPUT_DIR, jobs=1, brand=None, limit=None, template=None):
+    """Build the decks; returns their paths."""
+    from itertools import islice
+    from brand_pptx import build_decks
+
+    specs = iter_deck_specs(source, brand)
+    if limit is not None:
+        specs = islice(specs, limit)
+    return build_decks(specs, out_dir, jobs, template)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", default=SEED_DATA,
+                        help="JSON dump or directory with resorts.csv + resort_unit_types.csv")
+    parser.add_argument("--brand", help="only this brand (enum value or display name)")
+    parser.add_argument("--limit", type=int, help="build only the first N decks")
+    parser.add_argument("--out-dir", default=OUTPUT_DIR, help="output directory (default: docs/exports/resort-decks)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count; 1 runs in-process)")
+    parser.add_argument("--clone", nargs="?", const="", metavar="TEMPLATE",
+                        help="clone slides from a designed template (default: the brand template)")
+    args = parser.parse_args(argv)
+    if args.clone == "":
+        from brand_pptx import BRAND_TEMPLATE
+        args.clone = BRAND_TEMPLATE
+
+    start = time.perf_counter()
+    paths = generate_resort_decks(os.path.abspath(args.source), args.out_dir, args.jobs, args.brand, args.limit,
+                                  args.clone)
+    seconds = time.perf_counter() - start
+    print(f"Generated: {len(paths)} deck(s) into {args.out_dir} in {seconds:.2f}s "
+          f"({len(paths) / max(seconds, 1e-9):.1f} decks/s, jobs={args.jobs})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
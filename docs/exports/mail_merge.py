@@ -0,0 +1,253 @@
+"""
+Mail-merge personalized branded documents (payout statements, listing
+summaries) for every owner in a recipient file.
+Run: python docs/exports/mail_merge.py TEMPLATE RECORDS.{csv,jsonl} [--out-dir DIR] [--jobs N] [--limit N]
+
+A template is a content document under content/merge/ (see doc_content)
+whose strings contain "{{field}}" placeholders; its "output" names each
+generated file and may use placeholders too. The template is rendered
+once into a branded .docx, and every package part without placeholders
+is compressed once into a shared zip prefix. The parts that do have
+placeholders are pre-split around them, so a recipient's document is the
+prefix plus those parts with XML-escaped field values joined in: no
+python-docx, no lxml and no restyling per recipient.
+
+Recipient records are streamed from CSV (header row = field names) or
+JSONL and handed to a process pool in batches, so the recipient file is
+never held in memory (only the output names are, to reject duplicates).
+Every placeholder must have a value in every record; extra fields are
+ignored.
+
+    python docs/exports/mail_merge.py owner-payout-statement docs/exports/content/merge/sample-owners.jsonl
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import zipfile
+from collections import namedtuple
+from datetime import datetime
+from itertools import islice
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+
+# doc_content and xml_fragments (and with them python-docx) are imported
+# where they are used, so --help starts without them
+
+MERGE_DIR = "merge"  # templates live in content/merge/
+OUTPUT_DIR = os.path.join(SCRIPT_DIR, "merged")
+# Records handed to a worker at a time
+MERGE_BATCH = 50
+
+_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+_UNSAFE_NAME = re.compile(r'[\\/:*?"<>|\x00-\x1f]+')
+
+# prefix:  zip bytes holding every part without placeholders
+# parts:   [(member name, pieces)] for parts with placeholders; pieces
+#          alternate literal text and field names, starting with text
+# output:  pieces of the output file name
+# fields:  every field name the template uses
+MergeTemplate = namedtuple("MergeTemplate", "name prefix parts output fields")
+
+
+# ============================================================
+# TEMPLATE
+# ============================================================
+
+def _split(text):
+    pieces = _PLACEHOLDER.split(text)
+    return pieces, set(pieces[1::2])
+
+
+def prepare_template(name, today=None):
+    """Render content/merge/<name>.json once and pre-serialize it for merging."""
+    import doc_content
+
+    content_name = f"{MERGE_DIR}/{name}"
+    content = doc_content.load(content_name)
+    fd, path = tempfile.mkstemp(suffix=".docx")
+    os.close(fd)
+    try:
+        doc_content.build_document(content_name, path, today=today)
+        with zipfile.ZipFile(path) as src:
+            members = [(info, src.read(info)) for info in src.infolist()]
+    finally:
+        os.remove(path)
+
+    buf = io.BytesIO()
+    parts = []
+    fields = set()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as prefix:
+        for info, data in members:
+            if info.filename.endswith(".xml") and b"{{" in data:
+                pieces, names = _split(data.decode("utf-8"))
+                if names:
+                    parts.append((info.filename, pieces))
+                    fields |= names
+                    continue
+            prefix.writestr(info.filename, data)
+    output, names = _split(doc_content.fill_dates(content["output"], today or datetime.now()))
+    if not fields:
+        raise ValueError(f"{doc_content.content_path(content_name)}: template has no {{{{field}}}} placeholders")
+    return MergeTemplate(name, buf.getvalue(), parts, output, sorted(fields | names))
+
+
+def _fill(pieces, record, escape):
+    out = list(pieces)
+    for i in range(1, len(out), 2):
+        value = record[out[i]]
+        out[i] = escape("" if value is None else str(value))
+    return "".join(out)
+
+
+def output_name(template, record):
+    """File name for one record's document."""
+    return _UNSAFE_NAME.sub("-", _fill(template.output, record, str)).strip(". ")
+
+
+def merge_bytes(template, record):
+    """The .docx package for one record."""
+    from xml_fragments import escape_text
+
+    buf = io.BytesIO(template.prefix)
+    buf.seek(0, io.SEEK_END)
+    with zipfile.ZipFile(buf, "a", zipfile.ZIP_DEFLATED) as package:
+        for member, pieces in template.parts:
+            package.writestr(member, _fill(pieces, record, escape_text))
+    return buf.getvalue()
+
+
+# ============================================================
+# RECORDS
+# ============================================================
+
+def iter_records(path):
+    """Yield recipient records (dicts) from a .csv or .jsonl file, one at a time."""
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, newline="", encoding="utf-8") as f:
+        if ext == ".csv":
+            yield from csv.DictReader(f)
+        elif ext in (".jsonl", ".ndjson"):
+            for line_no, line in enumerate(f, 1):
+                if line.strip():
+                    record = json.loads(line)
+                    if not isinstance(record, dict):
+                        raise ValueError(f"{path}:{line_no}: expected a JSON object")
+                    yield record
+        else:
+            raise ValueError(f"{path}: recipient records must be .csv or .jsonl")
+
+
+def _checked(template, records):
+    """(number, record, output name) with missing fields, empty and duplicate names rejected.
+
+    Every name is remembered; an existing file in the output directory is
+    not a duplicate, so a merge can be re-run over its previous output.
+    """
+    seen = set()
+    for number, record in enumerate(records, 1):
+        missing = [f for f in template.fields if f not in record]
+        if missing:
+            raise ValueError(f"record {number}: missing field(s) {', '.join(missing)}")
+        name = output_name(template, record)
+        if not name:
+            raise ValueError(f"record {number}: output name is empty")
+        if name in seen:
+            raise ValueError(f"record {number}: output {name!r} is already used by an earlier record")
+        seen.add(name)
+        yield number, record, name
+
+
+# ============================================================
+# MERGE
+# ============================================================
+
+_worker_template = None
+
+
+def _init_worker(template):
+    global _worker_template
+    _worker_template = template
+
+
+def _write_batch(args):
+    out_dir, batch = args
+    for _, record, name in batch:
+        with open(os.path.join(out_dir, name), "wb") as f:
+            f.write(merge_bytes(_worker_template, record))
+    return len(batch)
+
+
+def _batches(items, out_dir):
+    items = iter(items)
+    while True:
+        batch = list(islice(items, MERGE_BATCH))
+        if not batch:
+            return
+        yield out_dir, batch
+
+
+def merge(template, records, out_dir=OUTPUT_DIR, jobs=1):
+    """Write one document per record into out_dir; returns the number written.
+
+    template is a MergeTemplate or a template name. With jobs > 1 batches
+    of MERGE_BATCH records go to a process pool; at most two batches per
+    worker are queued, so no more than that many records are in memory.
+    The output names are kept to catch duplicates, so memory still grows
+    with the recipient count, by one file name per record.
+    """
+    if isinstance(template, str):
+        template = prepare_template(template)
+    os.makedirs(out_dir, exist_ok=True)
+    batches = _batches(_checked(template, records), out_dir)
+    if jobs <= 1:
+        _init_worker(template)
+        return sum(_write_batch(b) for b in batches)
+
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    written = 0
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(template,)) as pool:
+        pending = set()
+        for batch in batches:
+            if len(pending) >= 2 * jobs:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                written += sum(f.result() for f in done)
+            pending.add(pool.submit(_write_batch, batch))
+        written += sum(f.result() for f in pending)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("template", help="template name in content/merge/ (e.g. owner-payout-statement)")
+    parser.add_argument("records", help="recipient records (.csv or .jsonl)")
+    parser.add_argument("--out-dir", default=OUTPUT_DIR, help="output directory (default: docs/exports/merged)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count; 1 runs in-process)")
+    parser.add_argument("--limit", type=int, help="merge only the first N records")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    template = prepare_template(args.template)
+    prepared = time.perf_counter() - start
+    records = iter_records(args.records)
+    if args.limit is not None:
+        records = islice(records, args.limit)
+    count = merge(template, records, args.out_dir, args.jobs)
+    seconds = time.perf_counter() - start
+    print(f"Merged: {count} document(s) into {args.out_dir}")
+    print(f"Template prepared in {prepared:.2f}s; {count / max(seconds - prepared, 1e-9):,.0f} documents/s "
+          f"({seconds:.2f}s total, jobs={args.jobs})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,354 @@
+"""
+Compile Markdown under docs/ straight into branded .docx files.
+Run: python docs/exports/md_to_docx.py FILE_OR_DIR [...] [-o OUT.docx] [--out-dir DIR]
+
+The source is read one line at a time and turned into blocks (headings,
+paragraphs, pipe tables, blockquotes, lists, code fences, rules) that are
+emitted through the brand_docx helpers as soon as each block ends. No
+document-wide AST is built: memory is bounded by the largest single block,
+and table rows are handed to the renderer lazily.
+
+A leading level-1 heading becomes the document title in the logo header and
+the remaining headings are shifted up one level, so "## 1. Summary" renders
+as a Heading 1 like the hand-written generators.
+"""
+
+import argparse
+import html
+import os
+import re
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+
+# python-docx and the brand helpers are imported inside the rendering
+# functions, so --help and the block reader start without loading them
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_RULE = re.compile(r"^\s{0,3}([-*_])(\s*\1){2,}\s*$")
+_FENCE = re.compile(r"^\s{0,3}(`{3,}|~{3,})")
+_LIST_ITEM = re.compile(r"^(\s*)([-*+]|\d+[.)])\s+(.*)$")
+_TABLE_SEPARATOR = re.compile(r"^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$")
+_METADATA_LINE = re.compile(r"^\*\*([^*]+?):\*\*\s*(\S.*)$")
+_TASK = re.compile(r"^\[([ xX])\]\s+")
+
+# Inline markup, in priority order: images (dropped), links, code, bold, italic
+_INLINE = re.compile(
+    r"!\[[^\]]*\]\([^)]*\)"
+    r"|\[(?P<link>[^\]]+)\]\([^)]*\)"
+    r"|`(?P<code>[^`]+)`"
+    r"|\*\*(?P<bold>.+?)\*\*|__(?P<bold2>.+?)__"
+    r"|\*(?P<italic>[^*\s](?:[^*]*[^*\s])?)\*|(?<!\w)_(?P<italic2>[^_]+)_(?!\w)"
+)
+_HTML_TAG = re.compile(r"</?[a-zA-Z][^>]*>")
+
+
+# ============================================================
+# BLOCK READER
+# ============================================================
+
+class _Lines:
+    """Line iterator with one line of push-back, shared by lazy table rows."""
+
+    def __init__(self, lines):
+        self._it = iter(lines)
+        self._pending = None
+
+    def next(self):
+        if self._pending is not None:
+            line, self._pending = self._pending, None
+            return line
+        line = next(self._it, None)
+        return None if line is None else line.rstrip("\r\n")
+
+    def push(self, line):
+        self._pending = line
+
+
+def split_row(line):
+    """Cells of a pipe-table row."""
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+    cells = re.split(r"(?<!\\)\|", line)
+    return [c.strip().replace("\\|", "|") for c in cells]
+
+
+def _table_rows(lines, width):
+    while True:
+        line = lines.next()
+        if line is None or "|" not in line or not line.strip():
+            if line is not None:
+                lines.push(line)
+            return
+        cells = split_row(line)
+        yield (cells + [""] * width)[:width]
+
+
+def iter_blocks(lines):
+    """Yield (kind, ...) blocks from an iterable of Markdown lines.
+
+    Kinds: ("heading", level, text), ("paragraph", text),
+    ("metadata", [(key, value), ...]), ("blockquote", text),
+    ("list", [(depth, marker, text), ...]), ("code", [line, ...]),
+    ("table", headers, rows), ("rule",). Table rows are a lazy iterator
+    over the same input; anything left unread is skipped before the next
+    block is produced.
+    """
+    lines = _Lines(lines)
+    while True:
+        line = lines.next()
+        if line is None:
+            return
+        if not line.strip():
+            continue
+
+        if line.lstrip().startswith("<!--"):
+            while line is not None and "-->" not in line:
+                line = lines.next()
+            continue
+
+        fence = _FENCE.match(line)
+        if fence:
+            code = []
+            while True:
+                line = lines.next()
+                if line is None or line.strip().startswith(fence.group(1)):
+                    break
+                code.append(line)
+            yield ("code", code)
+            continue
+
+        heading = _HEADING.match(line)
+        if heading:
+            yield ("heading", len(heading.group(1)), heading.group(2))
+            continue
+
+        if _RULE.match(line):
+            yield ("rule",)
+            continue
+
+        if line.lstrip().startswith(">"):
+            quote = []
+            while line is not None and line.lstrip().startswith(">"):
+                quote.append(line.lstrip()[1:].strip())
+                line = lines.next()
+            if line is not None:
+                lines.push(line)
+            yield ("blockquote", " ".join(q for q in quote if q))
+            continue
+
+        if "|" in line:
+            separator = lines.next()
+            if separator is not None and _TABLE_SEPARATOR.match(separator) and "-" in separator:
+                headers = split_row(line)
+                rows = _table_rows(lines, len(headers))
+                yield ("table", headers, rows)
+                for _ in rows:  # drain rows the consumer did not read
+                    pass
+                continue
+            if separator is not None:
+                lines.push(separator)
+
+        if _LIST_ITEM.match(line):
+            items = []
+            while line is not None:
+                item = _LIST_ITEM.match(line)
+                if item:
+                    depth = len(item.group(1).expandtabs(4)) // 2
+                    items.append([depth, item.group(2), item.group(3).strip()])
+                elif line.strip() and line[:1].isspace() and items:
+                    items[-1][2] += " " + line.strip()  # continuation line
+                elif not line.strip():
+                    nxt = lines.next()
+                    if nxt is None or not (_LIST_ITEM.match(nxt) or nxt[:1].isspace()):
+                        line = nxt
+                        break
+                    line = nxt
+                    continue
+                else:
+                    break
+                line = lines.next()
+            if line is not None:
+                lines.push(line)
+            yield ("list", [tuple(i) for i in items])
+            continue
+
+        # Paragraph: consecutive lines up to a blank line or another block
+        para = [line.strip()]
+        while True:
+            line = lines.next()
+            if (line is None or not line.strip() or _HEADING.match(line) or _FENCE.match(line)
+                    or line.lstrip().startswith(">") or _LIST_ITEM.match(line) or _RULE.match(line)):
+                break
+            para.append(line.strip())
+        if line is not None:
+            lines.push(line)
+        if all(_METADATA_LINE.match(p) for p in para):
+            yield ("metadata", [_METADATA_LINE.match(p).groups() for p in para])
+        else:
+            yield ("paragraph", " ".join(para))
+
+
+# ============================================================
+# INLINE RENDERING
+# ============================================================
+
+def _clean(text):
+    return html.unescape(_HTML_TAG.sub("", text))
+
+
+def strip_inline(text):
+    """Plain text of a Markdown inline span (for table cells and titles)."""
+    def plain(m):
+        for group in ("link", "code", "bold", "bold2", "italic", "italic2"):
+            if m.group(group) is not None:
+                return m.group(group)
+        return ""  # image
+    return _clean(_INLINE.sub(plain, text)).strip()
+
+
+def add_inline(p, text):
+    """Append runs for Markdown inline markup to paragraph p."""
+    from brand_docx import add_styled_run
+
+    pos = 0
+    for m in _INLINE.finditer(text):
+        if m.start() > pos:
+            add_styled_run(p, _clean(text[pos:m.start()]))
+        if m.group("code") is not None:
+            add_styled_run(p, m.group("code"), "BrandCode")
+        elif m.group("bold") is not None or m.group("bold2") is not None:
+            add_styled_run(p, strip_inline(m.group("bold") or m.group("bold2")), "BrandLabel")
+        elif m.group("italic") is not None or m.group("italic2") is not None:
+            add_styled_run(p, strip_inline(m.group("italic") or m.group("italic2"))).font.italic = True
+        elif m.group("link") is not None:
+            add_styled_run(p, strip_inline(m.group("link")))
+        pos = m.end()
+    if pos < len(text):
+        add_styled_run(p, _clean(text[pos:]))
+    return p
+
+
+# ============================================================
+# COMPILER
+# ============================================================
+
+def render_block(doc, block, heading_shift=0):
+    """Emit one block from iter_blocks into doc."""
+    from brand_docx import (
+        add_blockquote,
+        add_metadata,
+        add_table_from_rows,
+        add_horizontal_rule,
+        add_styled_paragraph,
+        add_styled_run,
+    )
+    from docx.shared import Cm
+
+    kind = block[0]
+    if kind == "heading":
+        level = max(1, min(block[1] - heading_shift, 9))
+        doc.add_heading(strip_inline(block[2]), level=level)
+    elif kind == "paragraph":
+        text = _INLINE.sub(lambda m: m.group(0) if m.group(0)[0] != "!" else "", block[1])
+        text = html.unescape(text).strip()
+        if strip_inline(text):  # skip image-only lines
+            add_inline(add_styled_paragraph(doc, "BrandBody"), text)
+    elif kind == "metadata":
+        add_metadata(doc, [(strip_inline(k), strip_inline(v)) for k, v in block[1]])
+    elif kind == "blockquote":
+        add_blockquote(doc, strip_inline(block[1]))
+    elif kind == "list":
+        counters = {}
+        for depth, marker, text in block[1]:
+            p = add_styled_paragraph(doc, "BrandList")
+            if depth:
+                p.paragraph_format.left_indent = Cm(1 + 0.75 * depth)
+            task = _TASK.match(text)
+            if task:
+                add_styled_run(p, "☑ " if task.group(1) != " " else "☐ ", "BrandBullet")
+                text = text[task.end():]
+            elif marker[0].isdigit():
+                counters[depth] = counters.get(depth, 0) + 1
+                add_styled_run(p, f"{counters[depth]}. ", "BrandAccent")
+            else:
+                add_styled_run(p, "• ", "BrandBullet")
+            add_inline(p, text)
+    elif kind == "code":
+        for line in block[1] or [""]:
+            add_styled_run(add_styled_paragraph(doc, "BrandCodeBlock"), line.expandtabs(4))
+    elif kind == "table":
+        headers = [strip_inline(h) for h in block[1]]
+        add_table_from_rows(doc, headers, ([strip_inline(c) for c in row] for row in block[2]))
+    elif kind == "rule":
+        add_horizontal_rule(doc)
+
+
+def render_markdown(doc, lines, heading_shift=0):
+    """Stream Markdown lines into an existing branded document."""
+    for block in iter_blocks(lines):
+        render_block(doc, block, heading_shift)
+
+
+def compile_markdown(md_path, output_path=None, doc_title=None):
+    """Compile one Markdown file to a branded .docx; returns the output path."""
+    from brand_docx import new_branded_doc
+
+    output_path = output_path or os.path.splitext(md_path)[0] + ".docx"
+    with open(md_path, encoding="utf-8") as f:
+        blocks = iter_blocks(f)
+        first = next(blocks, None)
+        heading_shift = 0
+        if first is not None and first[0] == "heading" and first[1] == 1:
+            doc_title = doc_title or strip_inline(first[2])
+            heading_shift = 1
+            first = None
+        doc = new_branded_doc(doc_title=doc_title)
+        if first is not None:
+            render_block(doc, first, heading_shift)
+        for block in blocks:
+            render_block(doc, block, heading_shift)
+    doc.save(output_path)
+    return output_path
+
+
+def find_markdown(paths):
+    """Expand files and directories into (path, path relative to its root) pairs."""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(".md"):
+                        full = os.path.join(root, name)
+                        yield full, os.path.relpath(full, path)
+        else:
+            yield path, os.path.basename(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="+", help="Markdown files or directories")
+    parser.add_argument("-o", "--output", help="output .docx (single input only)")
+    parser.add_argument("--out-dir", help="write outputs here instead of next to each source")
+    parser.add_argument("--title", help="document title (default: leading # heading)")
+    args = parser.parse_args(argv)
+
+    sources = list(find_markdown(args.paths))
+    if args.output and len(sources) != 1:
+        parser.error("--output needs exactly one Markdown input")
+    for md_path, rel_path in sources:
+        output = args.output
+        if output is None and args.out_dir:
+            output = os.path.join(args.out_dir, os.path.splitext(rel_path)[0] + ".docx")
+            os.makedirs(os.path.dirname(output), exist_ok=True)
+        print(f"Compiled: {compile_markdown(md_path, output, args.title)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
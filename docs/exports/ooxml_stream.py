@@ -0,0 +1,198 @@
+"""
+Streaming OOXML backend for the brand_docx helper API.
+
+python-docx keeps the whole document body as one lxml tree until save(),
+so memory and serialization cost grow with document length.
+StreamingDocument stands in for a python-docx Document: each paragraph or
+table the helpers add is a detached element wrapped in the normal
+python-docx proxies (so runs, fonts, styles and style_table work as
+before), and it is serialized straight into word/document.xml inside the
+.docx zip as soon as the next block starts. Only one block is alive at a
+time, so memory stays flat regardless of length.
+
+Everything outside the body (styles, numbering, settings, header/footer,
+logo image) comes from the cached branded base and is written at save().
+Pictures (run.add_picture, add_picture) add their image part and
+relationship to the base package, so they are written at save() too;
+only the inline drawing is streamed with its paragraph.
+
+Select it with new_branded_doc(..., backend="stream") or by setting
+brand_docx.DOCX_BACKEND = "stream".
+"""
+
+import os
+import re
+import shutil
+import tempfile
+import zipfile
+
+from docx.enum.text import WD_BREAK
+from docx.opc.packuri import PACKAGE_URI
+from docx.opc.pkgwriter import _ContentTypesItem
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.table import CT_Tbl
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+from lxml import etree
+
+_XMLNS = re.compile(r'\sxmlns:(\w+)="([^"]*)"')
+
+
+class StreamingDocument:
+    """Write-once document whose body is streamed into the .docx zip."""
+
+    def __init__(self, base_doc):
+        # base_doc: a python-docx Document opened from the branded base; it
+        # supplies styles/sections/settings and the package's other parts
+        self._base = base_doc
+        self._body = base_doc._body
+        self._nsmap = base_doc.element.nsmap
+        fd, self._tmp_path = tempfile.mkstemp(suffix=".docx")
+        os.close(fd)
+        self._zip = zipfile.ZipFile(self._tmp_path, "w", zipfile.ZIP_DEFLATED)
+        self._stream = self._zip.open(base_doc.part.partname.membername, "w", force_zip64=True)
+        self._pending = None
+        self._closed = False
+
+        # Split the document part around an empty <w:body/>; the head is
+        # written now, the existing body blocks follow, the tail at save()
+        body = base_doc.element.body
+        self._sectPr = body.sectPr
+        blocks = [child for child in body if child is not self._sectPr]
+        for child in blocks + [self._sectPr]:
+            body.remove(child)
+        xml = etree.tostring(base_doc.element, encoding="UTF-8", standalone=True)
+        head, self._tail = xml.split(b"<w:body/>")
+        body.append(self._sectPr)  # keeps doc.sections working
+        self._stream.write(head + b"<w:body>")
+        for child in blocks:
+            self._write(child)
+
+    # --- python-docx Document surface used by the helpers ---
+
+    @property
+    def part(self):
+        return self._base.part
+
+    @property
+    def styles(self):
+        return self._base.styles
+
+    @property
+    def sections(self):
+        return self._base.sections
+
+    @property
+    def settings(self):
+        return self._base.settings
+
+    def add_paragraph(self, text="", style=None):
+        self._flush()
+        paragraph = Paragraph(OxmlElement("w:p"), self._body)
+        if text:
+            paragraph.add_run(text)
+        if style is not None:
+            paragraph.style = style
+        self._pending = paragraph._p
+        return paragraph
+
+    def add_heading(self, text="", level=1):
+        if not 0 <= level <= 9:
+            raise ValueError("level must be in range 0-9, got %d" % level)
+        return self.add_paragraph(text, "Title" if level == 0 else "Heading %d" % level)
+
+    def add_table(self, rows, cols, style=None):
+        self._flush()
+        table = Table(CT_Tbl.new_tbl(rows, cols, self._base._block_width), self._body)
+        table.style = style
+        self._pending = table._tbl
+        return table
+
+    def add_picture(self, image_path_or_stream, width=None, height=None):
+        run = self.add_paragraph().add_run()
+        return run.add_picture(image_path_or_stream, width, height)
+
+    def add_page_break(self):
+        paragraph = self.add_paragraph()
+        paragraph.add_run().add_break(WD_BREAK.PAGE)
+        return paragraph
+
+    def write_fragment(self, xml):
+        """Stream a serialized body fragment (see fragment_cache) as-is."""
+        self._flush()
+        for child in parse_xml(xml):
+            self._write(child)
+
+    def write_markup(self, markup):
+        """Stream pre-serialized body markup as-is.
+
+        markup uses the document root's prefixes (w:, r:, ...) without
+        declaring them; it may be part of an element, so a large table can
+        be written as its opening, each row, then its closing tag.
+        """
+        self._flush()
+        self._stream.write(markup.encode("utf-8"))
+
+    def write_element(self, element):
+        """Stream a ready-made body element (w:p / w:tbl)."""
+        self._flush()
+        self._write(element)
+
+    def save(self, path):
+        """Finish document.xml, write the remaining parts and move into place."""
+        if self._closed:
+            raise ValueError("StreamingDocument can only be saved once")
+        self._flush()
+        self._write(self._sectPr)
+        self._stream.write(b"</w:body>" + self._tail)
+        self._stream.close()
+        self._write_other_parts()
+        self._zip.close()
+        self._closed = True
+        shutil.move(self._tmp_path, path)
+        # mkstemp creates 0600; give the artifact normal umask permissions
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(path, 0o666 & ~umask)
+
+    def close(self):
+        """Discard an unsaved document."""
+        if not self._closed:
+            self._stream.close()
+            self._zip.close()
+            self._closed = True
+            os.remove(self._tmp_path)
+
+    # --- internals ---
+
+    def _flush(self):
+        if self._pending is not None:
+            self._write(self._pending)
+            self._pending = None
+
+    def _write(self, element):
+        xml = etree.tostring(element, encoding="unicode")
+        # Drop namespace declarations the document root already makes
+        end = xml.index(">")
+        start_tag = _XMLNS.sub(
+            lambda m: "" if self._nsmap.get(m.group(1)) == m.group(2) else m.group(0),
+            xml[:end],
+        )
+        self._stream.write((start_tag + xml[end:]).encode("utf-8"))
+
+    def _write_other_parts(self):
+        package = self._base.part.package
+        parts = list(package.iter_parts())
+        self._zip.writestr("[Content_Types].xml", _ContentTypesItem.from_parts(parts).blob)
+        self._zip.writestr(PACKAGE_URI.rels_uri.membername, package.rels.xml)
+        for part in parts:
+            if part is not self._base.part:
+                self._zip.writestr(part.partname.membername, part.blob)
+            if len(part.rels):
+                self._zip.writestr(part.partname.rels_uri.membername, part.rels.xml)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
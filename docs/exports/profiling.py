@@ -0,0 +1,187 @@
+"""
+Timing and allocation spans for the export generators.
+
+Spans are only recorded while a recorder is active (see export_all.py
+--spans); otherwise section() and instrument() are no-ops, so generators
+can be annotated freely.
+
+Two kinds of span are recorded under the root span for an export:
+  - every level-1 heading added to a document from new_branded_doc opens a
+    span that runs until the next level-1 heading or doc.save() (which gets
+    its own "save" span), so the numbered sections of the roadmap and
+    status report are timed without touching their code;
+  - `with profiling.section("name"):` wraps any other region explicitly.
+
+Allocation figures come from tracemalloc (Python-level allocations only;
+lxml's C allocations are not seen) and are the net bytes still allocated
+when the span closes; tracing slows a run down several times, so spans
+are for finding where time goes, not for absolute timings. Results are
+written as JSON and as collapsed stacks ("root;child;leaf <self
+microseconds>") for flamegraph.pl / speedscope.
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+_recorder = None
+
+
+class Span:
+    __slots__ = ("name", "children", "start", "seconds", "mem_start", "net_bytes")
+
+    def __init__(self, name, mem_start):
+        self.name = name
+        self.children = []
+        self.start = time.perf_counter()
+        self.seconds = None
+        self.mem_start = mem_start
+        self.net_bytes = None
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "seconds": round(self.seconds, 6),
+            "self_seconds": round(self.self_seconds(), 6),
+            "net_bytes": self.net_bytes,
+            "children": [c.as_dict() for c in self.children],
+        }
+
+    def self_seconds(self):
+        return max(self.seconds - sum(c.seconds for c in self.children), 0.0)
+
+
+class Recorder:
+    """Stack of open spans under one root span."""
+
+    def __init__(self, name, trace_alloc=True):
+        self.trace_alloc = trace_alloc
+        self._started_tracing = False
+        if trace_alloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self.root = Span(name, self._memory())
+        self._stack = [self.root]
+        self._heading = None
+
+    def _memory(self):
+        return tracemalloc.get_traced_memory()[0] if self.trace_alloc else None
+
+    def open(self, name):
+        span = Span(name, self._memory())
+        self._stack[-1].children.append(span)
+        self._stack.append(span)
+        return span
+
+    def close(self, span):
+        """Close span and anything still open inside it."""
+        if span not in self._stack:
+            return
+        memory = self._memory()
+        while True:
+            top = self._stack.pop()
+            top.seconds = time.perf_counter() - top.start
+            if memory is not None:
+                top.net_bytes = memory - top.mem_start
+            if top is span:
+                return
+
+    def heading(self, name):
+        """Start a level-1 section span, ending the previous one."""
+        if self._heading is not None:
+            self.close(self._heading)
+        self._heading = self.open(name)
+
+    def end_sections(self):
+        if self._heading is not None:
+            self.close(self._heading)
+            self._heading = None
+
+    def finish(self):
+        self.close(self.root)
+        if self._started_tracing:
+            tracemalloc.stop()
+        return self.root
+
+
+@contextmanager
+def record(name, trace_alloc=True):
+    """Activate a recorder for the duration of the block; yields it."""
+    global _recorder
+    previous, _recorder = _recorder, Recorder(name, trace_alloc)
+    try:
+        yield _recorder
+    finally:
+        _recorder.finish()
+        _recorder = previous
+
+
+@contextmanager
+def section(name):
+    """Record the enclosed block as a span (no-op when not recording)."""
+    recorder = _recorder
+    if recorder is None:
+        yield
+        return
+    span = recorder.open(name)
+    try:
+        yield
+    finally:
+        recorder.close(span)
+
+
+def heading(name):
+    """Start a top-level section span by hand, ending the previous one."""
+    if _recorder is not None:
+        _recorder.heading(name)
+
+
+def instrument(doc):
+    """Turn doc's level-1 headings and save() into spans while recording."""
+    recorder = _recorder
+    if recorder is None:
+        return doc
+    add_heading, save = doc.add_heading, doc.save
+
+    def traced_add_heading(text="", level=1):
+        if level == 1 and _recorder is recorder:
+            recorder.heading(text)
+        return add_heading(text, level)
+
+    def traced_save(path):
+        if _recorder is not recorder:
+            return save(path)
+        recorder.end_sections()
+        with section("save"):
+            return save(path)
+
+    doc.add_heading = traced_add_heading
+    doc.save = traced_save
+    return doc
+
+
+# ============================================================
+# OUTPUT
+# ============================================================
+
+def collapsed_stacks(root):
+    """Lines of "a;b;c <self microseconds>" for every span."""
+    lines = []
+
+    def walk(span, prefix):
+        name = span.name.replace(";", ",").replace("\n", " ")
+        path = f"{prefix};{name}" if prefix else name
+        lines.append(f"{path} {round(span.self_seconds() * 1e6)}")
+        for child in span.children:
+            walk(child, path)
+
+    walk(root, "")
+    return lines
+
+
+def write(root, json_path, folded_path):
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(root.as_dict(), f, indent=2, ensure_ascii=False)
+    with open(folded_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(collapsed_stacks(root)) + "\n")
@@ -0,0 +1,46 @@
+"""
+Local source dependencies of the export modules.
+
+The generators and helpers in docs/exports import each other as top-level
+sibling modules. local_sources() follows those imports so a build key
+(export_all) or a fragment key (fragment_cache) covers every module that
+can change the output. Kept free of heavy imports so the CLIs start fast.
+"""
+
+import os
+import re
+from functools import lru_cache
+
+# "import a, b as c" / "from a.b import c" at any indentation (deferred
+# imports inside functions count too); absolute imports only
+_IMPORT = re.compile(r"^[ \t]*(?:from[ \t]+(\w+)[\w.]*[ \t]+import\b|import[ \t]+([\w., \t]+))", re.M)
+
+
+@lru_cache(maxsize=None)
+def sibling_imports(path):
+    """Sibling modules of path named in its import statements.
+
+    A line scan rather than a parse: a matching line inside a string can
+    only add a dependency, which makes the build key more conservative.
+    """
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    found = []
+    for from_name, import_names in _IMPORT.findall(source):
+        names = [from_name] if from_name else [n.split()[0] for n in import_names.split(",") if n.strip()]
+        for name in names:
+            candidate = os.path.join(os.path.dirname(path), f"{name.split('.')[0]}.py")
+            if candidate not in found and os.path.exists(candidate):
+                found.append(candidate)
+    return tuple(found)
+
+
+def local_sources(path, seen=None):
+    """The file at path plus every sibling module it (transitively) imports."""
+    seen = seen if seen is not None else []
+    if path in seen:
+        return seen
+    seen.append(path)
+    for candidate in sibling_imports(path):
+        local_sources(candidate, seen)
+    return seen
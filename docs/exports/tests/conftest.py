@@ -0,0 +1,29 @@
+"""
+Tests for the docs/exports generators.
+Run: python -m pytest docs/exports/tests
+
+The generator modules live in docs/exports and import each other as
+top-level modules, so that directory goes on sys.path. Every test gets
+scratch cache directories so it never reads or writes the developer's
+.export-cache.
+"""
+
+import os
+import sys
+
+import pytest
+
+EXPORTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, EXPORTS_DIR)
+
+
+@pytest.fixture(autouse=True)
+def scratch_caches(tmp_path, monkeypatch):
+    import charts
+    import doc_content
+    import fragment_cache
+
+    monkeypatch.setattr(charts, "CHART_CACHE_DIR", str(tmp_path / "charts"))
+    monkeypatch.setattr(doc_content, "CONTENT_CACHE_DIR", str(tmp_path / "content"))
+    monkeypatch.setattr(fragment_cache, "FRAGMENT_DIR", str(tmp_path / "fragments"))
+    return tmp_path
@@ -0,0 +1,27 @@
+import zipfile
+
+import docx
+import pytest
+
+import brand_docx
+import doc_content
+
+CHART_BLOCK = {"type": "chart", "kind": "column", "title": "Bookings",
+               "categories": ["North", "South"], "series": [["Bookings", [3, 5]]]}
+
+
+@pytest.mark.parametrize("backend", ["docx", "stream"])
+def test_chart_block_renders_on_both_backends(tmp_path, backend):
+    doc = brand_docx.new_branded_doc(doc_title="Charts", backend=backend)
+    doc_content.render_blocks(doc, [CHART_BLOCK])
+    path = tmp_path / f"chart-{backend}.docx"
+    doc.save(str(path))
+
+    # the branded cover logo plus the chart
+    with zipfile.ZipFile(path) as z:
+        assert len([n for n in z.namelist() if n.startswith("word/media/")]) == 2
+    saved = docx.Document(str(path))
+    assert len(saved.inline_shapes) == 2
+    picture = saved.inline_shapes[-1]._inline
+    paragraph = next(p for p in saved.paragraphs if picture in p._p.iter())
+    assert paragraph.alignment == docx.enum.text.WD_ALIGN_PARAGRAPH.CENTER
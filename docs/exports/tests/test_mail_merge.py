@@ -0,0 +1,40 @@
+import json
+import os
+import zipfile
+
+import docx
+import pytest
+
+import mail_merge
+
+SAMPLE_OWNERS = os.path.join(mail_merge.SCRIPT_DIR, "content", "merge", "sample-owners.jsonl")
+
+
+@pytest.fixture
+def template():
+    return mail_merge.prepare_template("owner-payout-statement")
+
+
+def sample_record(**fields):
+    with open(SAMPLE_OWNERS, encoding="utf-8") as f:
+        record = json.loads(f.readline())
+    record.update(fields)
+    return record
+
+
+def test_merge_escapes_xml_in_field_values(template, tmp_path):
+    record = sample_record(owner_name="Smith & <Sons>")
+    assert mail_merge.merge(template, [record], str(tmp_path), jobs=1) == 1
+
+    path = tmp_path / mail_merge.output_name(template, record)
+    with zipfile.ZipFile(path) as z:
+        xml = z.read("word/document.xml").decode("utf-8")
+    assert "Smith &amp; &lt;Sons&gt;" in xml
+    assert "Smith & <Sons>" in "\n".join(p.text for p in docx.Document(str(path)).paragraphs)
+
+
+def test_merge_rejects_an_empty_output_name(template, tmp_path):
+    template = template._replace(output=["", "owner_id", ""])
+    records = [sample_record(), sample_record(owner_id="..")]
+    with pytest.raises(ValueError, match="record 2: output name is empty"):
+        mail_merge.merge(template, records, str(tmp_path), jobs=1)
@@ -0,0 +1,42 @@
+import pytest
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+
+import brand_docx
+
+HEADERS = ["Capability", "Status"]
+ROWS = [[f"Row {i}", "BUILT"] for i in range(5)]
+
+
+def shaded_rows(table):
+    return [i for i, tr in enumerate(table._tbl.tr_lst) if tr.find(".//" + qn("w:shd")) is not None]
+
+
+@pytest.mark.parametrize("mode", ["cell", "style"])
+def test_headerless_table_shades_rows_two_four(mode):
+    doc = brand_docx.new_branded_doc(doc_title="Tables")
+    table = doc.add_table(rows=5, cols=2)
+    brand_docx.style_table(table, has_header=False, mode=mode)
+
+    assert shaded_rows(table) == [2, 4]
+    if mode == "style":
+        look = table._tbl.tblPr.find(qn("w:tblLook"))
+        assert look.get(qn("w:firstRow")) == "0"
+        assert look.get(qn("w:noHBand")) == "1"
+
+
+def test_row_templates_split_rows_with_properties(monkeypatch):
+    # A header row repeated on every page carries <w:trPr>, which must not
+    # be taken for the start of another row
+    style_table = brand_docx.style_table
+
+    def style_with_repeated_header(table, has_header=True, mode=None):
+        style_table(table, has_header, mode)
+        table._tbl.tr_lst[0].insert(0, parse_xml(f'<w:trPr {nsdecls("w")}><w:tblHeader/></w:trPr>'))
+
+    monkeypatch.setattr(brand_docx, "style_table", style_with_repeated_header)
+    doc = brand_docx.new_branded_doc(doc_title="Tables")
+    head, templates = brand_docx._table_templates(doc, HEADERS, has_header=True)
+
+    assert head.count("<w:tr>") == 1 and "<w:trPr>" in head
+    assert all(len(template) == len(HEADERS) + 1 for template in templates)
@@ -0,0 +1,181 @@
+"""
+Text fitting for branded slides: the largest font size at which a text
+fits its box, measured with precomputed glyph-advance tables.
+Run: python docs/exports/text_fit.py --build-table FONT.ttf [--family NAME] [--bold]
+
+A glyph table (content/fonts/<family>[-bold].json) holds each glyph's
+advance width in thousandths of an em plus the font's line height, so
+measuring needs neither the font file nor a rasterizer. Tables are built
+once from a font file with --build-table (Pillow reads the advances);
+the Roboto tables ship with the repo. A deck asks for Roboto, but where
+Roboto is not installed PowerPoint shows Calibri instead, so a text is
+measured with every table of FONT_FALLBACKS[font] that exists as well
+and fitted to the widest. Calibri's table is not in the repo; build it
+from a local copy of the font to include it.
+
+Advances are per em, so one measuring pass gives a text's word widths
+for every candidate size at once; the sizes only change how far a line
+reaches (box width / size). fit_font_size() bisects the candidates on
+those widths and is memoized by (text, font, box). Kerning is ignored,
+which overestimates slightly, the safe side for fitting.
+"""
+
+import argparse
+import json
+import os
+import sys
+from bisect import bisect_right
+from collections import namedtuple
+from functools import lru_cache
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+FONT_TABLE_DIR = os.path.join(SCRIPT_DIR, "content", "fonts")
+
+# Font a deck names -> fonts a viewer may render it with instead
+FONT_FALLBACKS = {"Roboto": ("Calibri",)}
+# Characters a table records; others measure as DEFAULT_ADVANCE
+TABLE_CHARS = "".join(map(chr, range(0x20, 0x7F))) + "".join(map(chr, range(0xA0, 0x100))) + "–—‘’‚“”„•…‰€™←→↑↓✓"
+DEFAULT_ADVANCE = 1000  # a full em: wide enough for emoji and symbols
+EMU_PER_POINT = 12700
+# python-pptx text box insets (0.1" left/right, 0.05" top/bottom)
+INSET_X = 2 * 91440
+INSET_Y = 2 * 45720
+MIN_FONT_SIZE = 8
+
+# advances: {char: advance in 1/1000 em}; line_height in ems
+FontTable = namedtuple("FontTable", "family bold line_height advances")
+
+
+# ============================================================
+# GLYPH TABLES
+# ============================================================
+
+def table_path(family, bold=False):
+    return os.path.join(FONT_TABLE_DIR, f"{family.lower()}{'-bold' if bold else ''}.json")
+
+
+def build_font_table(font_path, family, bold=False):
+    """Glyph table dict for a TrueType/OpenType font file."""
+    from PIL import ImageFont
+
+    font = ImageFont.truetype(font_path, 1000)  # 1000 px per em: advances come out in 1/1000 em
+    ascent, descent = font.getmetrics()
+    missing = (font.getlength("\uffff"), font.getbbox("\uffff"))  # how the font draws a glyph it lacks
+    return {
+        "family": family,
+        "bold": bold,
+        "line_height": round((ascent + descent) / 1000, 4),
+        "advances": {ch: round(font.getlength(ch)) for ch in TABLE_CHARS
+                     if (font.getlength(ch), font.getbbox(ch)) != missing},
+    }
+
+
+@lru_cache(maxsize=None)
+def font_table(family, bold=False):
+    """The glyph table for a font, or None when there is none."""
+    try:
+        with open(table_path(family, bold), encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    return FontTable(data["family"], data["bold"], data["line_height"], data["advances"])
+
+
+@lru_cache(maxsize=None)
+def measuring_tables(font, bold=False):
+    """Tables a text in font is measured with: its own and its fallbacks'."""
+    tables = tuple(t for t in (font_table(name, bold) for name in (font, *FONT_FALLBACKS.get(font, ())))
+                   if t is not None)
+    if not tables:
+        raise ValueError(f"no glyph table for {font!r}{' bold' if bold else ''} in {FONT_TABLE_DIR} "
+                         f"(build one with text_fit.py --build-table)")
+    return tables
+
+
+# ============================================================
+# MEASURING AND FITTING
+# ============================================================
+
+def _advance(table, text):
+    advances = table.advances
+    return sum(advances.get(ch, DEFAULT_ADVANCE) for ch in text)
+
+
+def measure(text, font="Roboto", bold=False):
+    """(paragraphs, space, line height): each paragraph's word widths, all in ems.
+
+    Widths are the widest over the measuring tables, so they hold for
+    every font a viewer may render the text with.
+    """
+    tables = measuring_tables(font, bold)
+    paragraphs = [
+        [max(_advance(t, word) for t in tables) / 1000 for word in line.split()]
+        for line in text.split("\n")
+    ]
+    space = max(t.advances.get(" ", DEFAULT_ADVANCE) for t in tables) / 1000
+    return paragraphs, space, max(t.line_height for t in tables)
+
+
+def line_count(paragraphs, space, width):
+    """Lines the words take when wrapped at width (ems), or None if a word is wider."""
+    lines = 0
+    for words in paragraphs:
+        lines += 1
+        used = None
+        for w in words:
+            if w > width:
+                return None
+            if used is None:
+                used = w
+            elif used + space + w <= width:
+                used += space + w
+            else:
+                lines += 1
+                used = w
+    return lines
+
+
+def fits(measured, size, width, height):
+    """Whether measured text (see measure) fits width x height points at size."""
+    paragraphs, space, line_height = measured
+    lines = line_count(paragraphs, space, width / size)
+    return lines is not None and lines * line_height * size <= height
+
+
+@lru_cache(maxsize=4096)
+def fit_font_size(text, width, height, font="Roboto", bold=False, max_size=18, min_size=MIN_FONT_SIZE):
+    """Largest whole point size from min_size to max_size at which text fits a text box.
+
+    width and height are the box's size in EMU (as python-pptx lengths);
+    the default text box insets are taken off. Text that does not fit
+    even at min_size gets min_size.
+    """
+    inner_width = (width - INSET_X) / EMU_PER_POINT
+    inner_height = (height - INSET_Y) / EMU_PER_POINT
+    measured = measure(text, font, bold)
+    sizes = range(min_size, max_size + 1)
+    # fits() only turns false as the size grows: bisect for the last size that fits
+    first_too_big = bisect_right(sizes, False, key=lambda s: not fits(measured, s, inner_width, inner_height))
+    return sizes[max(first_too_big - 1, 0)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a glyph-advance table for text fitting.")
+    parser.add_argument("--build-table", metavar="FONT", required=True, help="TrueType/OpenType font file")
+    parser.add_argument("--family", help="font family name (default: from the file name, e.g. Roboto)")
+    parser.add_argument("--bold", action="store_true", help="the file is the bold face")
+    args = parser.parse_args(argv)
+
+    family = args.family or os.path.basename(args.build_table).split("-")[0].split(".")[0]
+    table = build_font_table(args.build_table, family, args.bold)
+    path = table_path(family, args.bold)
+    os.makedirs(FONT_TABLE_DIR, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(table, f, ensure_ascii=False, indent=1)
+        f.write("\n")
+    print(f"Saved: {path} ({len(table['advances'])} glyphs, line height {table['line_height']} em)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
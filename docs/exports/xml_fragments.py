@@ -0,0 +1,180 @@
+"""
+Prototype-cloned OOXML fragments for the branded export helpers.
+
+Table and run formatting used to call parse_xml on a fresh f-string for
+every cell. Here each fragment is parsed once per (kind, key) and kept in
+a bounded LRU cache; callers receive a deep copy of the prototype, which
+is much cheaper than running the XML parser again.
+"""
+
+import re
+from copy import deepcopy
+from functools import lru_cache
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+
+# Upper bound on distinct prototypes kept alive (colors x sizes x kinds)
+FRAGMENT_CACHE_SIZE = 256
+
+# Footer template names that become Word fields (filled in by Word);
+# any other {name} is a value supplied when the footer is cloned
+FOOTER_FIELDS = ("PAGE", "NUMPAGES", "SECTIONPAGES", "DATE")
+_FOOTER_SLOT = re.compile(r"\{(\w+)\}")
+
+
+def _cell_borders_xml(color, size):
+    return (
+        f'<w:tcBorders {nsdecls("w")}>'
+        f'<w:top w:val="single" w:sz="{size}" w:space="0" w:color="{color}"/>'
+        f'<w:left w:val="single" w:sz="{size}" w:space="0" w:color="{color}"/>'
+        f'<w:bottom w:val="single" w:sz="{size}" w:space="0" w:color="{color}"/>'
+        f'<w:right w:val="single" w:sz="{size}" w:space="0" w:color="{color}"/>'
+        f'</w:tcBorders>'
+    )
+
+
+def _cell_shading_xml(fill):
+    return f'<w:shd {nsdecls("w")} w:fill="{fill}" w:val="clear"/>'
+
+
+def _paragraph_spacing_xml(before_twips, after_twips):
+    return (
+        f'<w:pPr {nsdecls("w")}>'
+        f'<w:spacing w:before="{before_twips}" w:after="{after_twips}"/>'
+        f'</w:pPr>'
+    )
+
+
+def _paragraph_style_xml(style_id):
+    return f'<w:pPr {nsdecls("w")}><w:pStyle w:val="{style_id}"/></w:pPr>'
+
+
+def _run_style_xml(style_id):
+    return f'<w:rPr {nsdecls("w")}><w:rStyle w:val="{style_id}"/></w:rPr>'
+
+
+def _run_properties_xml(font, half_points, color=None, bold=False, italic=False):
+    # Child order follows CT_RPr: rFonts, b, i, color, sz
+    parts = [f'<w:rPr {nsdecls("w")}>', f'<w:rFonts w:ascii="{font}" w:hAnsi="{font}"/>']
+    if bold:
+        parts.append('<w:b/>')
+    if italic:
+        parts.append('<w:i/>')
+    if color:
+        parts.append(f'<w:color w:val="{color}"/>')
+    parts.append(f'<w:sz w:val="{half_points}"/>')
+    parts.append('</w:rPr>')
+    return "".join(parts)
+
+
+def escape_text(text):
+    """Escape text for use as XML character data (cheaper than xml.sax.saxutils,
+    which imports urllib)."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _footer_paragraph_xml(template, font, half_points, color):
+    # Literal text and {value} slots become styled runs (a slot's run holds
+    # "{name}" until clone time); field names become begin/instr/end runs
+    rPr = f'<w:rPr><w:rFonts w:ascii="{font}" w:hAnsi="{font}"/><w:color w:val="{color}"/><w:sz w:val="{half_points}"/></w:rPr>'
+    parts = [
+        f'<w:p {nsdecls("w")}><w:pPr><w:pStyle w:val="Footer"/>'
+        f'<w:spacing w:before="0" w:after="0"/><w:jc w:val="center"/></w:pPr>'
+    ]
+    for i, piece in enumerate(_FOOTER_SLOT.split(template)):
+        if i % 2 and piece in FOOTER_FIELDS:
+            parts.append(
+                '<w:r><w:fldChar w:fldCharType="begin"/></w:r>'
+                f'<w:r><w:instrText xml:space="preserve"> {piece} </w:instrText></w:r>'
+                '<w:r><w:fldChar w:fldCharType="end"/></w:r>'
+            )
+        elif piece:
+            text = f"{{{piece}}}" if i % 2 else piece
+            parts.append(f'<w:r>{rPr}<w:t xml:space="preserve">{escape_text(text)}</w:t></w:r>')
+    parts.append('</w:p>')
+    return "".join(parts)
+
+
+_BUILDERS = {
+    "tcBorders": _cell_borders_xml,
+    "shd": _cell_shading_xml,
+    "pPr": _paragraph_spacing_xml,
+    "pStyle": _paragraph_style_xml,
+    "rPr": _run_properties_xml,
+    "rStyle": _run_style_xml,
+    "footer": _footer_paragraph_xml,
+}
+
+
+@lru_cache(maxsize=FRAGMENT_CACHE_SIZE)
+def _prototype(kind, key):
+    """Parse the fragment for (kind, key) once; never hand this out directly."""
+    return parse_xml(_BUILDERS[kind](*key))
+
+
+def clone(kind, *key):
+    """Return a fresh copy of the cached fragment for (kind, key)."""
+    return deepcopy(_prototype(kind, key))
+
+
+def cell_borders(color="CCCCCC", size="4"):
+    """Single-line borders on all four sides of a cell."""
+    return clone("tcBorders", color, str(size))
+
+
+def cell_shading(fill):
+    """Solid background fill for a cell."""
+    return clone("shd", fill)
+
+
+def paragraph_spacing(before_twips, after_twips):
+    """A pPr carrying only before/after spacing."""
+    return clone("pPr", before_twips, after_twips)
+
+
+def paragraph_style(style_id):
+    """A pPr carrying only a pStyle reference."""
+    return clone("pStyle", style_id)
+
+
+def run_properties(font, half_points, color=None, bold=False, italic=False):
+    """An rPr with font, size and optional color/bold/italic."""
+    return clone("rPr", font, half_points, color, bold, italic)
+
+
+def run_style(style_id):
+    """An rPr carrying only an rStyle reference."""
+    return clone("rStyle", style_id)
+
+
+def footer_slots(template):
+    """The {name}s in a footer template, in order."""
+    return _FOOTER_SLOT.findall(template)
+
+
+def footer_paragraph(template, font, half_points, color, values=None):
+    """A centered footer w:p for template, e.g. "{title} \u2022 Page {PAGE} of {NUMPAGES}".
+
+    The paragraph is parsed once per (template, font, size, color); each
+    call clones it and fills the {name} slots from values.
+    """
+    p = clone("footer", template, font, half_points, color)
+    for t in p.iter(qn("w:t")):
+        match = _FOOTER_SLOT.fullmatch(t.text or "")
+        if match:
+            name = match.group(1)
+            if not values or name not in values:
+                raise ValueError(f"footer template {template!r} needs a value for {name!r}")
+            t.text = str(values[name])
+    return p
+
+
+def cache_info():
+    """Hit/miss statistics for the prototype cache."""
+    return _prototype.cache_info()
+
+
+def cache_clear():
+    """Drop all cached prototypes."""
+    _prototype.cache_clear()